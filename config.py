@@ -1,20 +1,26 @@
 # Job search default settings
 SEARCH_SETTINGS = {
     "max_applications": 10,  # Default maximum applications
+    "page_size": 100,        # Search results requested per page
+    "url_search": True,      # Load the search with all filters as one results URL (the search form is the fallback)
+    "easy_apply_only": True, # Ask the search URL for Easy Apply jobs only
 }
 
 # Resume settings
 RESUME_SETTINGS = {
     "allowed_extensions": {"pdf", "doc", "docx"},
     "max_file_size": 10 * 1024 * 1024,  # 10MB in bytes
-    "upload_folder": "ui/uploads"    # Folder for uploaded resumes
+    "upload_folder": "ui/uploads",   # Folder for uploaded resumes
+    "skip_unchanged": True,          # Skip the replace step while the profile already holds the same resume (by content hash)
+    "state_dir": "logs/resume_state" # Which resume each account's profile holds (one file per account)
 }
 
 # UI Configuration
 UI_SETTINGS = {
     "port": 5000,
     "host": "localhost",
-    "debug": True
+    "debug": True,
+    "threads": 16                    # Server threads; every open status stream holds one
 }
 
 # Application settings
@@ -24,6 +30,97 @@ APP_SETTINGS = {
     "log_level": "INFO"             # Logging level
 }
 
+# Page readiness settings
+PACING_SETTINGS = {
+    "mode": "event",                 # "event" waits on page conditions, "legacy" restores the fixed time.sleep pacing
+    "dom_quiet_ms": 300,             # DOM counts as settled after this long without mutations
+    "network_idle_ms": 500,          # Network counts as idle after this long without finished requests
+    "max_wait": {                    # Ceiling in seconds for each kind of wait
+        "dom": 5,
+        "network": 10,
+        "url": 15,
+        "element": 15,
+        "submit": 20                 # Apply wizard leaving the Submit step after the click
+    }
+}
+
+# Processed job history settings
+HISTORY_SETTINGS = {
+    "backend": "sqlite",             # "sqlite" (WAL database), "journal" (NDJSON journal) or "json" (single JSON file)
+    "journal_compact_bytes": 4 * 1024 * 1024,  # Journal size that triggers a background compaction
+    "shared_index": False,           # Share "not Dice" / "not Easy Apply" facts across all local accounts
+    "shared_index_path": "logs/shared_job_facts.db",
+    "shared_index_max_age_days": 30  # Shared facts older than this are ignored
+}
+
+# Job-detail HTTP probe settings
+PROBE_SETTINGS = {
+    "enabled": True,                 # Read publish date and Easy Apply eligibility over HTTP before opening a tab
+    "workers": 4,                    # Concurrent probe requests
+    "timeout": 15                    # Seconds per request
+}
+
+# Harvest/apply pipeline settings
+QUEUE_SETTINGS = {
+    "refill_below": 1,               # Harvest another result page when fewer jobs than this are queued
+    "max_pending": 200,              # With apply workers, harvesting pauses while this many jobs are queued
+    "apply_workers": 0,              # Extra logged-in browsers applying in parallel (0 = one browser does everything)
+    "max_attempts": 3,               # A queued job is marked failed after this many errors
+    "job_tab": "worker"              # Where job details open: "worker" (one reused tab), "results" (the results tab, then back) or "new" (a tab per job)
+}
+
+# Login session settings
+LOGIN_SETTINGS = {
+    "reuse_session": True,           # Save cookies/local storage after login and restore them on the next run
+    "state_dir": "logs/login_state", # Where saved sessions are kept (one file per account)
+    "check_timeout": 5               # Seconds to wait for the profile link when checking a restored session
+}
+
+# Network filtering and bandwidth accounting
+NETWORK_SETTINGS = {
+    "profile": "lean",               # Blocking profile from "profiles" below
+    "page_load_strategy": "eager",   # Don't wait for images/iframes before driver.get returns
+    "track_bytes": True,             # Count bytes per page type and proxy (reported in the run result)
+    "profiles": {
+        "off": {},
+        "lean": {
+            "block_types": ["image", "font", "media"],
+            "block_hosts": [
+                "google-analytics.com", "googletagmanager.com", "doubleclick.net", "googlesyndication.com",
+                "adservice.google.com", "facebook.net", "hotjar.com", "bat.bing.com", "snap.licdn.com",
+                "cdn.segment.com", "nr-data.net", "js-agent.newrelic.com", "optimizely.com"
+            ]
+        },
+        "strict": {
+            "block_types": ["image", "font", "media"],
+            "block_hosts": [
+                "google-analytics.com", "googletagmanager.com", "doubleclick.net", "googlesyndication.com",
+                "adservice.google.com", "facebook.net", "hotjar.com", "bat.bing.com", "snap.licdn.com",
+                "cdn.segment.com", "nr-data.net", "js-agent.newrelic.com", "optimizely.com",
+                "youtube.com", "vimeo.com", "intercom.io", "zendesk.com", "qualtrics.com"
+            ],
+            "block_urls": ["*/ads/*", "*/tracking/*", "*/pixel*"]
+        }
+    }
+}
+
+# Pre-launched browser pool settings
+DRIVER_POOL_SETTINGS = {
+    "enabled": True,                 # Keep browsers launched ahead of time
+    "size": 1,                       # Ready browsers kept per proxy
+    "recycle": False,                # Reuse returned browsers after clearing cookies and storage instead of replacing them
+    "launch_workers": 2              # Browsers launched or recycled at the same time in the background
+}
+
+# Web UI session settings
+SESSION_SETTINGS = {
+    "max_concurrent": 3,             # Automation sessions that may run at the same time
+    "status_buffer": 256,            # Status updates kept per session for stream clients that reconnect
+    "status_coalesce_ms": 250,       # Message-only updates closer together than this replace each other in the buffer
+    "stream_keepalive": 15,          # Seconds between keep-alive comments on an idle status stream
+    "max_streams": 8                 # Open status streams allowed at once (kept 4 below UI_SETTINGS["threads"])
+}
+
 # Status messages
 STATUS_MESSAGES = {
     "initializing": "Starting automation...",
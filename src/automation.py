@@ -3,12 +3,25 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-import os, time, json
+from selenium.common.exceptions import WebDriverException
+import threading
 from datetime import datetime
 
 from .handlers.shadow_dom_handler import ShadowDOMHandler
 from .handlers.job_handler import JobHandler
 from .handlers.search_filter_handler import SearchAndFilter
+from .handlers.results_navigator import ResultsNavigator
+from .handlers.job_card_extractor import JobCardExtractor, JOB_CARD_LINK_SELECTOR, JOB_CARD_FIELD_SELECTORS
+from .store import open_store, open_history_view, open_shared_index, open_job_queue
+from .utils.job_index import get_job_id
+from .utils.job_triage import JobTriage, APPLY, SKIP
+from .utils.job_probe import JobProbe
+from .utils.readiness import Readiness
+from .utils.login_state import LoginState, COOKIE_FIELDS
+from .utils.network import NetworkMeter, NetworkUsage
+from .utils.job_tabs import JobTabs
+from .utils.resume_manager import ResumeManager
+from config import SEARCH_SETTINGS, PROBE_SETTINGS, QUEUE_SETTINGS, LOGIN_SETTINGS, RESUME_SETTINGS
 
 def log(msg, level="INFO", symbol=""):
     ts = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
@@ -30,14 +43,13 @@ def print_job_status(job_idx, total_jobs, page, job, status, error=None):
     if error:
         log(f"  ❌ ERROR: {error}")
 
-def print_page_summary(page, jobs_on_page, applied, already_applied, skipped, errors):
+def print_harvest_summary(page, jobs_on_page, queued, already_applied, skipped):
     log("\n----------------------------------------")
     log(f"Page {page} Summary:")
     log(f"  - Total Jobs      : {jobs_on_page}")
-    log(f"  - Applied         : {applied} ✅")
+    log(f"  - Queued          : {queued} 📥")
     log(f"  - Already Applied : {already_applied} ⏩")
     log(f"  - Skipped         : {skipped} ➖")
-    log(f"  - Errors          : {errors} ❌")
     log("========================================\n")
 
 def print_final_summary(total_jobs, total_applied, total_already_applied, total_skipped, total_errors):
@@ -50,7 +62,7 @@ def print_final_summary(total_jobs, total_applied, total_already_applied, total_
     log("***************************************\n")
 
 class DiceAutomation:
-    def __init__(self, driver, wait, username, password, keyword, location, max_applications, filters=None, status_callback=None, processed_jobs_file_path="logs/processed_job_summary_list.json"):
+    def __init__(self, driver, wait, username, password, keyword, location, max_applications, filters=None, status_callback=None, processed_jobs_file_path="logs/processed_job_summary_list.json", start_page=1, proxy=None, proxy_auth=None, harvest=True, driver_factory=None, apply_workers=None, resume_path=None, driver_release=None):
         self.driver = driver
         self.wait = wait
         self.username = username
@@ -58,9 +70,33 @@ class DiceAutomation:
         self.search_keyword = keyword
         self.search_location = location
         self.max_applications = max_applications
+        self.start_page = max(1, int(start_page))
+        self.harvest = harvest
+        self.resume_path = resume_path
+        # driver_factory() -> (driver, wait) starts the extra browsers of the apply worker pool
+        self.driver_factory = driver_factory
+        self.driver_release = driver_release
+        self.apply_workers = QUEUE_SETTINGS.get("apply_workers", 0) if apply_workers is None else apply_workers
         self.filters = filters if filters is not None else {}
         self.status_callback = status_callback
         self.processed_jobs_file_path = processed_jobs_file_path
+        self.store = open_store(processed_jobs_file_path)
+        self.history = open_history_view(processed_jobs_file_path)
+        self.shared_index = open_shared_index()
+        self.queue = open_job_queue(processed_jobs_file_path)
+        self.counter_lock = threading.RLock()
+        self.applications_in_flight = 0
+        self.stop_event = threading.Event()
+        self.jobs_queued = threading.Event()
+        self.harvest_finished = threading.Event()
+        self.readiness = Readiness(driver)
+        self.login_state = LoginState(username) if LOGIN_SETTINGS.get("reuse_session", True) else None
+        self.network_usage = NetworkUsage(proxy)
+        self.network_meters = {}
+        self.tabs = {}
+        self.job_probe = JobProbe(proxy, proxy_auth) if PROBE_SETTINGS.get("enabled", True) else None
+        # Shared by the JobHandlers of all browsers of the run
+        self.resume_manager = ResumeManager(resume_path or RESUME_SETTINGS.get('path'), account=username)
         self.automation_status = {
             "status": "initializing",
             "message": "",
@@ -71,7 +107,13 @@ class DiceAutomation:
             "job_skipped": 0,
             "current_page": 0,
             "current_job": 0,
-            "max_applications": max_applications
+            "job_errors": 0,
+            "job_status": "",
+            "max_applications": max_applications,
+            "stages": {
+                "harvest": {"state": "idle", "page": 0, "queued": 0},
+                "apply": {"state": "idle"}
+            }
         }
 
     def update_status(self, message, status="running"):
@@ -81,8 +123,75 @@ class DiceAutomation:
         if self.status_callback:
             self.status_callback(self.automation_status)
 
+    def job_status_callback(self, status):
+        """Status updates of a JobHandler: shown as the run's message, without replacing the run status or counters."""
+        self.automation_status["message"] = status.get("message", "")
+        self.automation_status["job_status"] = status.get("status", "running")
+        if self.status_callback:
+            self.status_callback(self.automation_status)
+
+    def stop(self):
+        """Stop the run after the job currently being applied to."""
+        self.stop_event.set()
+        self.jobs_queued.set()
+
+    def network_meter(self, driver):
+        """Return the byte counter of a browser of this run."""
+        return self.network_meters.setdefault(id(driver), NetworkMeter(driver))
+
+    def job_tabs(self, driver):
+        """Return the JobTabs of a browser of this run, created while it is on its home tab."""
+        tabs = self.tabs.get(id(driver))
+        if tabs is None:
+            tabs = self.tabs[id(driver)] = JobTabs(driver)
+        return tabs
+
+    def network_report(self):
+        """Book the remaining bytes of the main browser and the probe, and return the run totals."""
+        self.network_usage.add_meter(self.network_meter(self.driver))
+        self.network_meters.pop(id(self.driver), None)
+        if self.job_probe:
+            self.network_usage.add("probe", self.job_probe.bytes_received, self.job_probe.requests)
+            self.job_probe.bytes_received = self.job_probe.requests = 0
+        return self.network_usage.report()
+
+    def restore_login(self):
+        """Reuse this account's saved session, checked with a single page load."""
+        if not self.login_state or not self.login_state.exists():
+            return False
+        try:
+            self.update_status("Restoring saved login session...")
+            if not self.login_state.restore(self.driver):
+                return False
+            self.driver.get("https://www.dice.com/home-feed")
+            WebDriverWait(self.driver, LOGIN_SETTINGS.get("check_timeout", 5)).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, "a[href*='/profile']"))
+            )
+        except Exception as e:
+            log(f"Saved login session is no longer valid, logging in again: {e}", "WARNING", "⚠️ ")
+            self.login_state.clear()
+            try:
+                self.driver.delete_all_cookies()
+            except WebDriverException:
+                pass
+            return False
+        self.update_status("Login successful", "success")
+        log("Login restored from saved session.", "SUCCESS", "✅")
+        return True
+
+    def save_login(self):
+        if not self.login_state:
+            return
+        try:
+            self.login_state.save(self.driver)
+        except Exception as e:
+            log(f"Could not save the login session: {e}", "WARNING", "⚠️ ")
+
     def login(self):
         """Handle login process with improved verification."""
+        self.network_meter(self.driver).switch("login")
+        if self.restore_login():
+            return True
         try:
             self.update_status("Navigating to Dice login page...")
             self.driver.get("https://www.dice.com/dashboard/login")
@@ -121,7 +230,7 @@ class DiceAutomation:
                             log("URL did not redirect automatically, forcing redirect to home feed.", "WARNING", "⚠️ ")
                             self.driver.get("https://www.dice.com/home-feed")
                         
-                        time.sleep(5)
+                        self.readiness.dom_settled(legacy=5)
                     
                     dashboard_element = WebDriverWait(self.driver, 15).until(
                         EC.presence_of_element_located((By.CSS_SELECTOR, "a[href*='/profile']"))
@@ -129,6 +238,7 @@ class DiceAutomation:
                     if dashboard_element:
                         self.update_status("Login successful", "success")
                         log("Login confirmed successful.")
+                        self.save_login()
                         return True
                 except Exception as e:
                     log(f"Failed to find dashboard element: {e}", "ERROR", "❌")
@@ -144,6 +254,7 @@ class DiceAutomation:
                             if profile_menu:
                                 self.update_status("Login successful", "success")
                                 log("Login confirmed via profile menu.")
+                                self.save_login()
                                 return True
                         except:
                             pass
@@ -164,235 +275,437 @@ class DiceAutomation:
 
             return False
 
-    def get_job_listings(self):
-        """Get all job listings from the current page"""
+    def get_job_listings(self, job_card_extractor):
+        """Get all job listings from the current page as plain card data"""
         try:
             # Wait for at least one job listing to be present
             self.wait.until(EC.presence_of_element_located(
-                (By.CSS_SELECTOR, "a[data-testid='job-search-job-card-link']")
+                (By.CSS_SELECTOR, JOB_CARD_LINK_SELECTOR)
             ))
-            time.sleep(2)  # Additional wait for all listings to load
+            self.readiness.dom_settled(legacy=2)  # Additional wait for all listings to load
             
-            # Find all job listings
-            listings = self.driver.find_elements(By.CSS_SELECTOR, "a[data-testid='job-search-job-card-link']")
+            # Read all job cards in one round-trip
+            listings = job_card_extractor.extract_cards()
             self.update_status(f"Found {len(listings)} Dice job listings in current page.")
             return listings
         except Exception as e:
             self.update_status(f"Error finding job listings: {str(e)}", "error")
             return []
-    
-    def safe_get_text(self, parent, selector, default=""):
-        try:
-            element = parent.find_element(By.CSS_SELECTOR, selector)
-            return element.text
-        except:
-            return default
-
-    def find_job_summary_in_list(self, job_summary, job_list):
-        for index, job in enumerate(job_list):
-            if (
-                job.get("card_title") == job_summary.get("card_title") and
-                job.get("company_name") == job_summary.get("company_name") and
-                job.get("location") == job_summary.get("location") and
-                job.get("employment_type") == job_summary.get("employment_type") and
-                job.get("card_summary") == job_summary.get("card_summary")
-            ):
-                return index
-        return -1
-    
-    def get_job_aready_processed_list(self):
-        file_path = self.processed_jobs_file_path
-        os.makedirs(os.path.dirname(file_path), exist_ok=True)
-
-        if os.path.exists(file_path):
-            with open(file_path, "r") as file:
-                try:
-                    processed_job_summary_list = json.load(file)
-                except json.JSONDecodeError:
-                    processed_job_summary_list = []
-        else:
-            processed_job_summary_list = []
-        return processed_job_summary_list
-    
-    def update_processed_job(self, processed_job_summary_list, job_summary=None, update=True):
-        if job_summary is None:
-            with open(self.processed_jobs_file_path, "w") as file:
-                json.dump(processed_job_summary_list, file, indent=4)
-            return False
 
-        found_index = self.find_job_summary_in_list(job_summary, processed_job_summary_list)
+    def probe_listings(self, job_listings, job_triage, easy_apply_marker_seen):
+        """Probe the job-detail pages of the cards triage would open, concurrently."""
+        if not self.job_probe:
+            return {}
+        urls = []
+        for listing in job_listings:
+            job_summary = {field: listing[field] for field in JOB_CARD_FIELD_SELECTORS}
+            job_summary["job_id"] = listing["job_id"]
+            decision, _ = job_triage.classify(listing, job_summary, easy_apply_marker_seen)
+            if decision == APPLY:
+                urls.append(listing["job_url"])
+        if not urls:
+            return {}
+        try:
+            # Cookies change while browsing, so take them fresh for every page
+            self.job_probe.use_browser_session(self.driver)
+            probe_results = self.job_probe.probe_many(urls)
+        except Exception as e:
+            log(f"Job probe failed, falling back to the browser: {e}", "WARNING", "⚠️ ")
+            return {}
+        log(f"Probed {len(probe_results)} job pages over HTTP.")
+        return probe_results
+
+    def update_processed_job(self, job_summary):
+        # Apply workers may finish jobs at the same time; history updates are serialized
+        with self.counter_lock:
+            updated = self.history.upsert(job_summary)
+        log(f"Job summary {'updated' if updated else 'added'} successfully.")
+        return updated
+
+    def count(self, **increments):
+        """Add to the automation_status counters (e.g. jobs_processed=1)."""
+        with self.counter_lock:
+            for key, value in increments.items():
+                self.automation_status[key] = self.automation_status.get(key, 0) + value
+
+    def update_stage(self, stage, state, message=None):
+        """Update the status of the harvest or apply stage and notify the UI."""
+        stage_status = self.automation_status["stages"][stage]
+        if stage_status["state"] == state and stage != "apply" and not message:
+            return
+        stage_status["state"] = state
+        if stage == "apply":
+            stage_status.update(self.queue.counts())
+        if message:
+            self.update_status(message)
+        elif self.status_callback:
+            self.status_callback(self.automation_status)
 
-        if found_index == -1:
-            processed_job_summary_list.append(job_summary)
-            action = "added"
+    def limits_reached(self):
+        return (self.automation_status["applications_submitted"] >= self.max_applications
+                or self.automation_status["jobs_processed"] >= 500)
+
+    def start_harvest(self, search_filter):
+        """Search, apply the filters and load the first result page by URL.
+
+        With SEARCH_SETTINGS["url_search"] the keyword, location and filters
+        go into one results URL loaded directly at start_page; typing the
+        search and clicking the filters is the fallback when that URL shows
+        no results.
+        """
+        self.network_meter(self.driver).switch("search")
+        self.navigator = ResultsNavigator(self.driver, self.readiness, page_size=SEARCH_SETTINGS.get("page_size", 100))
+        if not (SEARCH_SETTINGS.get("url_search", True) and self.search_by_url(search_filter)):
+            self.search_by_clicks(search_filter)
+
+        job_search_results_container = self.driver.find_element(By.CSS_SELECTOR, '[data-testid="job-search-results-container"]')
+        first_p_element = job_search_results_container.find_element(By.TAG_NAME, "p")
+        if first_p_element:
+            total_job_count = first_p_element.text.split()[0]  # Extract only the number of total results
+            self.automation_status["total_jobs"] = total_job_count
+            self.update_status(f"A total of {total_job_count} jobs have been searched.")
+
+        self.harvest_page_number = self.start_page
+        self.previous_first_job_url = None
+
+    def search_by_url(self, search_filter):
+        """Load start_page of the composed results URL. Returns False if it shows no job cards."""
+        url = search_filter.search_url(self.search_keyword, self.search_location, SEARCH_SETTINGS.get("easy_apply_only", False))
+        self.navigator.set_base_url(url)
+        self.network_meter(self.driver).switch("results")
+        if self.navigator.go_to_page(self.start_page):
+            return True
+        self.update_status("No results from the search URL, searching through the search form instead...")
+        self.network_meter(self.driver).switch("search")
+        return False
+
+    def search_by_clicks(self, search_filter):
+        """Type the search, click the filters, then reload the results by URL at start_page."""
+        # Perform search with the keyword
+        if not search_filter.perform_search(self.search_keyword, self.search_location):
+            raise Exception("Search failed")
+
+        # Apply filters if specified
+        if not search_filter.apply_filters():
+            raise Exception("Filter application failed")
+        self.readiness.network_idle(legacy=2)
+
+        # Reload the results by URL with a larger page size, starting at start_page
+        self.navigator.set_base_url(self.driver.current_url)
+        self.network_meter(self.driver).switch("results")
+        if not self.navigator.go_to_page(self.start_page):
+            raise Exception(f"No job results on page {self.start_page}")
+
+    def harvest_page(self, job_card_extractor, job_triage):
+        """Harvest stage: queue the jobs of the current result page worth applying to.
+
+        Jobs ruled out from the card (or the HTTP probe) are recorded in the
+        history right away. Moves on to the next result page and returns
+        False when there is none.
+        """
+        page = self.harvest_page_number
+        self.automation_status["current_page"] = page
+        self.network_meter(self.driver).switch("results")
+        # Jobs may have been opened in the results tab since the page was loaded
+        self.job_tabs(self.driver).restore()
+        self.update_stage("harvest", "running", f"Harvesting jobs from page {page}...")
+
+        job_listings = self.get_job_listings(job_card_extractor)
+        # Past the last page the site may serve the last page again
+        if not job_listings or job_listings[0]["job_url"] == self.previous_first_job_url:
+            return False
+        self.previous_first_job_url = job_listings[0]["job_url"]
+        easy_apply_marker_seen = any(listing.get("is_easy_apply") for listing in job_listings)
+        probe_results = self.probe_listings(job_listings, job_triage, easy_apply_marker_seen)
+        page_queued = 0
+        page_already_applied = 0
+        page_skipped = 0
+
+        for listing in job_listings:
+            job_summary = {field: listing[field] for field in JOB_CARD_FIELD_SELECTORS}
+            job_summary["publish_date"] = ""
+            job_summary["job_id"] = listing["job_id"]
+            job_summary["job_url"] = listing["job_url"]
+
+            # Decide from the card alone whether the job is worth opening
+            decision, reason = job_triage.classify(listing, job_summary, easy_apply_marker_seen)
+            probe_result = probe_results.get(listing["job_url"]) if decision == APPLY else None
+            if probe_result:
+                decision, reason = job_triage.classify_probe(probe_result)
+                job_summary["publish_date"] = probe_result.get("publish_date") or ""
+                job_summary["job_id"] = job_summary["job_id"] or probe_result.get("job_id")
+
+            if decision == APPLY:
+                if self.queue.put(job_summary, page):
+                    page_queued += 1
+                continue
+            if decision == SKIP:
+                page_skipped += 1
+                job_summary['apply_status'] = False
+                job_summary['skip_reason'] = reason
+                self.update_status(f"Job Post skipped before opening ({reason}). Skipping...")
+                self.update_processed_job(job_summary)
+                if probe_result and self.shared_index:
+                    self.shared_index.record(job_summary['job_id'], reason, job_summary.get('publish_date'))
+                self.count(jobs_processed=1, job_skipped=1)
+            else:
+                page_already_applied += 1
+                if probe_result:
+                    job_summary['apply_status'] = True
+                    job_summary['job_url'] = probe_result["final_url"]
+                    self.update_processed_job(job_summary)
+                self.count(jobs_processed=1, already_applied=1)
+
+        print_harvest_summary(page, len(job_listings), page_queued, page_already_applied, page_skipped)
+        self.automation_status["stages"]["harvest"]["page"] = page
+        self.automation_status["stages"]["harvest"]["queued"] += page_queued
+
+        self.harvest_page_number = page + 1
+        self.update_status(f"Moving to next page(Page {page+1})")
+        return self.navigator.go_to_page(page + 1)
+
+    def harvest_next_page(self, job_card_extractor, job_triage):
+        """Run harvest_page. Returns False once harvesting is over, including when it failed.
+
+        An error loading or reading a result page ends the harvest, not the
+        run: the jobs already queued are still applied to.
+        """
+        try:
+            if self.harvest_page(job_card_extractor, job_triage):
+                return True
+            self.update_stage("harvest", "done", "No more result pages to harvest.")
+        except Exception as e:
+            log(f"Harvesting stopped after an error: {e}", "ERROR", "❌")
+            self.update_stage("harvest", "done", f"Harvesting stopped after an error: {e}")
+        return False
+
+    def apply_queued_job(self, item, job_handler, driver):
+        """Apply stage: open a queued job (see JobTabs) and run the JobHandler apply flow."""
+        job_summary = item["summary"]
+        self.automation_status["current_job"] = item["id"]
+        if self.history.contains(job_summary):
+            # Recorded since it was queued, e.g. by an earlier run
+            self.queue.complete(item["id"], "already_processed")
+            self.count(jobs_processed=1, already_applied=1)
+            return "Already Applied ⏩"
+
+        self.network_meter(driver).switch("job_detail")
+        tabs = self.job_tabs(driver)
+        try:
+            tabs.open(item["job_url"])
+            detail_url = driver.current_url
+            apply_result = job_handler.apply_to_job(filters=self.filters, job_summary=job_summary)
+        finally:
+            tabs.done()
+        job_summary['apply_status'] = True
+        job_summary['job_url'] = detail_url
+        if apply_result == 1:
+            self.count(jobs_processed=1, applications_submitted=1)
+            applications_submitted = self.automation_status["applications_submitted"]
+            progress_percent = int((applications_submitted / self.max_applications) * 100)
+            self.update_status(f"Successfully applied to job {applications_submitted} of {self.max_applications} ({progress_percent}%)")
+            status, result = "Applied ✅", "applied"
+        elif apply_result == 0:
+            self.count(jobs_processed=1, already_applied=1)
+            self.update_status("Job already applied. Skipping...")
+            status, result = "Already Applied ⏩", "already_applied"
         else:
-            processed_job_summary_list[found_index] = job_summary
-            action = "updated"
-        if update:
-            with open(self.processed_jobs_file_path, "w") as file:
-                json.dump(processed_job_summary_list, file, indent=4)
-
-        log(f"Job summary {action} successfully.")
-        return action == "updated"
-
+            self.count(jobs_processed=1, job_skipped=1)
+            job_summary['apply_status'] = False
+            if job_summary.get('skip_reason') == "submit_unconfirmed":
+                self.update_status("Job submission was not confirmed. Skipping...")
+            else:
+                self.update_status("Job Post is not Dice Easy Apply. Skipping...")
+            status, result = "Skipped ➖", job_summary.get('skip_reason') or "skipped"
+        job_summary['job_id'] = job_summary.get('job_id') or get_job_id(detail_url)
+        self.update_processed_job(job_summary)
+        if self.shared_index:
+            self.shared_index.record(job_summary['job_id'], job_summary.get('skip_reason'), job_summary.get('publish_date'))
+        self.queue.complete(item["id"], result)
+        return status
+
+    def run_apply_step(self, job_handler, driver, readiness=None):
+        """Claim one queued job and apply to it. Returns False if the queue was empty."""
+        item = self.queue.claim()
+        if item is None:
+            return False
+        self.update_stage("apply", "running")
+        try:
+            status = self.apply_queued_job(item, job_handler, driver)
+            print_job_status(item["id"], self.automation_status["stages"]["harvest"]["queued"], item["page"], item["summary"], status)
+        except Exception as e:
+            self.count(jobs_processed=1, job_errors=1)
+            self.queue.fail(item["id"], str(e))
+            self.update_status(f"Error processing job: {str(e)}", "error")
+            print_job_status(item["id"], self.automation_status["stages"]["harvest"]["queued"], item["page"], item["summary"], "Error ❌", error=str(e))
+        (readiness or self.readiness).pause(1)
+        return True
+
+    def reserve_application(self):
+        """Reserve room for one more in-flight application; False once max_applications is covered."""
+        with self.counter_lock:
+            if self.stop_event.is_set() or self.automation_status["jobs_processed"] >= 500:
+                return False
+            if self.automation_status["applications_submitted"] + self.applications_in_flight >= self.max_applications:
+                return False
+            self.applications_in_flight += 1
+            return True
+
+    def release_application(self):
+        with self.counter_lock:
+            self.applications_in_flight -= 1
+
+    def open_worker_browsers(self, count):
+        """Start `count` extra browsers that reuse the main browser's login cookies."""
+        cookies = self.driver.get_cookies()
+        browsers = []
+        for index in range(count):
+            driver, wait = self.driver_factory()
+            if driver is None:
+                log(f"Apply worker {index + 1} could not start a browser.", "WARNING", "⚠️ ")
+                continue
+            self.network_meter(driver).switch("login")
+            try:
+                # Cookies can only be added for the domain of the current page
+                driver.get("https://www.dice.com/home-feed")
+                for cookie in cookies:
+                    cookie = {key: value for key, value in cookie.items() if key in COOKIE_FIELDS}
+                    try:
+                        driver.add_cookie(cookie)
+                    except WebDriverException:
+                        pass
+                driver.get("https://www.dice.com/home-feed")
+                WebDriverWait(driver, 15).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, "a[href*='/profile']"))
+                )
+                browsers.append((driver, wait))
+                log(f"Apply worker {index + 1} is logged in.", "SUCCESS", "✅")
+            except Exception as e:
+                log(f"Apply worker {index + 1} could not reuse the login session: {e}", "WARNING", "⚠️ ")
+                self.release_driver(driver)
+        return browsers
+
+    def release_driver(self, driver):
+        """Hand a worker browser back to driver_release, or quit it."""
+        tabs = self.tabs.pop(id(driver), None)
+        if tabs:
+            tabs.close()
+        meter = self.network_meters.pop(id(driver), None)
+        if meter:
+            self.network_usage.add_meter(meter)
+        try:
+            if self.driver_release:
+                self.driver_release(driver)
+            else:
+                driver.quit()
+        except Exception:
+            pass
+
+    def apply_worker(self, driver, wait, job_handler=None):
+        """Apply queued jobs with one browser until the queue is drained and harvesting is done."""
+        readiness = Readiness(driver) if driver is not self.driver else self.readiness
+        if job_handler is None:
+            job_handler = JobHandler(driver, wait, ShadowDOMHandler(driver, wait), self.job_status_callback, readiness=readiness, resume_path=self.resume_path, resume_manager=self.resume_manager)
+        while self.reserve_application():
+            try:
+                claimed = self.run_apply_step(job_handler, driver, readiness)
+            finally:
+                self.release_application()
+            if not claimed:
+                if self.harvest_finished.is_set() and self.queue.pending_count() == 0:
+                    break
+                # Wait for the harvest stage to queue more jobs
+                self.jobs_queued.wait(1)
+                self.jobs_queued.clear()
+
+    def run_pool(self, job_card_extractor, job_triage, job_handler, harvest_done):
+        """Harvest with the main browser while a pool of worker browsers applies.
+
+        Harvesting pauses while QUEUE_SETTINGS["max_pending"] jobs are
+        waiting. Once harvesting is done the main browser joins the workers.
+        Returns False if no worker browser could be started.
+        """
+        browsers = self.open_worker_browsers(self.apply_workers)
+        if not browsers:
+            return False
+        self.update_status(f"Applying with {len(browsers)} worker browsers.")
+        threads = [
+            threading.Thread(target=self.apply_worker, args=(driver, wait), daemon=True)
+            for driver, wait in browsers
+        ]
+        for thread in threads:
+            thread.start()
+        try:
+            max_pending = QUEUE_SETTINGS.get("max_pending", 200)
+            while not harvest_done and not self.limits_reached() and not self.stop_event.is_set():
+                pending = self.queue.pending_count()
+                if pending >= max_pending:
+                    self.update_stage("harvest", "paused", f"Job queue is full ({pending} pending), pausing harvest...")
+                    self.stop_event.wait(1)
+                    continue
+                if not self.harvest_next_page(job_card_extractor, job_triage):
+                    harvest_done = True
+                self.jobs_queued.set()
+            self.harvest_finished.set()
+            self.jobs_queued.set()
+            self.apply_worker(self.driver, self.wait, job_handler)
+            for thread in threads:
+                thread.join()
+        finally:
+            self.harvest_finished.set()
+            for driver, _ in browsers:
+                self.release_driver(driver)
+        return True
 
     def run(self):
-        """Main method to run the automation"""
+        """Main method to run the automation
+
+        Runs the harvest stage (result pages -> job queue) and the apply stage
+        (job queue -> applications). With a single browser the queue is
+        refilled a page at a time whenever it runs low; with apply_workers
+        the stages run side by side (see run_pool). With harvest=False only
+        the jobs already in the queue are applied to.
+        """
         try:
             self.update_status("Starting automation...")
 
             # Initialize handlers
-            search_filter = SearchAndFilter(self.driver, self.wait, filters=self.filters)
+            search_filter = SearchAndFilter(self.driver, self.wait, filters=self.filters, readiness=self.readiness)
             shadow_dom_handler = ShadowDOMHandler(self.driver, self.wait)
-            job_handler = JobHandler(self.driver, self.wait, shadow_dom_handler, self.status_callback)
-
-            # Perform search with the keyword
-            if not search_filter.perform_search(self.search_keyword, self.search_location):
-                raise Exception("Search failed")
-
-            # Apply filters if specified
-            if not search_filter.apply_filters():
-                raise Exception("Filter application failed")
-            time.sleep(2)
-            
-            job_search_results_container = self.driver.find_element(By.CSS_SELECTOR, '[data-testid="job-search-results-container"]')
-            first_p_element = job_search_results_container.find_element(By.TAG_NAME, "p")
-            if first_p_element:
-                total_job_count = first_p_element.text.split()[0]  # Extract only the number of total results
-                self.automation_status["total_jobs"] = total_job_count
-                self.update_status(f"A total of {total_job_count} jobs have been searched.")
-
-            applications_submitted = 0
-            jobs_processed = 0
-            already_applied = 0
-            job_skipped = 0
-            job_errors = 0
-            page = 0
-            jobs_per_page = 20
-
-            while True:
-                page += 1
-                self.automation_status["current_page"] = page
-                self.update_status(f"Trying to apply with page {page}...")
-
-                job_index = 0
-                current_url = self.driver.current_url
-                
-                job_listings = self.get_job_listings()
-                total_jobs_on_page = len(job_listings)
-                page_applied = 0
-                page_already_applied = 0
-                page_skipped = 0
-                page_errors = 0
-
-                while applications_submitted < self.max_applications and jobs_processed < 500:
-                    try:
-                        if not job_listings or job_index >= len(job_listings):
-                            self.update_status(f"All jobs of Page {page} are processed", "completed")
-                            break
-
-                        self.automation_status["current_job"] = job_index + 1
+            job_handler = JobHandler(self.driver, self.wait, shadow_dom_handler, self.job_status_callback, readiness=self.readiness, resume_path=self.resume_path, resume_manager=self.resume_manager)
+            job_card_extractor = JobCardExtractor(self.driver)
+            job_triage = JobTriage(self.history, self.shared_index, self.filters)
 
-                        listing = job_listings[job_index]
-                        self.driver.execute_script("arguments[0].scrollIntoView(true);", listing)
-                        time.sleep(1)
-                        
-                        job_search_card = listing.find_element(By.XPATH, '..')
-
-                        is_already_applied = False
-
-                        # Check for card is already applied by badge
-                        if job_search_card and job_search_card.find_elements(By.XPATH, ".//span[contains(text(), 'Applied')]"):
-                            is_already_applied = True
-
-                        # Get Job summary
-                        job_summary = {}
-                        job_summary["card_title"] = self.safe_get_text(job_search_card, 'div.content > div:first-child > div:first-child > a')
-                        job_summary["company_name"] = self.safe_get_text(job_search_card, 'div.header > span:first-child > a:last-child > p')
-                        job_summary["location"] = self.safe_get_text(job_search_card, 'div.content > span:nth-child(2) > div:first-child > div:first-child > div:first-child > p')
-                        job_summary["employment_type"] = self.safe_get_text(job_search_card, 'div.content p#employmentType-label')
-                        job_summary["card_summary"] = self.safe_get_text(job_search_card, 'div.content > span:nth-child(3) > div > p')
-                        job_summary["publish_date"] = ""
-
-                        processed_job_list = self.get_job_aready_processed_list()
-                        # Check for card is already processed
-                        if self.update_processed_job(processed_job_list, job_summary, update=False):
-                            is_already_applied = True
-
-                        status = ""
-                        error_msg = None
-                        if not is_already_applied:
-                            # Click the job listing
-                            self.driver.execute_script("arguments[0].click();", listing)
-                            new_tab = self.driver.window_handles[-1]
-                            self.driver.switch_to.window(new_tab)
-                            detail_url = self.driver.current_url
-                            apply_result = job_handler.apply_to_job(filters=self.filters, job_summary=job_summary)
-                            job_summary['apply_status'] = True
-                            job_summary['job_url'] = detail_url
-                            if apply_result == 1:
-                                applications_submitted += 1
-                                page_applied += 1
-                                self.automation_status["applications_submitted"] = applications_submitted
-                                progress_percent = int((applications_submitted / self.max_applications) * 100)
-                                self.update_status(f"Successfully applied to job {applications_submitted} of {self.max_applications} ({progress_percent}%)")
-                                status = "Applied ✅"
-                            elif apply_result == 0:
-                                already_applied += 1
-                                page_already_applied += 1
-                                self.update_status("Job already applied. Skipping...")
-                                status = "Already Applied ⏩"
-                            else:
-                                job_skipped += 1
-                                page_skipped += 1
-                                job_summary['apply_status'] = False
-                                self.update_status("Job Post is not Dice Easy Apply. Skipping...")
-                                status = "Skipped ➖"
-                            processed_job_list = self.get_job_aready_processed_list()
-                            self.update_processed_job(processed_job_list, job_summary)
-                        else:
-                            already_applied += 1
-                            page_already_applied += 1
-                            self.update_status("Job already applied. Skipping...")
-                            status = "Already Applied ⏩"
-
-                        jobs_processed += 1
-                        self.automation_status["jobs_processed"] = jobs_processed
-                        self.automation_status["already_applied"] = already_applied
-                        self.automation_status["job_skipped"] = job_skipped
-                        job_index += 1
-                        time.sleep(1)
-                        print_job_status(job_index, total_jobs_on_page, page, job_summary, status)
-                    except Exception as e:
-                        job_errors += 1
-                        page_errors += 1
-                        self.update_status(f"Error processing job: {str(e)}", "error")
-                        jobs_processed += 1
-                        job_index += 1
-                        print_job_status(job_index, total_jobs_on_page, page, job_summary if 'job_summary' in locals() else {}, "Error ❌", error=str(e))
-                        continue
-                print_page_summary(page, total_jobs_on_page, page_applied, page_already_applied, page_skipped, page_errors)
-                try:
-                    pagination_next = self.driver.find_element(By.XPATH, "//span[@aria-label='Next' and not(contains(@class, 'disabled'))]")
-                    if pagination_next:
-                        pagination_next.click()
-                        time.sleep(1)
-                        self.update_status(f"Moving to next page(Page {page+1})")
-                        WebDriverWait(self.driver, 15).until(EC.url_changes(current_url))
-                        time.sleep(2)
-
-                    else:
-                        self.update_status("No more jobs available to process.", "completed")
-                        break
-                except:
-                    self.update_status("No more jobs available to process.", "completed")
+            harvest_done = not self.harvest
+            if self.harvest:
+                self.start_harvest(search_filter)
+            else:
+                self.update_stage("harvest", "skipped", f"Applying to the {self.queue.pending_count()} jobs already queued.")
+
+            use_pool = self.apply_workers > 0 and self.driver_factory is not None
+            if use_pool and self.run_pool(job_card_extractor, job_triage, job_handler, harvest_done):
+                harvest_done = True
+
+            refill_below = QUEUE_SETTINGS.get("refill_below", 1)
+            while not self.limits_reached() and not self.stop_event.is_set():
+                pending = self.queue.pending_count()
+                if not harvest_done and pending < refill_below:
+                    if not self.harvest_next_page(job_card_extractor, job_triage):
+                        harvest_done = True
+                    continue
+                if not harvest_done:
+                    # Back-pressure: harvesting waits until the queue runs low again
+                    self.update_stage("harvest", "paused")
+                if not self.run_apply_step(job_handler, self.driver):
                     break
+            self.update_stage("apply", "done")
 
             # Update final status
-            print_final_summary(jobs_processed, applications_submitted, already_applied, job_skipped, job_errors)
-            if applications_submitted > 0:
+            status = self.automation_status
+            print_final_summary(status["jobs_processed"], status["applications_submitted"], status["already_applied"], status["job_skipped"], status["job_errors"])
+            if status["applications_submitted"] > 0:
                 self.update_status(
-                    f"Completed! Applied to {applications_submitted} out of {self.max_applications} target jobs",
+                    f"Completed! Applied to {status['applications_submitted']} out of {self.max_applications} target jobs",
                     "completed"
                 )
             else:
@@ -400,9 +713,11 @@ class DiceAutomation:
 
             return {
                 "success": True,
-                "applications_submitted": applications_submitted,
-                "jobs_processed": jobs_processed,
-                "already_applied": already_applied,
+                "applications_submitted": status["applications_submitted"],
+                "jobs_processed": status["jobs_processed"],
+                "already_applied": status["already_applied"],
+                "queue": self.queue.counts(),
+                "network": self.network_report(),
                 "status": self.automation_status
             }
 
@@ -411,5 +726,13 @@ class DiceAutomation:
             return {
                 "success": False,
                 "error": str(e),
+                "network": self.network_report(),
                 "status": self.automation_status
             }
+
+        finally:
+            tabs = self.tabs.pop(id(self.driver), None)
+            if tabs:
+                tabs.close()
+            if self.job_probe:
+                self.job_probe.close()
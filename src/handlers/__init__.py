@@ -1,3 +1,4 @@
 from .job_handler import JobHandler
 from .shadow_dom_handler import ShadowDOMHandler
 from .search_filter_handler import SearchAndFilter
+from .job_card_extractor import JobCardExtractor
@@ -0,0 +1,36 @@
+from ..utils.job_index import get_job_id
+from ..utils.shadow_query import ShadowQuery
+
+JOB_CARD_LINK_SELECTOR = "a[data-testid='job-search-job-card-link']"
+
+# Selectors relative to the card element (the parent of the card link)
+JOB_CARD_FIELD_SELECTORS = {
+    "card_title": "div.content > div:first-child > div:first-child > a",
+    "company_name": "div.header > span:first-child > a:last-child > p",
+    "location": "div.content > span:nth-child(2) > div:first-child > div:first-child > div:first-child > p",
+    "employment_type": "div.content p#employmentType-label",
+    "card_summary": "div.content > span:nth-child(3) > div > p",
+}
+
+class JobCardExtractor:
+    """Reads every job card of a search results page in a single script call.
+
+    The card script is a preloaded page helper (see ShadowQuery), so each
+    call only sends the selectors.
+    """
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.query = ShadowQuery.for_driver(driver)
+
+    def extract_cards(self):
+        """Return the job cards of the current page as plain dicts.
+
+        Each card has the job summary fields, `job_url`, `job_id`,
+        `is_applied` (the "Applied" badge), `is_easy_apply` (the "Easy Apply"
+        marker), `posted_text` (e.g. "2 days ago") and its `index` on the page.
+        """
+        cards = self.query.call("extractCards", JOB_CARD_LINK_SELECTOR, JOB_CARD_FIELD_SELECTORS) or []
+        for card in cards:
+            card["job_id"] = get_job_id(card.get("job_url"))
+        return cards
@@ -1,16 +1,31 @@
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import StaleElementReferenceException
 from config import RESUME_SETTINGS
-import time
 from datetime import datetime
 from selenium.webdriver.common.action_chains import ActionChains
+from ..utils.readiness import Readiness
+from ..utils.resume_manager import ResumeManager
+
+# Ways to find the resume Replace button, tried in the order that last worked
+REPLACE_BUTTON_LOCATORS = {
+    "replace_text": (By.XPATH, "//button[contains(@class, 'file-remove')]//span[text()='Replace']/.."),
+    "file_interactions": (By.CSS_SELECTOR, "div.file-interactions button"),
+    "file_remove": (By.CSS_SELECTOR, "button.file-remove"),
+}
+
+# Where the apply form shows the name of the profile's current resume
+RESUME_FILE_NAME_SELECTOR = "div.file-info span.file-name, span.file-name"
 
 class JobHandler:
-    def __init__(self, driver, wait, shadow_dom_handler, status_callback=None):
+    def __init__(self, driver, wait, shadow_dom_handler, status_callback=None, readiness=None, resume_path=None, resume_manager=None):
         self.driver = driver
         self.wait = wait
         self.shadow_dom_handler = shadow_dom_handler
         self.status_callback = status_callback
+        self.readiness = readiness if readiness is not None else Readiness(driver)
+        self.resume_path = resume_path or RESUME_SETTINGS.get('path')
+        self.resume_manager = resume_manager if resume_manager is not None else ResumeManager(self.resume_path)
 
     def update_status(self, message, status="running"):
         """Update status for UI"""
@@ -21,27 +36,42 @@ class JobHandler:
             })
         print(message)
 
+    def displayed_resume_name(self):
+        """File name of the profile resume shown in the apply form, or None if it is not shown."""
+        elements = self.driver.find_elements(By.CSS_SELECTOR, RESUME_FILE_NAME_SELECTOR)
+        return elements[0].text.strip() if elements and elements[0].text.strip() else None
+
+    def first_clickable(self, step, locators):
+        """Wait once for whichever locator matches a clickable element, trying last run's winner first."""
+        labels = self.resume_manager.ordered(step, list(locators))
+
+        def find(driver):
+            for label in labels:
+                for element in driver.find_elements(*locators[label]):
+                    if element.is_displayed() and element.is_enabled():
+                        return label, element
+            return False
+
+        label, element = self.wait.until(find)
+        self.resume_manager.remember(step, label)
+        return element
+
     def replace_resume(self):
-        """Find and click replace button, then upload new resume"""
+        """Find and click replace button, then upload new resume
+
+        Skipped when the profile already holds this resume (see ResumeManager).
+        """
         try:
+            if not self.resume_manager.needs_upload(self.displayed_resume_name()):
+                self.update_status("Profile resume already matches the uploaded resume, skipping replace...")
+                return True
+
             self.update_status("Looking for resume replace button...")
-            try:
-                replace_button = self.wait.until(EC.element_to_be_clickable((
-                    By.XPATH, "//button[contains(@class, 'file-remove')]//span[text()='Replace']/.."
-                )))
-            except:
-                try:
-                    replace_button = self.wait.until(EC.element_to_be_clickable((
-                        By.CSS_SELECTOR, "div.file-interactions button"
-                    )))
-                except:
-                    replace_button = self.wait.until(EC.element_to_be_clickable((
-                        By.CSS_SELECTOR, "button.file-remove"
-                    )))
+            replace_button = self.first_clickable("replace_button", REPLACE_BUTTON_LOCATORS)
 
             self.update_status("Clicking replace button...")
             replace_button.click()
-            time.sleep(2)
+            self.readiness.pause(2)  # The file input wait below covers the picker opening
 
             # Look for file input after clicking replace
             self.update_status("Looking for file input...")
@@ -49,35 +79,38 @@ class JobHandler:
                 By.CSS_SELECTOR, "input[type='file']"
             )))
             
-            self.update_status(f"Uploading resume from: {RESUME_SETTINGS['path']}")
-            file_input.send_keys(RESUME_SETTINGS['path'])
-            time.sleep(3)  # Wait for file to attach
+            self.update_status(f"Uploading resume from: {self.resume_path}")
+            file_input.send_keys(self.resume_path)
+            self.readiness.pause(3)  # The Upload button wait below covers the file attaching
 
-            # Click the Upload button using the exact selector from the page 
+            # Click the Upload button, the way that worked last time first
             self.update_status("Looking for Upload button...")
-            try:
-                upload_button = self.wait.until(EC.element_to_be_clickable((
-                    By.CSS_SELECTOR, "span.fsp-button.fsp-button--primary.fsp-button-upload[data-e2e='upload']"
-                )))
-                self.update_status("Found Upload button, clicking...")
-                upload_button.click()
-            except:
+            clicked = False
+            for method in self.resume_manager.ordered("upload_button", ["click", "script"]):
                 try:
-                    # Backup method using JavaScript if the direct click fails
-                    self.driver.execute_script("""
-                        const uploadButton = document.querySelector('span.fsp-button-upload[data-e2e="upload"]');
-                        if (uploadButton) {
-                            uploadButton.click();
-                            return true;
-                        }
-                        return false;
-                    """)
-                    self.update_status("Clicked Upload button using JavaScript")
+                    if method == "click":
+                        upload_button = self.wait.until(EC.element_to_be_clickable((
+                            By.CSS_SELECTOR, "span.fsp-button.fsp-button--primary.fsp-button-upload[data-e2e='upload']"
+                        )))
+                        self.update_status("Found Upload button, clicking...")
+                        upload_button.click()
+                        clicked = True
+                    else:
+                        # Backup method using JavaScript if the direct click fails
+                        clicked = self.shadow_dom_handler.query.click("span.fsp-button-upload[data-e2e='upload']")
+                        if clicked:
+                            self.update_status("Clicked Upload button using JavaScript")
                 except Exception as e:
-                    self.update_status(f"Failed to click Upload button: {str(e)}", "error")
-                    return False
+                    self.update_status(f"Upload button {method} failed: {str(e)}", "warning")
+                if clicked:
+                    self.resume_manager.remember("upload_button", method)
+                    break
+            if not clicked:
+                self.update_status("Failed to click Upload button", "error")
+                return False
 
-            time.sleep(3)  # Wait for upload to complete
+            self.readiness.network_idle(legacy=3)  # Wait for upload to complete
+            self.resume_manager.record_upload()
             self.update_status("Resume replacement successful!")
             return True
 
@@ -85,24 +118,59 @@ class JobHandler:
             self.update_status(f"Error replacing resume: {str(e)}", "error")
             return False
 
+    def submit_step_loaded(self, next_button):
+        """Wait condition: the clickable primary button of the step after `next_button`, or False."""
+        def condition(driver):
+            try:
+                if next_button.text.strip() == "Next":
+                    return False
+            except StaleElementReferenceException:
+                pass
+            try:
+                for button in driver.find_elements(By.CSS_SELECTOR, "button.seds-button-primary.btn-next"):
+                    if button.is_displayed() and button.is_enabled() and button.text.strip() != "Next":
+                        return button
+            except StaleElementReferenceException:
+                pass
+            return False
+        return condition
+
+    def submission_confirmed(self, submit_button, wizard_url):
+        """Wait condition: the apply wizard left the Submit step (new URL, or the Submit button is gone)."""
+        def condition(driver):
+            if driver.current_url != wizard_url:
+                return True
+            try:
+                return not submit_button.is_displayed()
+            except StaleElementReferenceException:
+                return True
+        return condition
+
     def apply_to_job(self, filters, job_summary):
-        """Handle the application process for a single job"""
-        new_tab = self.driver.window_handles[-1]
-        self.driver.switch_to.window(new_tab)
-        
+        """Handle the application process for a single job
+
+        Returns 1 if applied, 0 if already applied or not processable, and -1
+        if the job is not a Dice Easy Apply job or the submission could not be
+        confirmed (with job_summary["skip_reason"] set).
+
+        The job-detail page must already be open in the current tab; the
+        caller decides which tab that is (see JobTabs).
+        """
         try:
             if not "https://www.dice.com/job-detail/" in self.driver.current_url:
                 self.update_status(f"This Job post does not belong to Dice. Job Link: {self.driver.current_url}")
+                job_summary["skip_reason"] = "not_dice"
                 return -1
             self.update_status("Waiting for page to load completely...")
-            time.sleep(2)
+            self.readiness.dom_settled(legacy=2)
 
-            publish_date_meta = self.wait.until(EC.presence_of_element_located((
-                By.CSS_SELECTOR, "meta[property='og:publish_date']"
-            )))
-            publish_date = publish_date_meta.get_attribute("content")
-            self.update_status(f"Job published date: {publish_date}")
-            job_summary["publish_date"] = publish_date
+            # The publish date may already be known from the HTTP probe
+            if not job_summary.get("publish_date"):
+                publish_date_meta = self.wait.until(EC.presence_of_element_located((
+                    By.CSS_SELECTOR, "meta[property='og:publish_date']"
+                )))
+                job_summary["publish_date"] = publish_date_meta.get_attribute("content")
+            self.update_status(f"Job published date: {job_summary['publish_date']}")
 
             job_applied_date = datetime.now().isoformat() + 'Z'
             job_summary["applied_date"] = job_applied_date
@@ -110,7 +178,7 @@ class JobHandler:
 
             click_result = self.shadow_dom_handler.find_and_click_easy_apply()
             if click_result == "easy_apply_button_clicked":
-                time.sleep(2)
+                self.readiness.dom_settled(legacy=2)
                 
                 # Replace resume
                 self.update_status("Attempting to replace resume...")
@@ -124,25 +192,33 @@ class JobHandler:
                 ))
                 self.update_status("Clicking Next button...")
                 next_button.click()
-                time.sleep(2)
+                self.readiness.pause(2)  # The Submit button wait below covers the next step loading
                 
-                # Click Submit
+                # Click Submit once the next step has replaced the Next button (same selector)
                 self.update_status("Looking for Submit button...")
-                submit_button = self.wait.until(EC.element_to_be_clickable(
-                    (By.CSS_SELECTOR, "button.seds-button-primary.btn-next")
-                ))
+                submit_button = self.wait.until(self.submit_step_loaded(next_button))
                 self.update_status("Clicking Submit button...")
+                wizard_url = self.driver.current_url
                 submit_button.click()
-                time.sleep(2)
+                # Resource timing has no entry for a request still in flight, so network_idle
+                # alone could let the tab move on and abort the submission
+                if not self.readiness.until(self.submission_confirmed(submit_button, wizard_url), step="submit", legacy=2):
+                    self.update_status("Submission was not confirmed; not counting this job as applied", "error")
+                    job_summary["skip_reason"] = "submit_unconfirmed"
+                    return -1
+                self.readiness.network_idle(legacy=0)
                 
                 self.update_status("Successfully applied to job!", "success")
-                time.sleep(2)
+                self.readiness.pause(2)
                 return 1
             
             if click_result == "application_already_submitted":
                 self.update_status("The job has already been applied.")
             elif click_result == "no_action_possible":
                 self.update_status("No action was possible. Please check the job state.")
+                # Only a timeout: may be a slow page, so this is not shared with other accounts
+                job_summary["skip_reason"] = "easy_apply_not_found"
+                return -1
             elif "error_occurred" in click_result:
                 self.update_status(f"An error occurred: {click_result.split(': ')[1]}")
             self.update_status("Skipping job - already applied or not available for easy apply", "skipped")
@@ -150,10 +226,4 @@ class JobHandler:
                 
         except Exception as e:
             self.update_status(f"Could not process job: {str(e)}", "error")
-            return 0
-        
-        finally:
-            self.update_status("Closing job tab...")
-            self.driver.close()
-            self.driver.switch_to.window(self.driver.window_handles[0])
-            time.sleep(1)
\ No newline at end of file
+            return 0
\ No newline at end of file
@@ -0,0 +1,50 @@
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from datetime import datetime
+
+from .job_card_extractor import JOB_CARD_LINK_SELECTOR
+from ..utils.readiness import Readiness
+
+def log(msg, level="INFO", symbol=""):
+    ts = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    prefix = f"[{ts}] [{level}]"
+    if symbol:
+        print(f"{prefix} {symbol} {msg}")
+    else:
+        print(f"{prefix} {msg}")
+
+class ResultsNavigator:
+    """Moves between search result pages by URL instead of clicking "Next".
+
+    The search results URL is captured once after the search; any page can
+    then be loaded directly with its `page` and `pageSize` parameters, so a
+    run can start or resume at page N without clicking through pages 1..N-1.
+    """
+
+    def __init__(self, driver, readiness=None, page_size=100):
+        self.driver = driver
+        self.readiness = readiness if readiness is not None else Readiness(driver)
+        self.page_size = page_size
+        self.base_url = None
+
+    def set_base_url(self, url):
+        """Remember a search results URL, dropping its paging parameters."""
+        parts = urlsplit(url)
+        query = [(key, value) for key, value in parse_qsl(parts.query) if key not in ("page", "pageSize")]
+        self.base_url = urlunsplit(parts._replace(query=urlencode(query)))
+
+    def page_url(self, page):
+        parts = urlsplit(self.base_url)
+        query = parse_qsl(parts.query) + [("page", str(page)), ("pageSize", str(self.page_size))]
+        return urlunsplit(parts._replace(query=urlencode(query)))
+
+    def go_to_page(self, page):
+        """Load a results page. Returns False if it has no job cards."""
+        url = self.page_url(page)
+        log(f"Loading results page {page}: {url}", "INFO")
+        self.driver.get(url)
+        has_cards = self.readiness.until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, JOB_CARD_LINK_SELECTOR)), legacy=2
+        )
+        return bool(has_cards)
@@ -1,8 +1,36 @@
+from urllib.parse import urlencode
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.keys import Keys
 import time
 from datetime import datetime
+from ..utils.readiness import Readiness
+from ..utils.shadow_query import ShadowQuery
+
+SEARCH_URL = "https://www.dice.com/jobs"
+
+# The "Search Jobs" link inside the nested shadow roots of the site header
+NAV_JOBS_LINK_SELECTOR = (
+    "dhi-seds-nav-header >>> dhi-seds-nav-header-technologist >>> "
+    "dhi-seds-nav-header-display >>> a[href*='/jobs']"
+)
+
+def build_search_url(keyword, location, filters=None, easy_apply_only=False):
+    """Compose the results URL for a search with its filters, matching what apply_filters clicks."""
+    filters = filters or {}
+    params = [("q", keyword)]
+    if location and location.strip().lower() != "remote":
+        params.append(("location", location.strip()))
+    posted_date = filters.get('posted_date', 'NO_PREFERENCE')
+    if posted_date and posted_date != 'NO_PREFERENCE':
+        params.append(("filters.postedDate", posted_date))
+    if filters.get('third_party', False):
+        params.append(("filters.employerType", "Third Party"))
+    if filters.get('remote', True):
+        params.append(("filters.workplaceTypes", "Remote"))
+    if easy_apply_only:
+        params.append(("filters.easyApply", "true"))
+    return f"{SEARCH_URL}?{urlencode(params)}"
 
 def log(msg, level="INFO", symbol=""):
     ts = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
@@ -13,12 +41,18 @@ def log(msg, level="INFO", symbol=""):
         print(f"{prefix} {msg}")
 
 class SearchAndFilter:
-    def __init__(self, driver, wait, filters=None):
+    def __init__(self, driver, wait, filters=None, readiness=None):
         self.driver = driver
         self.wait = wait
+        self.readiness = readiness if readiness is not None else Readiness(driver)
+        self.query = ShadowQuery.for_driver(driver)
         # Initialize filters with user preferences or empty dict
         self.filters = filters if filters is not None else {}
 
+    def search_url(self, keyword, location, easy_apply_only=False):
+        """Results URL with the keyword, location and this handler's filters, for loading in one navigation."""
+        return build_search_url(keyword, location, self.filters, easy_apply_only)
+
     def perform_search(self, keyword, location):
         """Check for search box, reveal if needed, and perform search"""
         log("Checking for search box...", "INFO", "🔍")
@@ -43,7 +77,7 @@ class SearchAndFilter:
                     # Try direct navigation to jobs page
                     log("Navigating to jobs page...", "INFO")
                     self.driver.get("https://www.dice.com/jobs")
-                    time.sleep(3)
+                    self.readiness.dom_settled(legacy=3)
                     
                     # Wait for search input with exact selector
                     log("Waiting for search box to appear...", "INFO")
@@ -63,23 +97,11 @@ class SearchAndFilter:
                 except Exception:
                     # If direct navigation fails, try shadow DOM approach
                     log("Trying shadow DOM navigation...", "INFO")
-                    self.driver.execute_script("""
-                        const header = document.querySelector('dhi-seds-nav-header');
-                        const shadowRoot1 = header.shadowRoot;
-                        const technologist = shadowRoot1.querySelector('dhi-seds-nav-header-technologist');
-                        const shadowRoot2 = technologist.shadowRoot;
-                        const display = shadowRoot2.querySelector('dhi-seds-nav-header-display');
-                        const shadowRoot3 = display.shadowRoot;
-                        const searchLink = shadowRoot3.querySelector('a[href*="/jobs"]');
-                        if (searchLink) {
-                            searchLink.click();
-                            return true;
-                        }
-                        return false;
-                    """)
+                    if not self.query.click(NAV_JOBS_LINK_SELECTOR):
+                        log("Search Jobs link not found in the navigation header", "WARNING", "⚠️")
                     
                     log("Clicked Search Jobs link, waiting for page load...", "INFO")
-                    time.sleep(5)
+                    self.readiness.dom_settled(legacy=5)
                     
                     search_input = self.wait.until(EC.presence_of_element_located((
                         By.CSS_SELECTOR, 
@@ -94,12 +116,12 @@ class SearchAndFilter:
                 # Perform the search
                 log(f"Entering search keyword: {keyword}", "INFO")
                 search_input.clear()
-                time.sleep(1)
+                self.readiness.pause(1)
                 
                 # Type the keyword character by character
                 for char in keyword:
                     search_input.send_keys(char)
-                    time.sleep(0.01)
+                    self.readiness.pause(0.01)
 
                 # if location and not location.strip().lower() == 'remote':
                 #     print(f"Entering location: {location}")
@@ -111,9 +133,9 @@ class SearchAndFilter:
                 #         location_input.send_keys(char)
                 #         time.sleep(0.01)
 
-                time.sleep(1)
+                self.readiness.pause(1)
                 search_input.send_keys(Keys.RETURN)
-                time.sleep(4)
+                self.readiness.network_idle(legacy=4)
                 
                 # Wait for results to load
                 try:
@@ -161,7 +183,7 @@ class SearchAndFilter:
                     )))
                     # Use JavaScript to click the element
                     self.driver.execute_script("arguments[0].click();", posted_date_button)
-                    time.sleep(4)
+                    self.readiness.network_idle(legacy=4)
                     filters_applied = True
                     log("Posted Date filter applied successfully", "SUCCESS", "✅")
                 except Exception as e:
@@ -172,7 +194,7 @@ class SearchAndFilter:
                             By.CSS_SELECTOR, f"input[type='radio'][name='postedDateOption'][value='{posted_date}']"
                         )))
                         self.driver.execute_script("arguments[0].click();", posted_date_button)
-                        time.sleep(4)
+                        self.readiness.network_idle(legacy=4)
                         filters_applied = True
                         log("Posted Date filter applied successfully using alternative selector", "SUCCESS", "✅")
                     except Exception as e2:
@@ -188,7 +210,7 @@ class SearchAndFilter:
                         By.XPATH, "//button[@role='checkbox' and @aria-label='Filter Search Results by Third Party']"
                     )))
                     self.driver.execute_script("arguments[0].click();", third_party_button)
-                    time.sleep(4)
+                    self.readiness.network_idle(legacy=4)
                     filters_applied = True
                     log("Third Party filter applied successfully", "SUCCESS", "✅")
                 except Exception as e:
@@ -204,7 +226,7 @@ class SearchAndFilter:
                         By.XPATH, "//input[@type='checkbox' and @name='workPlaceTypeOptions.remote']"
                     )))
                     self.driver.execute_script("arguments[0].click();", remote_button)
-                    time.sleep(4)
+                    self.readiness.network_idle(legacy=4)
                     filters_applied = True
                     log("Remote filter applied successfully", "SUCCESS", "✅")
                 except Exception as e:
@@ -215,7 +237,7 @@ class SearchAndFilter:
                             By.CSS_SELECTOR, "input[type='checkbox'][name='workPlaceTypeOptions.remote']"
                         )))
                         self.driver.execute_script("arguments[0].click();", remote_button)
-                        time.sleep(4)
+                        self.readiness.network_idle(legacy=4)
                         filters_applied = True
                         log("Remote filter applied successfully using alternative selector", "SUCCESS", "✅")
                     except Exception as e2:
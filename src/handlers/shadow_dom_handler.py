@@ -1,9 +1,11 @@
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
-import time
+from selenium.common.exceptions import WebDriverException
 import traceback
 from datetime import datetime
 
+from ..utils.shadow_query import ShadowQuery
+
 def log(msg, level="INFO", symbol=""):
     ts = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
     prefix = f"[{ts}] [{level}]"
@@ -16,6 +18,7 @@ class ShadowDOMHandler:
     def __init__(self, driver, wait):
         self.driver = driver
         self.wait = wait
+        self.query = ShadowQuery.for_driver(driver)
 
     def find_and_click_easy_apply(self):
         """Find and click Easy Apply button or wait for application-submitted tag in shadow DOM."""
@@ -26,16 +29,18 @@ class ShadowDOMHandler:
             )
             log("Found shadow host element", "SUCCESS", "✅")
 
-            # Wait for either the Easy Apply button or application-submitted tag
-            apply_button = self.wait_for_shadow_element(shadow_host, 'button.btn.btn-primary')
-            application_submitted = self.wait_for_shadow_element(shadow_host, 'application-submitted')
+            # Wait for whichever of the application-submitted tag and the Easy Apply button shows up first
+            label, element = self.wait_for_first_shadow_element(shadow_host, [
+                ("application_submitted", 'application-submitted'),
+                ("apply_button", 'button.btn.btn-primary'),
+            ])
 
-            if application_submitted:
+            if label == "application_submitted":
                 log("Application already submitted - detected application-submitted tag", "INFO", "⏩")
                 return "application_already_submitted"
 
-            if apply_button:
-                self.driver.execute_script("arguments[0].click();", apply_button)
+            if label == "apply_button":
+                self.driver.execute_script("arguments[0].click();", element)
                 log("Successfully clicked Easy Apply button", "SUCCESS", "✅")
                 return "easy_apply_button_clicked"
 
@@ -47,15 +52,19 @@ class ShadowDOMHandler:
             traceback.print_exc()
             return f"error_occurred: {str(e)}"
 
+    def wait_for_first_shadow_element(self, shadow_host, candidates, timeout=10):
+        """Wait in one round-trip for the first of several elements in a shadow root.
+
+        `candidates` is a list of (label, selector) pairs; selectors may use
+        ">>>" to reach into nested shadow roots. Returns the label and element
+        of the first match, or (None, None) after `timeout` seconds.
+        """
+        try:
+            return self.query.wait_first(candidates, timeout, root=shadow_host)
+        except WebDriverException as e:
+            log(f"Shadow DOM wait was interrupted: {e}", "WARNING", "⚠️")
+            return None, None
+
     def wait_for_shadow_element(self, shadow_host, selector, timeout=10):
         """Wait for an element within a shadow DOM"""
-        for _ in range(timeout):
-            element = self.driver.execute_script(f"""
-                const shadowHost = arguments[0];
-                const shadowRoot = shadowHost.shadowRoot;
-                return shadowRoot.querySelector('{selector}');
-            """, shadow_host)
-            if element:
-                return element
-            time.sleep(1)
-        return None
\ No newline at end of file
+        return self.wait_for_first_shadow_element(shadow_host, [(selector, selector)], timeout)[1]
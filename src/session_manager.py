@@ -0,0 +1,198 @@
+import os
+import uuid
+import threading
+from datetime import datetime
+
+from config import SESSION_SETTINGS
+from .automation import DiceAutomation
+from .utils.driver_pool import DriverPool
+from .utils.status_stream import StatusStream
+
+def log(msg, level="INFO", symbol=""):
+    ts = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    prefix = f"[{ts}] [{level}]"
+    if symbol:
+        print(f"{prefix} {symbol} {msg}")
+    else:
+        print(f"{prefix} {msg}")
+
+class SessionLimitError(Exception):
+    """Raised when starting a session would exceed SESSION_SETTINGS["max_concurrent"]."""
+
+class AutomationSession:
+    """One automation run with its own driver, resume, history file and status."""
+
+    def __init__(self, session_id, username, resume_path, processed_jobs_file_path, settings=None):
+        self.session_id = session_id
+        self.username = username
+        self.resume_path = resume_path
+        self.processed_jobs_file_path = processed_jobs_file_path
+        # The run's keyword, location, filters, ... (never the password)
+        self.settings = settings if settings is not None else {}
+        self.driver = None
+        self.proxy_key = (None, None)
+        self.automation = None
+        self.thread = None
+        self.result = None
+        self.created_at = datetime.now().isoformat()
+        self.finished_at = None
+        self.stream = StatusStream({
+            "session_id": session_id,
+            "status": "initializing",
+            "message": "",
+            "jobs_processed": 0,
+            "applications_submitted": 0,
+            "version": 0
+        })
+        # Versioned; every update is also buffered in the stream for /api/status/stream
+        self.status = self.stream.status
+
+    def status_callback(self, status):
+        """Callback function to update this session's status."""
+        self.stream.publish(status)
+        log(f"[{self.session_id}] [{status.get('status', '').upper()}] {status.get('message', '')}")
+
+    def is_active(self):
+        return self.finished_at is None
+
+    def stop(self):
+        """Ask the run to stop after the job it is working on."""
+        if self.automation:
+            self.automation.stop()
+        self.status_callback({"status": "stopping", "message": "Stopping after the current job..."})
+
+    def summary(self):
+        return {
+            "session_id": self.session_id,
+            "username": self.username,
+            "resume_path": self.resume_path,
+            "processed_jobs_file_path": self.processed_jobs_file_path,
+            "settings": self.settings,
+            "created_at": self.created_at,
+            "finished_at": self.finished_at,
+            "active": self.is_active(),
+            "network": (self.result or {}).get("network"),
+            "status": self.status
+        }
+
+class SessionManager:
+    """Runs several DiceAutomation sessions at once, up to a concurrency cap.
+
+    Sessions count against the cap from `reserve` until their run thread
+    finishes, including the time spent logging in.
+    """
+
+    def __init__(self, max_concurrent=None, driver_pool=None):
+        self.max_concurrent = max_concurrent or SESSION_SETTINGS.get("max_concurrent", 3)
+        self.driver_pool = driver_pool if driver_pool is not None else DriverPool()
+        self.sessions = {}
+        self.latest_session_id = None
+        self.lock = threading.Lock()
+
+    def active_sessions(self):
+        return [session for session in self.sessions.values() if session.is_active()]
+
+    def reserve(self, username, resume_path, processed_jobs_file_path, settings=None):
+        """Register a new session. Raises SessionLimitError when the cap is reached."""
+        with self.lock:
+            active = self.active_sessions()
+            if len(active) >= self.max_concurrent:
+                raise SessionLimitError(f"{len(active)} sessions are already running (limit {self.max_concurrent}).")
+            for session in active:
+                if os.path.abspath(session.processed_jobs_file_path) == os.path.abspath(processed_jobs_file_path):
+                    raise SessionLimitError(f"A session for {username} is already running ({session.session_id}).")
+            session = AutomationSession(uuid.uuid4().hex[:12], username, resume_path, processed_jobs_file_path, settings)
+            self.sessions[session.session_id] = session
+            self.latest_session_id = session.session_id
+            return session
+
+    def start(self, session, username, password, keyword, location, max_applications, filters=None,
+              proxy=None, proxy_auth=None, start_page=1, harvest=True):
+        """Open a browser, log in and start the run thread.
+
+        Returns None on success or an error message; a session that fails to
+        start is marked finished so it no longer counts against the cap.
+        """
+        session.proxy_key = (proxy, proxy_auth)
+        try:
+            driver, wait = self.driver_pool.acquire(proxy, proxy_auth)
+            if driver is None:
+                return self.finish(session, "error", "Could not start the browser.")
+            session.driver = driver
+            session.automation = DiceAutomation(
+                driver=driver,
+                wait=wait,
+                username=username,
+                password=password,
+                keyword=keyword,
+                location=location,
+                max_applications=max_applications,
+                filters=filters,
+                status_callback=session.status_callback,
+                processed_jobs_file_path=session.processed_jobs_file_path,
+                start_page=start_page,
+                proxy=proxy,
+                proxy_auth=proxy_auth,
+                harvest=harvest,
+                driver_factory=lambda: self.driver_pool.acquire(proxy, proxy_auth),
+                driver_release=lambda worker_driver: self.driver_pool.release(worker_driver, proxy, proxy_auth),
+                resume_path=session.resume_path
+            )
+            if not session.automation.login():
+                return self.finish(session, "error", "Invalid credentials. Please check your username and password.")
+        except Exception as e:
+            return self.finish(session, "error", f"Error starting automation: {e}")
+
+        session.thread = threading.Thread(target=self.run_session, args=(session,), daemon=True)
+        session.thread.start()
+        return None
+
+    def run_session(self, session):
+        try:
+            log(f"[{session.session_id}] Starting automation with filters: {session.settings.get('filters')}")
+            session.result = session.automation.run()
+            if session.automation.stop_event.is_set():
+                session.status_callback({"status": "stopped", "message": "Automation stopped."})
+        except Exception as e:
+            log(f"[{session.session_id}] Error in automation thread: {e}", "ERROR", "❌")
+            session.status_callback({"status": "error", "message": str(e)})
+        finally:
+            self.finish(session)
+
+    def finish(self, session, status=None, message=None):
+        if status:
+            session.status_callback({"status": status, "message": message or ""})
+        if session.driver:
+            self.driver_pool.release(session.driver, *session.proxy_key)
+            session.driver = None
+        session.finished_at = datetime.now().isoformat()
+        session.stream.close()
+        return message
+
+    def get(self, session_id):
+        return self.sessions.get(session_id)
+
+    def latest(self):
+        return self.sessions.get(self.latest_session_id) if self.latest_session_id else None
+
+    def list(self):
+        with self.lock:
+            sessions = list(self.sessions.values())
+        return [session.summary() for session in sessions]
+
+    def network_by_proxy(self):
+        """Bytes transferred per proxy, summed over the finished sessions."""
+        totals = {}
+        for session in list(self.sessions.values()):
+            network = (session.result or {}).get("network") or {}
+            for proxy, received in network.get("by_proxy", {}).items():
+                totals[proxy] = totals.get(proxy, 0) + received
+        return totals
+
+    def stop(self, session_id):
+        """Stop a running session. Returns False if there is no such active session."""
+        session = self.get(session_id)
+        if session is None or not session.is_active():
+            return False
+        session.stop()
+        return True
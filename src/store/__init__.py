@@ -0,0 +1,76 @@
+import os
+import threading
+
+from config import HISTORY_SETTINGS, QUEUE_SETTINGS
+from .base import ProcessedJobStore
+from .cache import CachedHistoryView
+from .json_store import JsonJobStore
+from .journal_store import JournalJobStore
+from .sqlite_store import SQLiteJobStore
+from .query import JobQuery, InvalidQueryError
+from .export import EXPORT_FORMATS
+from .shared_index import SharedJobIndex
+from .job_queue import JobQueue
+
+_stores = {}
+_views = {}
+_queues = {}
+_shared_index = None
+_stores_lock = threading.Lock()
+
+def open_store(file_path, backend=None):
+    """Return the shared store for a processed job history path.
+
+    `file_path` is the legacy JSON path (e.g. logs/processed_job_summary_list_<user>.json);
+    other backends derive their own file name from it. Stores are shared per
+    path so the automation thread and the Flask handlers use the same instance.
+    """
+    backend = backend or HISTORY_SETTINGS.get("backend", "sqlite")
+
+    with _stores_lock:
+        key = (os.path.abspath(file_path), backend)
+        if key not in _stores:
+            if backend == "sqlite":
+                db_path = os.path.splitext(file_path)[0] + ".db"
+                _stores[key] = SQLiteJobStore(db_path, legacy_json_path=file_path)
+            elif backend == "journal":
+                _stores[key] = JournalJobStore(
+                    file_path, compact_bytes=HISTORY_SETTINGS.get("journal_compact_bytes", 4 * 1024 * 1024)
+                )
+            elif backend == "json":
+                _stores[key] = JsonJobStore(file_path)
+            else:
+                raise ValueError(f"Unknown history backend: {backend}")
+        return _stores[key]
+
+def open_history_view(file_path, backend=None):
+    """Return the process-wide cached view of the store for `file_path`."""
+    store = open_store(file_path, backend)
+    with _stores_lock:
+        if store not in _views:
+            _views[store] = CachedHistoryView(store)
+        return _views[store]
+
+def open_shared_index():
+    """Return the cross-account job facts index, or None if it is disabled in config."""
+    global _shared_index
+    if not HISTORY_SETTINGS.get("shared_index", False):
+        return None
+    with _stores_lock:
+        if _shared_index is None:
+            _shared_index = SharedJobIndex(
+                HISTORY_SETTINGS.get("shared_index_path", "logs/shared_job_facts.db"),
+                max_age_days=HISTORY_SETTINGS.get("shared_index_max_age_days", 30)
+            )
+        return _shared_index
+
+def open_job_queue(file_path):
+    """Return the shared apply queue that belongs to the history at `file_path`."""
+    with _stores_lock:
+        key = os.path.abspath(file_path)
+        if key not in _queues:
+            _queues[key] = JobQueue(
+                os.path.splitext(file_path)[0] + "_queue.db",
+                max_attempts=QUEUE_SETTINGS.get("max_attempts", 3)
+            )
+        return _queues[key]
@@ -0,0 +1,56 @@
+import threading
+
+class ProcessedJobStore:
+    """Interface shared by the processed job history backends.
+
+    A store holds one account's job summaries (the dicts built by
+    `DiceAutomation.run`) and identifies them with `src.utils.job_index`.
+    """
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.write_count = 0
+
+    def version(self):
+        """Return a value that changes whenever the stored history changes."""
+        return self.write_count
+
+    def find(self, job_summary):
+        """Return the stored summary matching `job_summary`, or None."""
+        raise NotImplementedError
+
+    def contains(self, job_summary):
+        return self.find(job_summary) is not None
+
+    def upsert(self, job_summary):
+        """Insert or replace a job summary. Returns True if an existing job was replaced."""
+        raise NotImplementedError
+
+    def mark_applied(self, job_summary):
+        """Set apply_status of a stored job. Returns False if the job is unknown."""
+        with self.lock:
+            stored = self.find(job_summary)
+            if stored is None:
+                return False
+            stored = dict(stored)
+            stored["apply_status"] = True
+            self.upsert(stored)
+            return True
+
+    def all(self):
+        """Return every stored job summary in insertion order."""
+        raise NotImplementedError
+
+    def query(self, job_query):
+        """Return one page of jobs matching a `JobQuery` plus the matched and total counts."""
+        jobs = self.all()
+        page, matched = job_query.apply(jobs)
+        return {"jobs": page, "total": matched, "total_all": len(jobs)}
+
+    def iter_jobs(self, job_query):
+        """Yield the jobs matching a `JobQuery`, e.g. one built with paginate=False for exports."""
+        jobs, _ = job_query.apply(self.all())
+        yield from jobs
+
+    def close(self):
+        pass
@@ -0,0 +1,37 @@
+from ..utils.job_index import ProcessedJobIndex
+
+class CachedHistoryView:
+    """In-memory view of a store for the per-card checks in the run loop.
+
+    The history is loaded once and reloaded only when `store.version()`
+    changes behind the view's back, e.g. when the dashboard marks a job
+    applied. Writes made through the view update it in place instead.
+    """
+
+    def __init__(self, store):
+        self.store = store
+        self.index = None
+        self.seen_version = None
+
+    def refresh(self):
+        with self.store.lock:
+            version = self.store.version()
+            if self.index is None or version != self.seen_version:
+                self.index = ProcessedJobIndex(self.store.all())
+                self.seen_version = version
+            return self.index
+
+    def find(self, job_summary):
+        return self.refresh().get(job_summary)
+
+    def contains(self, job_summary):
+        return self.find(job_summary) is not None
+
+    def upsert(self, job_summary):
+        with self.store.lock:
+            up_to_date = self.index is not None and self.store.version() == self.seen_version
+            updated = self.store.upsert(job_summary)
+            if up_to_date:
+                self.index.add(job_summary)
+                self.seen_version = self.store.version()
+            return updated
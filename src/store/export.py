@@ -0,0 +1,49 @@
+import csv
+import io
+import json
+
+from ..utils.job_index import get_summary_job_id
+
+EXPORT_COLUMNS = (
+    "job_id", "card_title", "company_name", "location", "employment_type",
+    "card_summary", "apply_status", "publish_date", "applied_date", "job_url",
+)
+
+def export_value(job, column):
+    if column == "job_id":
+        # Legacy summaries have no job_id field; it comes from their URL
+        return get_summary_job_id(job) or ""
+    if column == "apply_status":
+        return job.get("apply_status", True)
+    return job.get(column, "")
+
+def iter_csv(jobs, rows_per_chunk=500):
+    """Yield CSV text chunks for an iterable of job summaries."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_COLUMNS)
+    count = 0
+    for job in jobs:
+        writer.writerow([export_value(job, column) for column in EXPORT_COLUMNS])
+        count += 1
+        if count % rows_per_chunk == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate(0)
+    yield buffer.getvalue()
+
+def iter_ndjson(jobs, rows_per_chunk=500):
+    """Yield NDJSON text chunks (one job summary per line)."""
+    lines = []
+    for job in jobs:
+        lines.append(json.dumps(job) + "\n")
+        if len(lines) >= rows_per_chunk:
+            yield "".join(lines)
+            lines = []
+    if lines:
+        yield "".join(lines)
+
+EXPORT_FORMATS = {
+    "csv": (iter_csv, "text/csv"),
+    "ndjson": (iter_ndjson, "application/x-ndjson"),
+}
@@ -0,0 +1,118 @@
+import os, json
+import sqlite3
+import threading
+from datetime import datetime
+
+# Queue item states
+PENDING = "pending"
+IN_PROGRESS = "in_progress"
+DONE = "done"
+FAILED = "failed"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS job_queue (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    job_url TEXT NOT NULL UNIQUE,
+    job_id TEXT,
+    page INTEGER,
+    state TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    result TEXT,
+    summary TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_job_queue_state ON job_queue (state, id);
+"""
+
+class JobQueue:
+    """Durable queue of jobs waiting to be applied to, kept in SQLite.
+
+    The harvest stage `put`s job summaries found on result pages; the apply
+    stage `claim`s them one at a time and marks each `complete` or `fail`.
+    Items survive restarts: anything still in progress when the process
+    stopped goes back to pending when the queue is opened again, so a run
+    can be re-driven from the queue alone.
+    """
+
+    def __init__(self, db_path, max_attempts=3):
+        self.db_path = db_path
+        self.max_attempts = max_attempts
+        self.lock = threading.RLock()
+        os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+        # Shared by the harvest and apply stages, which may run on different threads
+        self.conn = sqlite3.connect(db_path, timeout=30, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        with self.lock, self.conn:
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.executescript(SCHEMA)
+            self.conn.execute(
+                "UPDATE job_queue SET state = ? WHERE state = ?", (PENDING, IN_PROGRESS)
+            )
+
+    def put(self, job_summary, page=None):
+        """Queue a job summary (it must have a job_url). Returns False if the URL was already queued."""
+        now = datetime.now().isoformat()
+        with self.lock, self.conn:
+            cursor = self.conn.execute(
+                "INSERT OR IGNORE INTO job_queue (job_url, job_id, page, summary, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (job_summary["job_url"], job_summary.get("job_id"), page, json.dumps(job_summary), now, now)
+            )
+            return cursor.rowcount > 0
+
+    def claim(self):
+        """Take the oldest pending item and mark it in progress. Returns a dict or None."""
+        with self.lock, self.conn:
+            row = self.conn.execute(
+                "SELECT id, job_url, page, attempts, summary FROM job_queue WHERE state = ? ORDER BY id LIMIT 1",
+                (PENDING,)
+            ).fetchone()
+            if row is None:
+                return None
+            self.conn.execute(
+                "UPDATE job_queue SET state = ?, attempts = attempts + 1, updated_at = ? WHERE id = ?",
+                (IN_PROGRESS, datetime.now().isoformat(), row["id"])
+            )
+        return {
+            "id": row["id"],
+            "job_url": row["job_url"],
+            "page": row["page"],
+            "attempts": row["attempts"] + 1,
+            "summary": json.loads(row["summary"]),
+        }
+
+    def complete(self, item_id, result):
+        self._finish(item_id, DONE, result)
+
+    def fail(self, item_id, error):
+        """Put a failed item back to pending, or mark it failed after max_attempts."""
+        with self.lock:
+            row = self.conn.execute("SELECT attempts FROM job_queue WHERE id = ?", (item_id,)).fetchone()
+            state = FAILED if row is None or row["attempts"] >= self.max_attempts else PENDING
+            self._finish(item_id, state, error)
+
+    def _finish(self, item_id, state, result):
+        with self.lock, self.conn:
+            self.conn.execute(
+                "UPDATE job_queue SET state = ?, result = ?, updated_at = ? WHERE id = ?",
+                (state, result, datetime.now().isoformat(), item_id)
+            )
+
+    def pending_count(self):
+        with self.lock:
+            return self.conn.execute(
+                "SELECT COUNT(*) FROM job_queue WHERE state = ?", (PENDING,)
+            ).fetchone()[0]
+
+    def counts(self):
+        """Return the number of items in each state."""
+        with self.lock:
+            rows = self.conn.execute("SELECT state, COUNT(*) FROM job_queue GROUP BY state").fetchall()
+        counts = {PENDING: 0, IN_PROGRESS: 0, DONE: 0, FAILED: 0}
+        counts.update({state: count for state, count in rows})
+        return counts
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
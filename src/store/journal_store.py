@@ -0,0 +1,179 @@
+import os, json
+import threading
+
+from .base import ProcessedJobStore
+from .json_store import JsonJobStore
+from ..utils.job_index import ProcessedJobIndex
+from ..utils.file_io import FileLock, atomic_write_json
+
+class JournalJobStore(ProcessedJobStore):
+    """Processed job history kept as a JSON snapshot plus an append-only NDJSON journal.
+
+    Every added or updated job appends one line to the journal, so a write
+    costs the same no matter how long the history is. On open the snapshot
+    and journal are replayed into memory. Once the journal grows past
+    `compact_bytes` a background thread folds it into a new snapshot.
+
+    Several processes may share one history: under the file lock each one
+    first replays the journal lines others appended since its last read
+    (and reloads everything when another process rotated the journal)
+    before it appends. Snapshots are built from the files on disk, never
+    from one process's memory. Reads only replay the new journal lines and
+    do not take the file lock unless the journal was rotated.
+    """
+
+    def __init__(self, file_path, compact_bytes=4 * 1024 * 1024):
+        super().__init__()
+        base_path = os.path.splitext(file_path)[0]
+        self.legacy_json_path = file_path
+        self.snapshot_path = base_path + ".snapshot.json"
+        self.journal_path = base_path + ".journal.ndjson"
+        self.compacting_path = self.journal_path + ".compacting"
+        self.lock_path = base_path + ".journal.lock"
+        self.compact_bytes = compact_bytes
+        # Journal size that triggers the next compaction; pushed back when the rotation fails
+        self.compact_at = compact_bytes
+        self.compaction_thread = None
+        self.file_lock = FileLock(self.lock_path)
+        self.journal = None
+        self.journal_offset = 0
+        os.makedirs(os.path.dirname(file_path) or ".", exist_ok=True)
+        with self.lock, self.file_lock:
+            self.reload()
+
+    def load_snapshot(self):
+        if os.path.exists(self.snapshot_path):
+            return JsonJobStore(self.snapshot_path).load()
+        # No snapshot yet: start from the legacy JSON history, if any
+        return JsonJobStore(self.legacy_json_path).load()
+
+    @staticmethod
+    def read_journal(journal_path, offset=0):
+        """Yield (job, end_offset) for every complete journal line after `offset`."""
+        if not os.path.exists(journal_path):
+            return
+        with open(journal_path, "rb") as file:
+            file.seek(offset)
+            for line in file:
+                if not line.endswith(b"\n"):
+                    # A crash mid-append can leave a partial last line
+                    break
+                offset += len(line)
+                try:
+                    yield json.loads(line)["job"], offset
+                except (json.JSONDecodeError, KeyError):
+                    continue
+
+    def load_from_disk(self):
+        """Return the index of the snapshot plus both journals, as currently on disk."""
+        index = ProcessedJobIndex(self.load_snapshot())
+        # A journal left over from an interrupted compaction is older than the current one
+        for job_summary, _ in self.read_journal(self.compacting_path):
+            index.add(job_summary)
+        return index
+
+    def reload(self):
+        """Rebuild the index from disk and reopen the journal. Call with the file lock held."""
+        if self.journal:
+            self.journal.close()
+        self.index = self.load_from_disk()
+        self.journal_offset = 0
+        for job_summary, offset in self.read_journal(self.journal_path):
+            self.index.add(job_summary)
+            self.journal_offset = offset
+        self.journal = open(self.journal_path, "ab")
+
+    def sync(self, locked=True):
+        """Catch up with lines other processes appended.
+
+        With `locked` the caller holds the file lock, and a torn last line
+        left by a crashed writer is cut off before anything is appended after
+        it. Without it only complete lines are read, and the file lock is
+        taken only to reload after a rotation.
+        """
+        try:
+            rotated = os.stat(self.journal_path).st_ino != os.fstat(self.journal.fileno()).st_ino
+        except FileNotFoundError:
+            rotated = True
+        if rotated:
+            # Another process compacted: our handle points at the old journal
+            if locked:
+                self.reload()
+            else:
+                with self.file_lock:
+                    self.reload()
+            self.write_count += 1
+        else:
+            caught_up = False
+            for job_summary, offset in self.read_journal(self.journal_path, self.journal_offset):
+                self.index.add(job_summary)
+                self.journal_offset = offset
+                caught_up = True
+            if caught_up:
+                # Let cached views notice the other processes' records
+                self.write_count += 1
+        if locked and os.fstat(self.journal.fileno()).st_size > self.journal_offset:
+            self.journal.truncate(self.journal_offset)
+
+    def find(self, job_summary):
+        with self.lock:
+            return self.index.get(job_summary)
+
+    def upsert(self, job_summary):
+        with self.lock, self.file_lock:
+            self.sync()
+            updated = self.index.add(job_summary)
+            self.write_count += 1
+            self.journal.write((json.dumps({"op": "upsert", "job": job_summary}) + "\n").encode())
+            self.journal.flush()
+            self.journal_offset = self.journal.tell()
+            if self.journal_offset >= self.compact_at:
+                self.start_compaction()
+        return updated
+
+    def all(self):
+        with self.lock:
+            self.sync(locked=False)
+            return list(self.index.jobs)
+
+    def start_compaction(self):
+        """Rotate the journal and write a new snapshot in a background thread."""
+        with self.lock, self.file_lock:
+            if self.compaction_thread and self.compaction_thread.is_alive():
+                return
+            self.sync()
+            if not os.path.exists(self.compacting_path):
+                self.journal.close()
+                try:
+                    os.replace(self.journal_path, self.compacting_path)
+                except PermissionError:
+                    # Windows refuses the rename while another process has the journal open;
+                    # keep appending and try again once the journal has grown further
+                    self.journal = open(self.journal_path, "ab")
+                    self.compact_at = self.journal_offset + self.compact_bytes
+                    return
+                self.journal = open(self.journal_path, "ab")
+                self.journal_offset = 0
+                self.compact_at = self.compact_bytes
+            # Otherwise the previous compaction did not finish; this one includes it
+            self.compaction_thread = threading.Thread(target=self._write_snapshot)
+            self.compaction_thread.daemon = True
+            self.compaction_thread.start()
+
+    def _write_snapshot(self):
+        # A lock of its own: FileLock only counts re-entries, it does not tell threads apart
+        with FileLock(self.lock_path):
+            if not os.path.exists(self.compacting_path):
+                # Another process finished this compaction first
+                return
+            index = self.load_from_disk()
+            atomic_write_json(self.snapshot_path, index.jobs)
+            os.remove(self.compacting_path)
+
+    def close(self):
+        with self.lock:
+            thread = self.compaction_thread
+        if thread:
+            thread.join()
+        with self.lock:
+            self.journal.close()
@@ -0,0 +1,82 @@
+import os, json
+
+from .base import ProcessedJobStore
+from ..utils.job_index import ProcessedJobIndex
+from ..utils.file_io import FileLock, atomic_write_json
+
+class JsonJobStore(ProcessedJobStore):
+    """Processed job history kept as a single JSON list (the original file format).
+
+    Writes replace the file atomically under an inter-process file lock.
+    Readers get the last published snapshot without waiting for a write.
+    """
+
+    def __init__(self, file_path):
+        super().__init__()
+        self.file_path = file_path
+        self.cached_index = None
+        self.cached_stat = None
+        self.file_lock = FileLock(file_path + ".lock")
+        # (file stat, jobs) published after every load or write, read without the lock
+        self.snapshot = None
+
+    def file_stat(self):
+        try:
+            stat = os.stat(self.file_path)
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def version(self):
+        return (self.write_count, self.file_stat())
+
+    def load(self):
+        os.makedirs(os.path.dirname(self.file_path) or ".", exist_ok=True)
+
+        if os.path.exists(self.file_path):
+            with open(self.file_path, "r") as file:
+                try:
+                    return json.load(file)
+                except json.JSONDecodeError:
+                    return []
+        return []
+
+    def save(self, job_list):
+        atomic_write_json(self.file_path, job_list, indent=4)
+
+    def load_index(self):
+        """Return the parsed history, re-reading the file only if it changed on disk."""
+        stat = self.file_stat()
+        if self.cached_index is None or stat != self.cached_stat:
+            self.cached_index = ProcessedJobIndex(self.load())
+            self.cached_stat = stat
+            self.snapshot = (stat, tuple(self.cached_index.jobs))
+        return self.cached_index
+
+    def find(self, job_summary):
+        with self.lock:
+            return self.load_index().get(job_summary)
+
+    def upsert(self, job_summary):
+        with self.lock, self.file_lock:
+            # load_index re-reads if another process changed the file
+            processed_job_index = self.load_index()
+            updated = processed_job_index.add(job_summary)
+            self.save(processed_job_index.jobs)
+            self.cached_stat = self.file_stat()
+            self.snapshot = (self.cached_stat, tuple(processed_job_index.jobs))
+            self.write_count += 1
+            return updated
+
+    def mark_applied(self, job_summary):
+        # Hold the file lock across the read-modify-write so another process cannot interleave
+        with self.lock, self.file_lock:
+            return super().mark_applied(job_summary)
+
+    def all(self):
+        snapshot = self.snapshot
+        if snapshot is None or snapshot[0] != self.file_stat():
+            with self.lock:
+                self.load_index()
+                snapshot = self.snapshot
+        return list(snapshot[1])
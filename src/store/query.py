@@ -0,0 +1,97 @@
+import json
+
+SORT_FIELDS = ("publish_date", "applied_date")
+DATE_FIELDS = ("publish_date", "applied_date")
+END_OF_DAY = "T23:59:59.999Z"
+
+def parse_bool(value):
+    if value is None or value == "":
+        return None
+    if isinstance(value, bool):
+        return value
+    return str(value).lower() in ("1", "true", "yes", "applied")
+
+class InvalidQueryError(ValueError):
+    """Raised for request parameters that do not form a valid query, e.g. a non-numeric page."""
+
+def parse_positive_int(params, name, default):
+    value = params.get(name, default)
+    try:
+        number = int(value if value not in (None, "") else default)
+    except (TypeError, ValueError):
+        raise InvalidQueryError(f"{name} must be a whole number, got {value!r}")
+    if number < 1:
+        raise InvalidQueryError(f"{name} must be at least 1, got {value!r}")
+    return number
+
+def search_text(value):
+    """Text a job field is searched in; the SQLite store builds the same form with json_each."""
+    if isinstance(value, str):
+        return value
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False)
+
+class JobQuery:
+    """Filters, sort order and page of a processed job history query.
+
+    Date ranges are inclusive day ranges of "YYYY-MM-DD" strings; a range with
+    only a start date matches that single day. Without a sort field jobs are
+    returned newest first, like the dashboard always showed them.
+    """
+
+    def __init__(self, search="", date_ranges=None, apply_status=None, sort_field=None,
+                 sort_direction="desc", page=1, limit=50):
+        self.search = (search or "").strip().lower()
+        self.date_ranges = {}
+        for field, (start, end) in (date_ranges or {}).items():
+            if field in DATE_FIELDS and start:
+                self.date_ranges[field] = (start, (end or start) + END_OF_DAY)
+        self.apply_status = apply_status
+        self.sort_field = sort_field if sort_field in SORT_FIELDS else None
+        self.sort_direction = "asc" if sort_direction == "asc" else "desc"
+        self.page = max(1, int(page or 1))
+        # limit=None means no paging, e.g. for exports
+        self.limit = max(1, int(limit)) if limit else None
+
+    @classmethod
+    def from_params(cls, params, paginate=True):
+        """Build a query from request JSON or query string parameters."""
+        date_ranges = {
+            field: (params.get(f"{field}_from"), params.get(f"{field}_to"))
+            for field in DATE_FIELDS
+        }
+        return cls(
+            search=params.get("search", ""),
+            date_ranges=date_ranges,
+            apply_status=parse_bool(params.get("apply_status")),
+            sort_field=params.get("sort_field"),
+            sort_direction=params.get("sort_direction", "desc"),
+            page=parse_positive_int(params, "page", 1) if paginate else 1,
+            limit=parse_positive_int(params, "limit", 50) if paginate else None,
+        )
+
+    @property
+    def offset(self):
+        return (self.page - 1) * self.limit if self.limit else 0
+
+    def matches(self, job):
+        if self.apply_status is not None and job.get("apply_status", True) != self.apply_status:
+            return False
+        for field, (start, end) in self.date_ranges.items():
+            value = job.get(field)
+            if not value or not (start <= value <= end):
+                return False
+        if self.search:
+            return any(self.search in search_text(value).lower() for value in job.values())
+        return True
+
+    def apply(self, jobs):
+        """Filter, sort and page a list of jobs given in insertion order.
+
+        Returns the page of jobs and the number of jobs that matched.
+        """
+        matched = [job for job in reversed(jobs) if self.matches(job)]
+        if self.sort_field:
+            # Stable sort keeps newest first among equal dates; missing dates sort as oldest
+            matched.sort(key=lambda job: job.get(self.sort_field) or "", reverse=self.sort_direction == "desc")
+        end = self.offset + self.limit if self.limit else None
+        return matched[self.offset:end], len(matched)
@@ -0,0 +1,140 @@
+import os, math
+import hashlib
+import time
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+
+# Reasons that hold for every account. Others, such as an Easy Apply button
+# that did not show up in time, may be transient and are never shared.
+SHARED_SKIP_REASONS = ("not_dice", "not_easy_apply")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS job_facts (
+    job_id TEXT PRIMARY KEY,
+    skip_reason TEXT,
+    publish_date TEXT,
+    updated_at TEXT NOT NULL
+);
+"""
+
+class BloomFilter:
+    """Fixed-size Bloom filter over strings."""
+
+    def __init__(self, capacity, error_rate=0.01):
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, key):
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hash_count))
+
+    def add(self, key):
+        for position in self._positions(key):
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, key):
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+
+class SharedJobIndex:
+    """Job-level facts shared by every local account, keyed on the job-detail ID.
+
+    Facts that do not depend on the account, such as "not a Dice job" or
+    "no Easy Apply", are kept in an exact SQLite table. A Bloom filter in
+    front of it answers the common "never seen" case without a query. Once
+    another process has written to the table (PRAGMA data_version), misses
+    are looked up in the table as well, and the filter is rebuilt at most
+    every `reload_seconds`. Facts older than `max_age_days` are ignored,
+    since postings change.
+    """
+
+    def __init__(self, db_path, capacity=200000, error_rate=0.01, max_age_days=30, reload_seconds=60):
+        self.db_path = db_path
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.max_age = timedelta(days=max_age_days) if max_age_days else None
+        self.reload_seconds = reload_seconds
+        self.lock = threading.RLock()
+        os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+        self.conn = sqlite3.connect(db_path, timeout=30, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        with self.lock:
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.executescript(SCHEMA)
+        self.reload()
+
+    def data_version(self):
+        return self.conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def reload(self):
+        with self.lock:
+            self.loaded_version = self.data_version()
+            self.loaded_at = time.monotonic()
+            count = self.conn.execute("SELECT COUNT(*) FROM job_facts").fetchone()[0]
+            bloom = BloomFilter(max(self.capacity, count * 2), self.error_rate)
+            for (job_id,) in self.conn.execute("SELECT job_id FROM job_facts"):
+                bloom.add(job_id)
+            self.bloom = bloom
+            self.count = count
+
+    def get(self, job_id):
+        """Return the facts known about a job as a dict, or None."""
+        if not job_id:
+            return None
+        with self.lock:
+            if job_id not in self.bloom:
+                if self.data_version() == self.loaded_version:
+                    return None
+                if time.monotonic() - self.loaded_at >= self.reload_seconds:
+                    # Fold the other processes' jobs into the filter now and then
+                    self.reload()
+                    if job_id not in self.bloom:
+                        return None
+            row = self.conn.execute(
+                "SELECT job_id, skip_reason, publish_date, updated_at FROM job_facts WHERE job_id = ?", (job_id,)
+            ).fetchone()
+            if row is None:
+                return None
+            # Written by another process since the filter was built
+            self.bloom.add(job_id)
+        facts = dict(row)
+        if self.max_age and datetime.fromisoformat(facts.pop("updated_at")) < datetime.now() - self.max_age:
+            return None
+        return facts
+
+    def get_skip_reason(self, job_id):
+        facts = self.get(job_id)
+        return facts["skip_reason"] if facts else None
+
+    def record(self, job_id, skip_reason=None, publish_date=None):
+        """Store what was learned about a job.
+
+        A skip reason from SHARED_SKIP_REASONS is stored, None (the job was
+        applied to or found applicable) clears it, and any other reason
+        leaves the stored one alone. A None publish date keeps the known one.
+        """
+        if not job_id:
+            return
+        update_reason = skip_reason is None or skip_reason in SHARED_SKIP_REASONS
+        if not update_reason:
+            skip_reason = None
+        with self.lock, self.conn:
+            self.conn.execute(
+                "INSERT INTO job_facts (job_id, skip_reason, publish_date, updated_at) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(job_id) DO UPDATE SET "
+                "skip_reason = CASE WHEN ? THEN excluded.skip_reason ELSE skip_reason END, "
+                "publish_date = COALESCE(excluded.publish_date, publish_date), "
+                "updated_at = excluded.updated_at",
+                (job_id, skip_reason, publish_date or None, datetime.now().isoformat(), int(update_reason))
+            )
+            if job_id not in self.bloom:
+                self.bloom.add(job_id)
+                self.count += 1
+                if self.count > self.capacity:
+                    # Keep the false positive rate near error_rate as the table grows
+                    self.capacity *= 2
+                    self.reload()
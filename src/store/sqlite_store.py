@@ -0,0 +1,219 @@
+import os, json
+import sqlite3
+import threading
+
+from .base import ProcessedJobStore
+from .json_store import JsonJobStore
+from ..utils.job_index import get_summary_job_id, get_job_text_id
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS processed_jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    job_id TEXT,
+    text_key TEXT NOT NULL,
+    apply_status INTEGER NOT NULL DEFAULT 1,
+    publish_date TEXT,
+    applied_date TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_processed_jobs_job_id ON processed_jobs (job_id);
+CREATE INDEX IF NOT EXISTS idx_processed_jobs_text_key ON processed_jobs (text_key);
+CREATE INDEX IF NOT EXISTS idx_processed_jobs_apply_status ON processed_jobs (apply_status);
+CREATE INDEX IF NOT EXISTS idx_processed_jobs_publish_date ON processed_jobs (publish_date);
+CREATE INDEX IF NOT EXISTS idx_processed_jobs_applied_date ON processed_jobs (applied_date);
+CREATE TABLE IF NOT EXISTS store_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+class SQLiteJobStore(ProcessedJobStore):
+    """Processed job history kept in a SQLite database in WAL mode.
+
+    Each job is one row, so recording a job no longer rewrites the whole
+    history. Identity, apply_status and both dates are indexed columns; the
+    full summary is kept as JSON in `data`.
+
+    All writes go through one connection guarded by the store lock. Reads use
+    a connection per thread and see a consistent WAL snapshot without waiting
+    for the writer; SQLite's own locking covers other processes.
+    """
+
+    def __init__(self, db_path, legacy_json_path=None):
+        super().__init__()
+        self.db_path = db_path
+        os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+        # The writer connection is shared between the automation thread and Flask handlers
+        self.conn = self._connect(check_same_thread=False)
+        self.readers = threading.local()
+        with self.lock:
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+            self.conn.executescript(SCHEMA)
+        if legacy_json_path:
+            self.migrate_from_json(legacy_json_path)
+
+    def _connect(self, **kwargs):
+        conn = sqlite3.connect(self.db_path, timeout=30, **kwargs)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def reader(self):
+        """Return this thread's read connection."""
+        conn = getattr(self.readers, "conn", None)
+        if conn is None:
+            conn = self.readers.conn = self._connect()
+        return conn
+
+    def migrate_from_json(self, json_path):
+        """Import a legacy JSON history file once. The JSON file is left untouched."""
+        with self.lock:
+            marker = self.conn.execute(
+                "SELECT value FROM store_meta WHERE key = 'migrated_from'"
+            ).fetchone()
+            if marker or not os.path.exists(json_path):
+                return 0
+            job_list = JsonJobStore(json_path).load()
+            with self.conn:
+                for job_summary in job_list:
+                    self._upsert(job_summary)
+                self.conn.execute(
+                    "INSERT INTO store_meta (key, value) VALUES ('migrated_from', ?)", (json_path,)
+                )
+            return len(job_list)
+
+    def _find_row(self, conn, job_summary):
+        job_id = get_summary_job_id(job_summary)
+        if job_id:
+            row = conn.execute(
+                "SELECT id, job_id, data FROM processed_jobs WHERE job_id = ? LIMIT 1", (job_id,)
+            ).fetchone()
+            if row:
+                return row
+        row = conn.execute(
+            "SELECT id, job_id, data FROM processed_jobs WHERE text_key = ? ORDER BY id LIMIT 1",
+            (get_job_text_id(job_summary),)
+        ).fetchone()
+        # Do not merge two different jobs that only share the same card text
+        if row and job_id and row["job_id"] and row["job_id"] != job_id:
+            return None
+        return row
+
+    def _upsert(self, job_summary):
+        row = self._find_row(self.conn, job_summary)
+        values = (
+            get_summary_job_id(job_summary) or (row["job_id"] if row else None),
+            get_job_text_id(job_summary),
+            1 if job_summary.get("apply_status", True) else 0,
+            job_summary.get("publish_date") or None,
+            job_summary.get("applied_date") or None,
+            json.dumps(job_summary),
+        )
+        if row is None:
+            self.conn.execute(
+                "INSERT INTO processed_jobs (job_id, text_key, apply_status, publish_date, applied_date, data) "
+                "VALUES (?, ?, ?, ?, ?, ?)", values
+            )
+            return False
+        self.conn.execute(
+            "UPDATE processed_jobs SET job_id = ?, text_key = ?, apply_status = ?, publish_date = ?, "
+            "applied_date = ?, data = ? WHERE id = ?", values + (row["id"],)
+        )
+        return True
+
+    def version(self):
+        # data_version changes when another connection (e.g. another process) commits
+        with self.lock:
+            data_version = self.conn.execute("PRAGMA data_version").fetchone()[0]
+        return (self.write_count, data_version)
+
+    def find(self, job_summary):
+        row = self._find_row(self.reader(), job_summary)
+        return json.loads(row["data"]) if row else None
+
+    def upsert(self, job_summary):
+        with self.lock, self.conn:
+            self.write_count += 1
+            return self._upsert(job_summary)
+
+    def mark_applied(self, job_summary):
+        # Read and write in one transaction on the writer connection
+        with self.lock, self.conn:
+            row = self._find_row(self.conn, job_summary)
+            if row is None:
+                return False
+            stored = json.loads(row["data"])
+            stored["apply_status"] = True
+            self.write_count += 1
+            self._upsert(stored)
+            return True
+
+    def all(self):
+        rows = self.reader().execute("SELECT data FROM processed_jobs ORDER BY id").fetchall()
+        return [json.loads(row["data"]) for row in rows]
+
+    def _where(self, job_query):
+        clauses, params = [], []
+        if job_query.apply_status is not None:
+            clauses.append("apply_status = ?")
+            params.append(1 if job_query.apply_status else 0)
+        for field, (start, end) in job_query.date_ranges.items():
+            clauses.append(f"{field} BETWEEN ? AND ?")
+            params.extend((start, end))
+        if job_query.search:
+            escaped = job_query.search.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            # Match the text query.search_text gives: JSON literals for non-string values
+            clauses.append(
+                "EXISTS (SELECT 1 FROM json_each(processed_jobs.data) "
+                "WHERE (CASE json_each.type WHEN 'true' THEN 'true' WHEN 'false' THEN 'false' "
+                "WHEN 'null' THEN 'null' ELSE CAST(json_each.value AS TEXT) END) LIKE ? ESCAPE '\\')"
+            )
+            params.append(f"%{escaped}%")
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+    def _order_by(self, job_query):
+        if job_query.sort_field:
+            return f" ORDER BY {job_query.sort_field} {job_query.sort_direction.upper()}, id DESC"
+        return " ORDER BY id DESC"
+
+    def query(self, job_query):
+        where, params = self._where(job_query)
+        sql = "SELECT data FROM processed_jobs" + where + self._order_by(job_query)
+        if job_query.limit:
+            sql += " LIMIT ? OFFSET ?"
+        conn = self.reader()
+        # One read transaction so the page and both counts come from the same snapshot
+        conn.execute("BEGIN")
+        try:
+            rows = conn.execute(
+                sql, params + ([job_query.limit, job_query.offset] if job_query.limit else [])
+            ).fetchall()
+            matched = conn.execute("SELECT COUNT(*) FROM processed_jobs" + where, params).fetchone()[0]
+            total = conn.execute("SELECT COUNT(*) FROM processed_jobs").fetchone()[0]
+        finally:
+            conn.rollback()
+        return {"jobs": [json.loads(row["data"]) for row in rows], "total": matched, "total_all": total}
+
+    def iter_jobs(self, job_query, batch_size=1000):
+        # A separate connection reads a consistent WAL snapshot without holding
+        # the store lock, so a long export does not block the automation thread
+        where, params = self._where(job_query)
+        sql = "SELECT data FROM processed_jobs" + where + self._order_by(job_query)
+        if job_query.limit:
+            sql += " LIMIT ? OFFSET ?"
+            params = params + [job_query.limit, job_query.offset]
+        conn = self._connect()
+        try:
+            cursor = conn.execute(sql, params)
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                for (data,) in rows:
+                    yield json.loads(data)
+        finally:
+            conn.close()
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
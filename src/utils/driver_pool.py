@@ -0,0 +1,141 @@
+import threading
+from selenium.webdriver.support.ui import WebDriverWait
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from config import DRIVER_POOL_SETTINGS
+from .webdriver_setup import setup_driver
+
+def log(msg, level="INFO", symbol=""):
+    ts = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    prefix = f"[{ts}] [{level}]"
+    if symbol:
+        print(f"{prefix} {symbol} {msg}")
+    else:
+        print(f"{prefix} {msg}")
+
+def pool_key(proxy=None, proxy_auth=None):
+    """Browsers are interchangeable only if they use the same proxy and credentials."""
+    return (proxy or None, tuple(proxy_auth) if proxy_auth else None)
+
+class DriverPool:
+    """Keeps ready-to-use browsers (launched and stealth-patched) per proxy key.
+
+    `acquire` hands out a ready browser when there is one and falls back to
+    a cold `setup_driver` otherwise; either way the pool is topped up again
+    in the background. Returned browsers are cleaned and reused when
+    DRIVER_POOL_SETTINGS["recycle"] is set, and replaced by a fresh one
+    otherwise.
+    """
+
+    def __init__(self, settings=None, factory=setup_driver):
+        self.settings = settings if settings is not None else DRIVER_POOL_SETTINGS
+        self.size = self.settings.get("size", 1) if self.settings.get("enabled", True) else 0
+        self.recycle = self.settings.get("recycle", False)
+        self.factory = factory
+        self.ready = {}
+        self.launching = {}
+        self.lock = threading.Lock()
+        self.executor = ThreadPoolExecutor(max_workers=self.settings.get("launch_workers", 2))
+        self.closed = False
+
+    def warm(self, proxy=None, proxy_auth=None):
+        """Start filling the pool for a proxy key in the background."""
+        self._top_up(pool_key(proxy, proxy_auth))
+
+    def _top_up(self, key):
+        with self.lock:
+            if self.closed:
+                return
+            missing = self.size - len(self.ready.get(key, [])) - self.launching.get(key, 0)
+            if missing <= 0:
+                return
+            self.launching[key] = self.launching.get(key, 0) + missing
+        for _ in range(missing):
+            self.executor.submit(self._launch, key)
+
+    def _launch(self, key):
+        try:
+            driver, _ = self.factory(key[0], key[1])
+        except Exception as e:
+            driver = None
+            log(f"Could not pre-launch a browser: {e}", "WARNING", "⚠️ ")
+        with self.lock:
+            self.launching[key] -= 1
+            if driver is not None and not self.closed:
+                self.ready.setdefault(key, []).append(driver)
+                return
+        if driver is not None:
+            self._quit(driver)
+
+    def _is_alive(self, driver):
+        try:
+            driver.window_handles
+            return True
+        except Exception:
+            return False
+
+    def _quit(self, driver):
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def acquire(self, proxy=None, proxy_auth=None):
+        """Return (driver, wait) for a proxy key; (None, None) if no browser could be started."""
+        key = pool_key(proxy, proxy_auth)
+        while True:
+            with self.lock:
+                ready = self.ready.get(key)
+                driver = ready.pop(0) if ready else None
+            if driver is None or self._is_alive(driver):
+                break
+            self._quit(driver)
+        if self.size:
+            self._top_up(key)
+        if driver is not None:
+            log("Using a pre-launched browser.")
+            return driver, WebDriverWait(driver, 20)
+        return self.factory(proxy, proxy_auth)
+
+    def release(self, driver, proxy=None, proxy_auth=None):
+        """Give a browser back. It is cleaned or quit in the background."""
+        if driver is not None:
+            self.executor.submit(self._recycle, driver, pool_key(proxy, proxy_auth))
+
+    def _recycle(self, driver, key):
+        if self.recycle and not self.closed and self._reset(driver):
+            with self.lock:
+                ready = self.ready.setdefault(key, [])
+                if len(ready) < self.size:
+                    ready.append(driver)
+                    return
+        self._quit(driver)
+        self._top_up(key)
+
+    def _reset(self, driver):
+        """Remove everything the previous run left behind: extra tabs, cookies and storage."""
+        try:
+            for handle in driver.window_handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(driver.window_handles[0])
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            driver.execute_cdp_cmd("Storage.clearDataForOrigin", {
+                "origin": "https://www.dice.com",
+                "storageTypes": "all"
+            })
+            driver.get("about:blank")
+            return True
+        except Exception:
+            return False
+
+    def close(self):
+        """Quit every pooled browser."""
+        with self.lock:
+            self.closed = True
+            drivers = [driver for ready in self.ready.values() for driver in ready]
+            self.ready = {}
+        for driver in drivers:
+            self._quit(driver)
+        self.executor.shutdown(wait=False)
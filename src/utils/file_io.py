@@ -0,0 +1,93 @@
+import os, json, time
+import stat
+import tempfile
+
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None
+    import fcntl
+
+
+class FileLock:
+    """Exclusive inter-process lock held on a side file (e.g. `history.json.lock`).
+
+    Threads of one process should also hold a `threading.RLock`; this only
+    keeps separate processes from writing the same file at the same time.
+    Re-entering the lock from the thread that holds it is allowed.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.file = None
+        self.depth = 0
+
+    def __enter__(self):
+        self.depth += 1
+        if self.depth > 1:
+            return self
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self.file = open(self.path, "a+")
+        if msvcrt:
+            self.file.seek(0)
+            while True:
+                try:
+                    # LK_LOCK gives up after ~10 seconds, keep waiting for the other writer
+                    msvcrt.locking(self.file.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    continue
+        else:
+            fcntl.flock(self.file.fileno(), fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.depth -= 1
+        if self.depth > 0:
+            return
+        try:
+            if msvcrt:
+                self.file.seek(0)
+                msvcrt.locking(self.file.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(self.file.fileno(), fcntl.LOCK_UN)
+        finally:
+            self.file.close()
+            self.file = None
+
+
+def atomic_write_json(path, data, indent=None, mode=None):
+    """Write JSON to a temp file and rename it over `path`, so readers never see a partial file.
+
+    Every call gets its own temp file, so threads and processes writing the
+    same path never share one. An existing file keeps its permissions unless
+    `mode` is given; e.g. 0o600 keeps secrets private from the moment the
+    temp file is created, since mkstemp creates it readable only by its owner.
+    """
+    directory = os.path.dirname(path) or "."
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=os.path.basename(path) + ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as file:
+            json.dump(data, file, indent=indent)
+            file.flush()
+            os.fsync(file.fileno())
+        try:
+            # mkstemp creates the file 0600; keep the mode the replaced file had
+            os.chmod(temp_path, mode if mode is not None else stat.S_IMODE(os.stat(path).st_mode))
+        except FileNotFoundError:
+            pass
+        for attempt in range(5):
+            try:
+                os.replace(temp_path, path)
+                return
+            except PermissionError:
+                # Windows refuses the rename while a reader still has the file open
+                if attempt == 4:
+                    raise
+                time.sleep(0.1)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except FileNotFoundError:
+            pass
+        raise
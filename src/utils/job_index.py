@@ -0,0 +1,90 @@
+import re
+
+JOB_DETAIL_ID_PATTERN = re.compile(r"/job-detail/([^/?#]+)")
+
+# Card fields used to identify a job when its detail ID is unknown
+JOB_TEXT_FIELDS = ("card_title", "company_name", "location", "employment_type", "card_summary")
+
+
+def get_job_id(url):
+    """Extract the Dice job-detail ID from a card link or detail page URL."""
+    if not url:
+        return None
+    match = JOB_DETAIL_ID_PATTERN.search(url)
+    return match.group(1) if match else None
+
+
+def get_job_text_key(job_summary):
+    """Build the legacy 5-field text key of a job summary."""
+    return tuple(job_summary.get(field) for field in JOB_TEXT_FIELDS)
+
+
+def get_job_text_id(job_summary):
+    """Join the text key into a single string, e.g. for storage in a database column."""
+    return "\x1f".join(str(value or "") for value in get_job_text_key(job_summary))
+
+
+def get_summary_job_id(job_summary):
+    """Return the detail ID of a job summary, falling back to its job URL."""
+    return job_summary.get("job_id") or get_job_id(job_summary.get("job_url"))
+
+
+def get_job_key(job_summary):
+    """Return the stable identity of a job: its detail ID, or the text key as fallback."""
+    job_id = get_summary_job_id(job_summary)
+    if job_id:
+        return f"id:{job_id}"
+    return "text:" + get_job_text_id(job_summary)
+
+
+class ProcessedJobIndex:
+    """Hash index over a processed job summary list.
+
+    Jobs are looked up by detail ID first and by the 5-field text key as a
+    fallback, so records saved before the ID was tracked are still matched.
+    """
+
+    def __init__(self, job_list=None):
+        self.jobs = []
+        self.by_id = {}
+        self.by_text = {}
+        for job in job_list or []:
+            self.add(job)
+
+    def __len__(self):
+        return len(self.jobs)
+
+    def _index(self, position, job_summary):
+        job_id = get_summary_job_id(job_summary)
+        if job_id:
+            self.by_id[job_id] = position
+        self.by_text.setdefault(get_job_text_key(job_summary), position)
+
+    def find(self, job_summary):
+        """Return the list position of a matching job, or -1."""
+        job_id = get_summary_job_id(job_summary)
+        if job_id and job_id in self.by_id:
+            return self.by_id[job_id]
+        position = self.by_text.get(get_job_text_key(job_summary), -1)
+        if position != -1 and job_id:
+            # Do not merge two different jobs that only share the same card text
+            stored = self.jobs[position]
+            stored_id = get_summary_job_id(stored)
+            if stored_id and stored_id != job_id:
+                return -1
+        return position
+
+    def get(self, job_summary):
+        position = self.find(job_summary)
+        return self.jobs[position] if position != -1 else None
+
+    def add(self, job_summary):
+        """Insert or replace a job summary. Returns True if an existing job was replaced."""
+        position = self.find(job_summary)
+        if position == -1:
+            self.jobs.append(job_summary)
+            self._index(len(self.jobs) - 1, job_summary)
+            return False
+        self.jobs[position] = job_summary
+        self._index(position, job_summary)
+        return True
@@ -0,0 +1,305 @@
+import gzip
+import base64
+import zlib
+import json
+import threading
+import http.client
+from html.parser import HTMLParser
+from urllib.parse import urlsplit, urljoin
+from concurrent.futures import ThreadPoolExecutor
+
+from config import PROBE_SETTINGS
+from .job_index import get_job_id
+from .job_triage import is_dice_job_url
+
+# Flags in the page's embedded JSON data, read only from the object that describes this job
+EASY_APPLY_KEYS = ("isEasyApply", "easyApply")
+APPLIED_KEYS = ("isApplied", "hasApplied", "applied")
+JOB_ID_KEYS = ("id", "jobId", "guid", "jobGuid")
+JSON_SCRIPT_TYPES = ("application/json", "application/ld+json")
+MAX_REDIRECTS = 5
+
+
+class JobDetailParser(HTMLParser):
+    """Collects the job-detail facts that are present in the server-rendered HTML."""
+
+    def __init__(self):
+        super().__init__()
+        self.publish_date = None
+        self.apply_button = None
+        self.json_scripts = []
+        self.in_json_script = False
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag == "meta" and attrs.get("property") == "og:publish_date":
+            self.publish_date = attrs.get("content")
+        elif tag == "apply-button-wc" and self.apply_button is None:
+            self.apply_button = attrs
+        elif tag == "script" and (attrs.get("type") or "").lower() in JSON_SCRIPT_TYPES:
+            self.in_json_script = True
+            self.json_scripts.append("")
+
+    def handle_endtag(self, tag):
+        if tag == "script":
+            self.in_json_script = False
+
+    def handle_data(self, data):
+        if self.in_json_script:
+            self.json_scripts[-1] += data
+
+
+def find_job_data(data, job_id):
+    """Return the first dict in parsed JSON whose ID field equals `job_id`, or None."""
+    nodes = [data]
+    while nodes:
+        node = nodes.pop()
+        if isinstance(node, dict):
+            if any(str(node.get(key)) == job_id for key in JOB_ID_KEYS if key in node):
+                return node
+            nodes.extend(node.values())
+        elif isinstance(node, list):
+            nodes.extend(node)
+    return None
+
+
+def read_flag(job_data, keys):
+    for key in keys:
+        if isinstance(job_data.get(key), bool):
+            return job_data[key]
+    return None
+
+
+def parse_job_detail(html, job_id=None):
+    """Parse a job-detail page into publish_date, easy_apply and applied.
+
+    easy_apply and applied are True/False when the page states them and
+    None when it does not, in which case the browser has to decide. The
+    JSON flags are only taken from the data of `job_id`, never from e.g.
+    the recommended jobs on the same page.
+    """
+    parser = JobDetailParser()
+    try:
+        parser.feed(html)
+        parser.close()
+    except Exception:
+        pass
+
+    easy_apply = None
+    applied = None
+    job_data = None
+    if job_id:
+        for script in parser.json_scripts:
+            try:
+                job_data = find_job_data(json.loads(script), job_id)
+            except ValueError:
+                continue
+            if job_data is not None:
+                break
+    if job_data is not None:
+        easy_apply = read_flag(job_data, EASY_APPLY_KEYS)
+        applied = read_flag(job_data, APPLIED_KEYS)
+    if easy_apply is None and parser.apply_button is not None:
+        apply_type = (parser.apply_button.get("apply-type") or parser.apply_button.get("applytype") or "").lower()
+        if apply_type:
+            easy_apply = "easy" in apply_type
+    return {
+        "publish_date": parser.publish_date,
+        "easy_apply": easy_apply,
+        "applied": applied,
+    }
+
+
+class ConnectionPool:
+    """Idle keep-alive connections per (scheme, host, port), optionally through an HTTP proxy."""
+
+    def __init__(self, proxy=None, proxy_auth=None, timeout=15):
+        self.proxy = proxy
+        self.proxy_headers = {}
+        if proxy_auth:
+            credentials = base64.b64encode(f"{proxy_auth[0]}:{proxy_auth[1]}".encode()).decode()
+            self.proxy_headers["Proxy-Authorization"] = f"Basic {credentials}"
+        self.timeout = timeout
+        self.idle = {}
+        self.lock = threading.Lock()
+
+    def _connect(self, scheme, host, port):
+        connection_class = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        if not self.proxy:
+            return connection_class(host, port, timeout=self.timeout)
+        proxy_host, proxy_port = self.proxy.split(":")
+        if scheme == "https":
+            connection = connection_class(proxy_host, int(proxy_port), timeout=self.timeout)
+            connection.set_tunnel(host, port, headers=self.proxy_headers)
+            return connection
+        return http.client.HTTPConnection(proxy_host, int(proxy_port), timeout=self.timeout)
+
+    def acquire(self, scheme, host, port):
+        with self.lock:
+            connections = self.idle.get((scheme, host, port))
+            if connections:
+                return connections.pop()
+        return self._connect(scheme, host, port)
+
+    def release(self, key, connection):
+        with self.lock:
+            self.idle.setdefault(key, []).append(connection)
+
+    def request(self, url, headers):
+        """GET `url` on a pooled connection. Returns (status, headers, body bytes)."""
+        parts = urlsplit(url)
+        scheme = parts.scheme or "https"
+        port = parts.port or (443 if scheme == "https" else 80)
+        key = (scheme, parts.hostname, port)
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+        if self.proxy and scheme == "http":
+            # Plain HTTP goes to the proxy with the absolute URL
+            path = url
+            headers = dict(headers, **self.proxy_headers)
+        for attempt in range(2):
+            connection = self.acquire(*key)
+            try:
+                connection.request("GET", path, headers=headers)
+                response = connection.getresponse()
+                body = response.read()
+            except (http.client.HTTPException, OSError):
+                connection.close()
+                # A reused connection may have been closed by the server; retry once on a new one
+                if attempt:
+                    raise
+                continue
+            if response.will_close:
+                connection.close()
+            else:
+                self.release(key, connection)
+            return response.status, response.headers, body
+
+    def close(self):
+        with self.lock:
+            for connections in self.idle.values():
+                for connection in connections:
+                    connection.close()
+            self.idle = {}
+
+
+class JobProbe:
+    """Reads job-detail metadata over HTTP, without opening a browser tab.
+
+    Requests reuse the browser's cookies and user agent (see
+    `use_browser_session`) and go through the same proxy, so the probe sees
+    the page as the logged-in browser would. Each result is a dict with
+    `url`, `final_url`, `is_dice`, `job_id`, `publish_date`, `easy_apply`,
+    `applied` and `error`; `easy_apply`/`applied` are None when the page
+    does not tell, and `error` is set when the page could not be fetched
+    or turned out not to be a job-detail page.
+
+    `is_job_url` decides which URLs are job-detail pages (Dice ones by
+    default); tests pass their own to probe a local server.
+    """
+
+    def __init__(self, proxy=None, proxy_auth=None, settings=None, is_job_url=None):
+        self.settings = settings if settings is not None else PROBE_SETTINGS
+        self.is_job_url = is_job_url or is_dice_job_url
+        self.workers = self.settings.get("workers", 4)
+        self.pool = ConnectionPool(proxy, proxy_auth, timeout=self.settings.get("timeout", 15))
+        self.headers = {
+            "Accept": "text/html,application/xhtml+xml",
+            "Accept-Encoding": "gzip, deflate",
+            "Connection": "keep-alive",
+        }
+        self.cookies = {}
+        self.bytes_received = 0
+        self.requests = 0
+        self.count_lock = threading.Lock()
+
+    def use_browser_session(self, driver):
+        """Copy cookies and user agent from the WebDriver session."""
+        self.cookies = {}
+        for cookie in driver.get_cookies():
+            self.cookies.setdefault(cookie.get("domain", "").lstrip("."), {})[cookie["name"]] = cookie["value"]
+        user_agent = driver.execute_script("return navigator.userAgent")
+        if user_agent:
+            self.headers["User-Agent"] = user_agent
+
+    def _cookie_header(self, host):
+        values = {}
+        for domain, cookies in self.cookies.items():
+            if host == domain or host.endswith("." + domain):
+                values.update(cookies)
+        return "; ".join(f"{name}={value}" for name, value in values.items())
+
+    def fetch(self, url):
+        """GET a page, following redirects on the same host. Returns (final_url, status, text).
+
+        A redirect to another host is not fetched; its target is returned
+        as the final URL with the redirect status and no text.
+        """
+        for _ in range(MAX_REDIRECTS + 1):
+            headers = dict(self.headers, Host=urlsplit(url).netloc)
+            cookie = self._cookie_header(urlsplit(url).hostname or "")
+            if cookie:
+                headers["Cookie"] = cookie
+            status, response_headers, body = self.pool.request(url, headers)
+            with self.count_lock:
+                self.requests += 1
+                self.bytes_received += len(body) + sum(len(k) + len(v) + 4 for k, v in response_headers.items())
+            if status in (301, 302, 303, 307, 308) and response_headers.get("Location"):
+                location = urljoin(url, response_headers["Location"])
+                if urlsplit(location).hostname != urlsplit(url).hostname:
+                    return location, status, ""
+                url = location
+                continue
+            encoding = (response_headers.get("Content-Encoding") or "").lower()
+            if encoding == "gzip":
+                body = gzip.decompress(body)
+            elif encoding == "deflate":
+                body = zlib.decompress(body)
+            charset = response_headers.get_content_charset() or "utf-8"
+            return url, status, body.decode(charset, errors="replace")
+        raise Exception(f"Too many redirects for {url}")
+
+    def probe(self, url):
+        result = {
+            "url": url,
+            "final_url": url,
+            "is_dice": self.is_job_url(url),
+            "job_id": get_job_id(url),
+            "publish_date": None,
+            "easy_apply": None,
+            "applied": None,
+            "error": None,
+        }
+        try:
+            final_url, status, html = self.fetch(url)
+        except Exception as e:
+            result["error"] = str(e)
+            return result
+        result["final_url"] = final_url
+        if urlsplit(final_url).hostname != urlsplit(url).hostname:
+            # Redirected to another site: the job is not applied to on Dice
+            result["is_dice"] = False
+            return result
+        if not self.is_job_url(final_url):
+            # A login page, bot check, ... on the same site says nothing about the job
+            result["error"] = f"Redirected to {final_url}"
+            return result
+        result["is_dice"] = True
+        result["job_id"] = get_job_id(final_url) or result["job_id"]
+        if status != 200:
+            result["error"] = f"HTTP {status}"
+            return result
+        result.update(parse_job_detail(html, result["job_id"]))
+        return result
+
+    def probe_many(self, urls):
+        """Probe several job URLs concurrently. Returns a dict keyed by URL."""
+        urls = list(dict.fromkeys(url for url in urls if url))
+        if not urls:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(self.workers, len(urls))) as executor:
+            return dict(zip(urls, executor.map(self.probe, urls)))
+
+    def close(self):
+        self.pool.close()
@@ -0,0 +1,83 @@
+from selenium.common.exceptions import WebDriverException, NoSuchWindowException
+
+from config import QUEUE_SETTINGS
+from .network import apply_blocking
+
+JOB_TAB_MODES = ("worker", "results", "new")
+
+class JobTabs:
+    """Opens job-detail pages in one browser according to QUEUE_SETTINGS["job_tab"].
+
+    "worker" keeps one extra tab open and navigates it from job to job, so the
+    results tab keeps its page and scroll position. "results" opens jobs in
+    the results tab itself and goes back to the cached results URL (and
+    scroll position) only when the results are needed again. "new" opens and
+    closes a tab per job.
+    """
+
+    def __init__(self, driver, mode=None):
+        mode = mode or QUEUE_SETTINGS.get("job_tab", "worker")
+        if mode not in JOB_TAB_MODES:
+            raise ValueError(f"Unknown job tab mode: {mode}")
+        self.driver = driver
+        self.mode = mode
+        self.home_handle = driver.current_window_handle
+        self.worker_handle = None
+        self.return_url = None
+        self.return_scroll = 0
+
+    def new_tab(self):
+        self.driver.switch_to.new_window('tab')
+        try:
+            # URL blocking is set per tab
+            apply_blocking(self.driver)
+        except WebDriverException:
+            pass
+        return self.driver.current_window_handle
+
+    def open(self, url):
+        """Navigate to a job-detail page and leave the driver on its tab."""
+        if self.mode == "worker":
+            try:
+                if self.worker_handle is None:
+                    raise NoSuchWindowException("No worker tab yet")
+                self.driver.switch_to.window(self.worker_handle)
+            except NoSuchWindowException:
+                self.worker_handle = self.new_tab()
+        elif self.mode == "results":
+            if self.return_url is None:
+                self.return_url = self.driver.current_url
+                self.return_scroll = self.driver.execute_script("return window.scrollY;") or 0
+        else:
+            self.new_tab()
+        self.driver.get(url)
+
+    def done(self):
+        """Leave the job-detail page once the apply flow is finished with it."""
+        if self.mode == "new":
+            if self.driver.current_window_handle != self.home_handle:
+                self.driver.close()
+        if self.mode != "results":
+            self.driver.switch_to.window(self.home_handle)
+
+    def restore(self):
+        """In "results" mode, go back to the results page the last job was opened from."""
+        if self.return_url is None:
+            return
+        url, scroll = self.return_url, self.return_scroll
+        self.return_url = None
+        self.driver.get(url)
+        self.driver.execute_script("window.scrollTo(0, arguments[0]);", scroll)
+
+    def close(self):
+        """Close the worker tab, if there is one."""
+        if self.worker_handle is None:
+            return
+        try:
+            if self.worker_handle in self.driver.window_handles:
+                self.driver.switch_to.window(self.worker_handle)
+                self.driver.close()
+            self.driver.switch_to.window(self.home_handle)
+        except WebDriverException:
+            pass
+        self.worker_handle = None
@@ -0,0 +1,93 @@
+import re
+from urllib.parse import urlparse
+
+# Triage decisions
+APPLY = "apply"
+ALREADY_APPLIED = "already_applied"
+SKIP = "skip"
+
+# Maximum posting age in days for the Dice posted date filter values
+POSTED_DATE_MAX_AGE = {
+    "ONE": 1,
+    "THREE": 3,
+    "SEVEN": 7,
+}
+
+POSTED_AGE_PATTERN = re.compile(r"(\d+)\s*(minute|hour|day|week|month)s?\s+ago", re.IGNORECASE)
+AGE_UNIT_DAYS = {"minute": 0, "hour": 0, "day": 1, "week": 7, "month": 30}
+
+
+def parse_posted_age(posted_text):
+    """Convert card text such as "Today" or "3 days ago" into an age in days, or None."""
+    if not posted_text:
+        return None
+    text = posted_text.strip().lower()
+    if "today" in text or "just now" in text:
+        return 0
+    if "yesterday" in text:
+        return 1
+    match = POSTED_AGE_PATTERN.search(text)
+    if match:
+        return int(match.group(1)) * AGE_UNIT_DAYS[match.group(2).lower()]
+    return None
+
+
+def is_dice_job_url(url):
+    if not url:
+        return False
+    parsed = urlparse(url)
+    return parsed.netloc.endswith("dice.com") and "/job-detail/" in parsed.path
+
+
+class JobTriage:
+    """Classifies search result cards before any detail tab is opened.
+
+    `classify` returns a (decision, reason) tuple where decision is APPLY,
+    ALREADY_APPLIED or SKIP. Only APPLY cards need to be opened.
+    """
+
+    def __init__(self, history, shared_index=None, filters=None):
+        self.history = history
+        self.shared_index = shared_index
+        self.filters = filters if filters is not None else {}
+        self.max_age = POSTED_DATE_MAX_AGE.get(self.filters.get("posted_date"))
+
+    def classify(self, card, job_summary, easy_apply_marker_seen=True):
+        """Classify one card.
+
+        `easy_apply_marker_seen` tells whether any card on the page carried an
+        Easy Apply marker; if none did, the marker selector is assumed stale
+        and a missing marker is not used as a reason to skip.
+        """
+        if card.get("is_applied"):
+            return ALREADY_APPLIED, "applied_badge"
+        if self.history.contains(job_summary):
+            return ALREADY_APPLIED, "processed"
+        if not is_dice_job_url(card.get("job_url")):
+            return SKIP, "not_dice"
+        if self.shared_index:
+            shared_skip_reason = self.shared_index.get_skip_reason(job_summary.get("job_id"))
+            if shared_skip_reason:
+                return SKIP, shared_skip_reason
+        if easy_apply_marker_seen and not card.get("is_easy_apply"):
+            return SKIP, "not_easy_apply"
+        age = parse_posted_age(card.get("posted_text"))
+        if self.max_age is not None and age is not None and age > self.max_age:
+            return SKIP, "too_old"
+        return APPLY, None
+
+    def classify_probe(self, probe_result):
+        """Re-classify an APPLY card from its job-detail probe result.
+
+        A probe that failed, or a page that does not state its Easy Apply
+        eligibility, leaves the decision to the browser.
+        """
+        if not probe_result or probe_result.get("error"):
+            return APPLY, None
+        if not probe_result.get("is_dice"):
+            return SKIP, "not_dice"
+        if probe_result.get("applied"):
+            return ALREADY_APPLIED, "probe_applied"
+        if probe_result.get("easy_apply") is False:
+            return SKIP, "not_easy_apply"
+        return APPLY, None
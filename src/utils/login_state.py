@@ -0,0 +1,87 @@
+import os, json
+import hashlib
+from datetime import datetime
+
+from config import LOGIN_SETTINGS
+from .file_io import atomic_write_json
+
+# A cheap Dice page to be on while cookies are added (they can only be set for the current domain)
+COOKIE_DOMAIN_URL = "https://www.dice.com/robots.txt"
+
+# Cookie fields accepted by driver.add_cookie
+COOKIE_FIELDS = ("name", "value", "path", "domain", "secure", "httpOnly", "expiry", "sameSite")
+
+READ_LOCAL_STORAGE_SCRIPT = """
+const items = {};
+for (let i = 0; i < window.localStorage.length; i++) {
+    const key = window.localStorage.key(i);
+    items[key] = window.localStorage.getItem(key);
+}
+return items;
+"""
+
+WRITE_LOCAL_STORAGE_SCRIPT = """
+for (const [key, value] of Object.entries(arguments[0])) {
+    window.localStorage.setItem(key, value);
+}
+"""
+
+class LoginState:
+    """Saved cookies and local storage of one account's logged-in Dice session.
+
+    `save` runs after a successful login; `restore` puts the saved state into
+    a fresh browser so the caller only has to check that it is still valid.
+    Files are named after a hash of the username and only readable by the
+    current user, since they grant access to the account.
+    """
+
+    def __init__(self, username, state_dir=None):
+        state_dir = state_dir or LOGIN_SETTINGS.get("state_dir", "logs/login_state")
+        digest = hashlib.sha256(username.strip().lower().encode()).hexdigest()[:16]
+        self.path = os.path.join(state_dir, f"{digest}.json")
+
+    def exists(self):
+        return os.path.exists(self.path)
+
+    def load(self):
+        try:
+            with open(self.path, "r") as file:
+                return json.load(file)
+        except (OSError, json.JSONDecodeError):
+            return None
+
+    def save(self, driver):
+        """Store the cookies and Dice local storage of a logged-in browser."""
+        state = {
+            "saved_at": datetime.now().isoformat(),
+            "cookies": driver.get_cookies(),
+            "local_storage": driver.execute_script(READ_LOCAL_STORAGE_SCRIPT) or {}
+        }
+        os.makedirs(os.path.dirname(self.path) or ".", mode=0o700, exist_ok=True)
+        # The temp file is private before the cookies are written to it
+        atomic_write_json(self.path, state, mode=0o600)
+
+    def restore(self, driver):
+        """Load the saved state into `driver`. Returns False if there is nothing usable to restore."""
+        state = self.load()
+        if not state or not state.get("cookies"):
+            return False
+        driver.get(COOKIE_DOMAIN_URL)
+        now = datetime.now().timestamp()
+        for cookie in state["cookies"]:
+            if cookie.get("expiry") and cookie["expiry"] < now:
+                continue
+            try:
+                driver.add_cookie({key: value for key, value in cookie.items() if key in COOKIE_FIELDS})
+            except Exception:
+                # Cookies of other domains cannot be set from a Dice page
+                pass
+        if state.get("local_storage"):
+            driver.execute_script(WRITE_LOCAL_STORAGE_SCRIPT, state["local_storage"])
+        return True
+
+    def clear(self):
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
@@ -0,0 +1,129 @@
+import json
+import threading
+
+from config import NETWORK_SETTINGS
+
+# URL patterns for the resource types a profile can block
+RESOURCE_TYPE_PATTERNS = {
+    "image": ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico", "*.avif"],
+    "font": ["*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot"],
+    "media": ["*.mp4", "*.webm", "*.mp3", "*.m3u8", "*.ogg"],
+}
+
+def network_profile(name=None):
+    """Return the blocking profile `name` (default: NETWORK_SETTINGS["profile"]) as a dict."""
+    name = name or NETWORK_SETTINGS.get("profile", "off")
+    profile = NETWORK_SETTINGS.get("profiles", {}).get(name)
+    if profile is None:
+        raise ValueError(f"Unknown network profile: {name}")
+    return profile
+
+def blocked_url_patterns(profile):
+    patterns = []
+    for resource_type in profile.get("block_types", []):
+        patterns.extend(RESOURCE_TYPE_PATTERNS.get(resource_type, []))
+    patterns.extend(f"*{host}*" for host in profile.get("block_hosts", []))
+    patterns.extend(profile.get("block_urls", []))
+    return patterns
+
+def configure_options(options, profile):
+    """Set the browser-wide parts of a profile on ChromeOptions."""
+    options.page_load_strategy = NETWORK_SETTINGS.get("page_load_strategy", "normal")
+    if "image" in profile.get("block_types", []):
+        # Applies to every tab, including ones opened later
+        options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+    if NETWORK_SETTINGS.get("track_bytes", True):
+        options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+
+def apply_blocking(driver, profile=None):
+    """Block the profile's URL patterns in the current tab. Call again for every new tab."""
+    profile = profile if profile is not None else network_profile()
+    patterns = blocked_url_patterns(profile)
+    if not patterns:
+        return
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+
+class NetworkMeter:
+    """Counts the bytes one browser transfers, split by the kind of page it was on.
+
+    Reads Network.loadingFinished events from the ChromeDriver performance
+    log. `switch(page_type)` books everything logged so far to the previous
+    page type and starts counting for the new one.
+    """
+
+    def __init__(self, driver, page_type="other"):
+        self.driver = driver
+        self.page_type = page_type
+        self.by_page_type = {}
+        self.requests = 0
+        self.blocked = 0
+        self.enabled = NETWORK_SETTINGS.get("track_bytes", True)
+
+    def collect(self):
+        if not self.enabled:
+            return
+        try:
+            entries = self.driver.get_log("performance")
+        except Exception:
+            # The driver was started without performance logging
+            self.enabled = False
+            return
+        received = 0
+        for entry in entries:
+            message = json.loads(entry["message"])["message"]
+            if message["method"] == "Network.loadingFinished":
+                received += message["params"].get("encodedDataLength", 0)
+                self.requests += 1
+            elif message["method"] == "Network.loadingFailed" and message["params"].get("blockedReason"):
+                self.blocked += 1
+        if received:
+            self.by_page_type[self.page_type] = self.by_page_type.get(self.page_type, 0) + int(received)
+
+    def switch(self, page_type):
+        self.collect()
+        self.page_type = page_type
+
+    def report(self):
+        self.collect()
+        return {
+            "bytes": sum(self.by_page_type.values()),
+            "by_page_type": dict(self.by_page_type),
+            "requests": self.requests,
+            "blocked_requests": self.blocked
+        }
+
+class NetworkUsage:
+    """Byte totals of a run, per page type and per proxy, merged from several meters."""
+
+    def __init__(self, proxy=None):
+        self.proxy = proxy or "direct"
+        self.lock = threading.Lock()
+        self.by_page_type = {}
+        self.requests = 0
+        self.blocked = 0
+
+    def add(self, page_type, received, requests=0):
+        with self.lock:
+            self.by_page_type[page_type] = self.by_page_type.get(page_type, 0) + received
+            self.requests += requests
+
+    def add_meter(self, meter):
+        report = meter.report()
+        with self.lock:
+            for page_type, received in report["by_page_type"].items():
+                self.by_page_type[page_type] = self.by_page_type.get(page_type, 0) + received
+            self.requests += report["requests"]
+            self.blocked += report["blocked_requests"]
+
+    def report(self):
+        with self.lock:
+            total = sum(self.by_page_type.values())
+            return {
+                "profile": NETWORK_SETTINGS.get("profile", "off"),
+                "total_bytes": total,
+                "by_page_type": dict(self.by_page_type),
+                "by_proxy": {self.proxy: total},
+                "requests": self.requests,
+                "blocked_requests": self.blocked
+            }
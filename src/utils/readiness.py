@@ -0,0 +1,103 @@
+import time
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.support.ui import WebDriverWait
+
+from config import PACING_SETTINGS
+
+DOM_SETTLED_SCRIPT = """
+const quietMs = arguments[0], maxMs = arguments[1];
+const done = arguments[arguments.length - 1];
+let quietTimer = null, ceilingTimer = null;
+const observer = new MutationObserver(() => {
+    clearTimeout(quietTimer);
+    quietTimer = setTimeout(() => finish(true), quietMs);
+});
+function finish(result) {
+    observer.disconnect();
+    clearTimeout(quietTimer);
+    clearTimeout(ceilingTimer);
+    done(result);
+}
+observer.observe(document, { childList: true, subtree: true, attributes: true, characterData: true });
+quietTimer = setTimeout(() => finish(true), quietMs);
+ceilingTimer = setTimeout(() => finish(false), maxMs);
+"""
+
+NETWORK_IDLE_SCRIPT = """
+const idleMs = arguments[0], maxMs = arguments[1];
+const done = arguments[arguments.length - 1];
+// The default buffer of 250 entries would make a busy page look idle once full
+performance.setResourceTimingBufferSize(100000);
+const start = performance.now();
+let lastCount = -1, lastChange = start;
+(function check() {
+    const now = performance.now();
+    const count = performance.getEntriesByType('resource').length;
+    if (count !== lastCount) {
+        lastCount = count;
+        lastChange = now;
+    }
+    if (document.readyState === 'complete' && now - lastChange >= idleMs) return done(true);
+    if (now - start >= maxMs) return done(false);
+    setTimeout(check, 100);
+})();
+"""
+
+class Readiness:
+    """Waits for concrete page conditions instead of fixed sleeps.
+
+    Every wait takes the `legacy` number of seconds the code used to sleep.
+    With PACING_SETTINGS["mode"] == "legacy" that fixed sleep is used
+    instead, so both pacings can be compared. Each wait returns True if its
+    condition was met before the ceiling in PACING_SETTINGS["max_wait"].
+    """
+
+    def __init__(self, driver, settings=None):
+        self.driver = driver
+        self.settings = settings if settings is not None else PACING_SETTINGS
+        self.legacy = self.settings.get("mode", "event") == "legacy"
+
+    def ceiling(self, step):
+        return self.settings.get("max_wait", {}).get(step, 10)
+
+    def pause(self, legacy):
+        """A pure pacing delay with no page condition behind it; skipped in event mode."""
+        if self.legacy:
+            time.sleep(legacy)
+        return True
+
+    def _run_async(self, script, *args, ceiling):
+        try:
+            self.driver.set_script_timeout(ceiling + 5)
+            return bool(self.driver.execute_async_script(script, *args))
+        except WebDriverException:
+            # Navigation or a closed window interrupts the script; nothing left to wait for here
+            return False
+
+    def dom_settled(self, legacy=2, quiet_ms=None):
+        """Wait until the document has had no DOM mutations for `quiet_ms`."""
+        if self.legacy:
+            time.sleep(legacy)
+            return True
+        quiet_ms = quiet_ms or self.settings.get("dom_quiet_ms", 300)
+        ceiling = self.ceiling("dom")
+        return self._run_async(DOM_SETTLED_SCRIPT, quiet_ms, int(ceiling * 1000), ceiling=ceiling)
+
+    def network_idle(self, legacy=2, idle_ms=None):
+        """Wait until the page is loaded and no resource has finished loading for `idle_ms`."""
+        if self.legacy:
+            time.sleep(legacy)
+            return True
+        idle_ms = idle_ms or self.settings.get("network_idle_ms", 500)
+        ceiling = self.ceiling("network")
+        return self._run_async(NETWORK_IDLE_SCRIPT, idle_ms, int(ceiling * 1000), ceiling=ceiling)
+
+    def until(self, condition, step="element", legacy=None):
+        """Wait for a WebDriverWait condition, e.g. EC.url_changes(url). Returns its result or None."""
+        if self.legacy and legacy:
+            time.sleep(legacy)
+        try:
+            return WebDriverWait(self.driver, self.ceiling(step), poll_frequency=0.1).until(condition)
+        except WebDriverException:
+            return None
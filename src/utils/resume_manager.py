@@ -0,0 +1,103 @@
+import os, json
+import hashlib
+import threading
+from datetime import datetime
+
+from config import RESUME_SETTINGS
+from .file_io import atomic_write_json
+
+_digests = {}
+_digests_lock = threading.Lock()
+
+def resume_digest(path):
+    """SHA-256 of a resume file, cached per path, size and modification time."""
+    stat = os.stat(path)
+    key = (os.path.abspath(path), stat.st_size, stat.st_mtime_ns)
+    with _digests_lock:
+        if key in _digests:
+            return _digests[key]
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(1024 * 1024), b""):
+            digest.update(chunk)
+    with _digests_lock:
+        _digests[key] = digest.hexdigest()
+    return _digests[key]
+
+class ResumeManager:
+    """Tracks which resume an account's Dice profile holds, so it is uploaded once.
+
+    After a successful replace the file's hash and name are saved per account.
+    Later applications skip the replace step while the run's resume has the
+    same hash and the page shows the same file name. The locator that found
+    each button is remembered too, so the next replace tries it first.
+    Without an account the state is only kept for the current run.
+    """
+
+    def __init__(self, resume_path, account=None, state_dir=None):
+        self.resume_path = resume_path
+        self.lock = threading.Lock()
+        self.path = None
+        if account:
+            state_dir = state_dir or RESUME_SETTINGS.get("state_dir", "logs/resume_state")
+            account_digest = hashlib.sha256(account.strip().lower().encode()).hexdigest()[:16]
+            self.path = os.path.join(state_dir, f"{account_digest}.json")
+        self.state = self.load()
+        try:
+            self.digest = resume_digest(resume_path) if resume_path else None
+        except OSError:
+            self.digest = None
+
+    def load(self):
+        if self.path:
+            try:
+                with open(self.path, "r") as file:
+                    return json.load(file)
+            except (OSError, json.JSONDecodeError):
+                pass
+        return {"uploaded": None, "locators": {}}
+
+    def save(self):
+        if not self.path:
+            return
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        atomic_write_json(self.path, self.state)
+
+    def needs_upload(self, displayed_name=None):
+        """Return False if the profile already holds this run's resume.
+
+        `displayed_name` is the file name the apply form shows, if it could
+        be read; a different name means the profile resume was changed elsewhere.
+        """
+        if not RESUME_SETTINGS.get("skip_unchanged", True) or not self.digest:
+            return True
+        with self.lock:
+            uploaded = self.state.get("uploaded")
+        if not uploaded or uploaded.get("sha256") != self.digest:
+            return True
+        if displayed_name and displayed_name.strip().lower() != uploaded.get("filename", "").lower():
+            return True
+        return False
+
+    def record_upload(self):
+        with self.lock:
+            self.state["uploaded"] = {
+                "sha256": self.digest,
+                "filename": os.path.basename(self.resume_path),
+                "uploaded_at": datetime.now().isoformat()
+            }
+            self.save()
+
+    def ordered(self, step, labels):
+        """Return `labels` with the one that worked last time for `step` first."""
+        with self.lock:
+            preferred = self.state.get("locators", {}).get(step)
+        return sorted(labels, key=lambda label: label != preferred)
+
+    def remember(self, step, label):
+        with self.lock:
+            locators = self.state.setdefault("locators", {})
+            if locators.get(step) == label:
+                return
+            locators[step] = label
+            self.save()
@@ -0,0 +1,187 @@
+import weakref
+
+from selenium.common.exceptions import WebDriverException
+
+# Injected into every document (see ShadowQuery.install). Deep selectors use ">>>"
+# to step into a shadow root, e.g. "dhi-seds-nav-header >>> a[href*='/jobs']".
+# When a root element is given, queries start inside its shadow root.
+SHADOW_QUERY_LIBRARY = r"""
+(() => {
+    if (window.__easyDiceQuery) return;
+
+    function startScope(root) {
+        if (!root) return document;
+        return root.shadowRoot || root;
+    }
+
+    function splitSelector(selector) {
+        return selector.split('>>>').map(part => part.trim()).filter(Boolean);
+    }
+
+    // Returns the scope the last part of a deep selector is matched in, or null
+    function resolveScope(parts, root) {
+        let scope = startScope(root);
+        for (const part of parts.slice(0, -1)) {
+            const host = scope.querySelector(part);
+            if (!host || !host.shadowRoot) return null;
+            scope = host.shadowRoot;
+        }
+        return scope;
+    }
+
+    function find(selector, root) {
+        const parts = splitSelector(selector);
+        const scope = resolveScope(parts, root);
+        return scope ? scope.querySelector(parts[parts.length - 1]) : null;
+    }
+
+    function click(selector, root) {
+        const element = find(selector, root);
+        if (!element) return false;
+        element.click();
+        return true;
+    }
+
+    // Calls done([label, element]) for the first of the [label, selector] candidates
+    // that matches, or done([null, null]) after timeoutMs. Earlier candidates win ties.
+    function waitFirst(candidates, timeoutMs, root, done) {
+        let observer = null, poller = null, timer = null, finished = false;
+        function finish(label, element) {
+            if (finished) return;
+            finished = true;
+            if (observer) observer.disconnect();
+            clearInterval(poller);
+            clearTimeout(timer);
+            done([label, element]);
+        }
+        function check() {
+            for (const [label, selector] of candidates) {
+                const element = find(selector, root);
+                if (element) {
+                    finish(label, element);
+                    return true;
+                }
+            }
+            return false;
+        }
+        if (check()) return;
+        timer = setTimeout(() => finish(null, null), timeoutMs);
+        observer = new MutationObserver(check);
+        const scope = startScope(root);
+        observer.observe(scope, { childList: true, subtree: true, attributes: true });
+        // Mutations inside nested shadow roots, or a shadow root being attached, are not observable from here
+        poller = setInterval(check, 100);
+    }
+
+    const hasText = (card, tag, text) => Array.from(card.querySelectorAll(tag)).some(element =>
+        Array.from(element.childNodes).some(node => node.nodeType === Node.TEXT_NODE && node.textContent.includes(text))
+    );
+    const postedPattern = /(today|yesterday|just now|\d+\s*(?:minute|hour|day|week|month)s?\s+ago)/i;
+
+    function extractCards(linkSelector, fieldSelectors) {
+        return Array.from(document.querySelectorAll(linkSelector)).map((link, index) => {
+            const card = link.parentElement;
+            const postedMatch = card ? card.innerText.match(postedPattern) : null;
+            const data = {
+                index: index,
+                job_url: link.href,
+                is_applied: card ? hasText(card, 'span', 'Applied') : false,
+                is_easy_apply: card ? hasText(card, '*', 'Easy Apply') : false,
+                posted_text: postedMatch ? postedMatch[0] : ''
+            };
+            for (const [field, selector] of Object.entries(fieldSelectors)) {
+                const element = card ? card.querySelector(selector) : null;
+                data[field] = element ? element.innerText.trim() : '';
+            }
+            return data;
+        });
+    }
+
+    Object.defineProperty(window, '__easyDiceQuery', {
+        value: { find, click, waitFirst, extractCards },
+        enumerable: false
+    });
+})();
+"""
+
+MISSING = "__easy_dice_query_missing__"
+
+CALL_SCRIPT = f"""
+const query = window.__easyDiceQuery;
+if (!query) return '{MISSING}';
+return query[arguments[0]].apply(null, Array.prototype.slice.call(arguments, 1));
+"""
+
+CALL_ASYNC_SCRIPT = f"""
+const done = arguments[arguments.length - 1];
+const query = window.__easyDiceQuery;
+if (!query) return done('{MISSING}');
+const args = Array.prototype.slice.call(arguments, 1, arguments.length - 1);
+args.push(done);
+query[arguments[0]].apply(null, args);
+"""
+
+_queries = weakref.WeakKeyDictionary()
+
+class ShadowQuery:
+    """Shadow-aware page helpers, loaded once per document instead of sent with every call.
+
+    `install` registers the helper library with CDP Page.addScriptToEvaluateOnNewDocument
+    for the current tab, so each page it loads has the helpers before its own
+    scripts run. Calls then only send a function name and arguments. A tab
+    that does not have the library yet (e.g. a newly opened one) gets it on
+    the first call.
+    """
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.installed_handles = set()
+
+    @classmethod
+    def for_driver(cls, driver):
+        """Return the ShadowQuery shared by all handlers of a driver."""
+        query = _queries.get(driver)
+        if query is None:
+            query = _queries[driver] = cls(driver)
+        return query
+
+    def install(self):
+        """Register the library for future documents of the current tab and load it into the current one."""
+        handle = self.driver.current_window_handle
+        if handle not in self.installed_handles:
+            try:
+                self.driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": SHADOW_QUERY_LIBRARY})
+                self.installed_handles.add(handle)
+            except WebDriverException:
+                pass
+        self.driver.execute_script(SHADOW_QUERY_LIBRARY)
+
+    def call(self, name, *args):
+        result = self.driver.execute_script(CALL_SCRIPT, name, *args)
+        if result == MISSING:
+            self.install()
+            result = self.driver.execute_script(CALL_SCRIPT, name, *args)
+        return result
+
+    def call_async(self, name, *args, timeout=10):
+        self.driver.set_script_timeout(timeout + 5)
+        result = self.driver.execute_async_script(CALL_ASYNC_SCRIPT, name, *args)
+        if result == MISSING:
+            self.install()
+            result = self.driver.execute_async_script(CALL_ASYNC_SCRIPT, name, *args)
+        return result
+
+    def find(self, selector, root=None):
+        """Find an element by deep selector ("host >>> inner"), starting inside root's shadow root if given."""
+        return self.call("find", selector, root)
+
+    def click(self, selector, root=None):
+        """Click an element found by deep selector. Returns False if there is none."""
+        return bool(self.call("click", selector, root))
+
+    def wait_first(self, candidates, timeout=10, root=None):
+        """Wait for the first of several (label, deep selector) candidates. Returns (label, element) or (None, None)."""
+        label, element = self.call_async(
+            "waitFirst", [list(candidate) for candidate in candidates], int(timeout * 1000), root, timeout=timeout
+        )
+        return label, element
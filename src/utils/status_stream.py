@@ -0,0 +1,71 @@
+import json
+import time
+import threading
+from collections import deque
+
+from config import SESSION_SETTINGS
+
+class StatusStream:
+    """Versioned status of one session with a bounded buffer of its recent updates.
+
+    Every `publish` merges an update into the status, bumps the version and
+    buffers a snapshot under that version as event ID. Readers ask for the
+    events after the last ID they saw, so no update is missed between two
+    reads. Updates that only change the message within `coalesce_ms` of the
+    previous one replace it in the buffer (under a new ID); changes of the
+    "status" value are always kept. A reader that fell behind the buffer gets
+    the current snapshot instead.
+    """
+
+    def __init__(self, status=None, capacity=None, coalesce_ms=None):
+        self.status = dict(status or {})
+        self.version = 0
+        self.capacity = capacity or SESSION_SETTINGS.get("status_buffer", 256)
+        self.coalesce_ms = SESSION_SETTINGS.get("status_coalesce_ms", 250) if coalesce_ms is None else coalesce_ms
+        self.events = deque(maxlen=self.capacity)
+        self.last_published = 0
+        self.evicted_up_to = 0
+        self.condition = threading.Condition()
+        self.closed = False
+
+    def publish(self, update):
+        with self.condition:
+            previous_state = self.status.get("status")
+            self.status.update(update)
+            self.version += 1
+            self.status["version"] = self.version
+            now = time.monotonic()
+            same_state = self.status.get("status") == previous_state
+            if self.events and same_state and (now - self.last_published) * 1000 < self.coalesce_ms:
+                self.events.pop()
+            elif len(self.events) == self.capacity:
+                # The oldest event is about to drop out of the buffer
+                self.evicted_up_to = self.events[0][0]
+            self.events.append((self.version, json.dumps(self.status, default=str)))
+            self.last_published = now
+            self.condition.notify_all()
+            return self.version
+
+    def close(self):
+        """Mark the stream finished; readers stop once they have the last event."""
+        with self.condition:
+            self.closed = True
+            self.condition.notify_all()
+
+    def snapshot(self):
+        with self.condition:
+            return self.version, json.dumps(self.status, default=str)
+
+    def events_since(self, last_id):
+        """Return the (id, json) events after `last_id`, or just the current snapshot if they are no longer buffered."""
+        with self.condition:
+            if last_id >= self.version:
+                return []
+            if last_id < self.evicted_up_to:
+                return [(self.version, json.dumps(self.status, default=str))]
+            return [event for event in self.events if event[0] > last_id]
+
+    def wait(self, last_id, timeout):
+        """Block until there is an event after `last_id` or the stream closes. Returns False on timeout."""
+        with self.condition:
+            return self.condition.wait_for(lambda: self.version > last_id or self.closed, timeout)
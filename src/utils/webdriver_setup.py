@@ -5,9 +5,14 @@ from selenium_stealth import stealth
 import zipfile
 import os
 import shutil
+import hashlib
+import tempfile
 import base64
 import json
 
+from .network import network_profile, configure_options, apply_blocking
+from .shadow_query import ShadowQuery
+
 def create_proxy_extension(proxy_host, proxy_port, proxy_username=None, proxy_password=None):
     """Create a Chrome extension to handle proxy with optional authentication."""
     manifest_json = """
@@ -60,18 +65,26 @@ def create_proxy_extension(proxy_host, proxy_port, proxy_username=None, proxy_pa
     );
     """
 
-    # Create a temporary directory to store the extension files
-    uploads_dir = os.path.join(os.getcwd(), 'uploads')
-    os.makedirs(uploads_dir, exist_ok=True)
-    
-    extension_dir = os.path.join(uploads_dir, 'proxy_extension')
-    os.makedirs(extension_dir, exist_ok=True)
+    # One directory per extension content, so browsers with different proxies
+    # (or launched at the same time) never rewrite each other's extension
+    digest = hashlib.sha256((manifest_json + background_js).encode()).hexdigest()[:16]
+    extensions_dir = os.path.join(os.getcwd(), 'uploads', 'proxy_extensions')
+    extension_dir = os.path.join(extensions_dir, digest)
+    if os.path.isdir(extension_dir):
+        return extension_dir
 
-    # Write manifest.json and background.js to the extension directory
-    with open(os.path.join(extension_dir, 'manifest.json'), 'w') as f:
+    # Write manifest.json and background.js to a temporary directory, then move it in place
+    os.makedirs(extensions_dir, exist_ok=True)
+    temp_dir = tempfile.mkdtemp(prefix=f'{digest}.', dir=extensions_dir)
+    with open(os.path.join(temp_dir, 'manifest.json'), 'w') as f:
         f.write(manifest_json)
-    with open(os.path.join(extension_dir, 'background.js'), 'w') as f:
+    with open(os.path.join(temp_dir, 'background.js'), 'w') as f:
         f.write(background_js)
+    try:
+        os.rename(temp_dir, extension_dir)
+    except OSError:
+        # Another launch created the same extension first
+        shutil.rmtree(temp_dir, ignore_errors=True)
 
     return extension_dir
 
@@ -95,6 +108,10 @@ def setup_driver(proxy=None, proxy_auth=None):
     options.add_argument('--log-level=3')
     options.add_experimental_option('excludeSwitches', ['enable-automation', 'enable-logging'])
 
+    # Page load strategy, image blocking and the performance log for byte counting
+    profile = network_profile()
+    configure_options(options, profile)
+
     try:
         if proxy:
             proxy_host, proxy_port = proxy.split(':')
@@ -127,6 +144,15 @@ def setup_driver(proxy=None, proxy_auth=None):
             renderer="Intel Iris OpenGL Engine",
             fix_hairline=True,
         )
+        try:
+            apply_blocking(driver, profile)
+        except WebDriverException as e:
+            print(f"Could not apply network blocking rules. Error: {e}")
+        try:
+            # Preload the page helpers for every document this tab opens
+            ShadowQuery.for_driver(driver).install()
+        except WebDriverException as e:
+            print(f"Could not preload page helpers. Error: {e}")
         # WebDriver wait instance
         wait = WebDriverWait(driver, 20)
         return driver, wait
@@ -0,0 +1,108 @@
+import os
+import sys
+import json
+import tempfile
+import threading
+import subprocess
+import unittest
+from unittest import mock
+
+from src.utils.file_io import FileLock, atomic_write_json
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Increments a counter file under the lock; without it concurrent increments get lost
+COUNTER_SCRIPT = """
+import sys
+sys.path.insert(0, sys.argv[1])
+from src.utils.file_io import FileLock
+counter_path, increments = sys.argv[2], int(sys.argv[3])
+for _ in range(increments):
+    with FileLock(counter_path + ".lock"):
+        with open(counter_path) as file:
+            value = int(file.read())
+        with open(counter_path, "w") as file:
+            file.write(str(value + 1))
+"""
+
+
+class FileLockTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def test_serializes_processes(self):
+        counter_path = os.path.join(self.directory.name, "counter")
+        with open(counter_path, "w") as file:
+            file.write("0")
+        workers = [
+            subprocess.Popen([sys.executable, "-c", COUNTER_SCRIPT, REPO_ROOT, counter_path, "100"])
+            for _ in range(4)
+        ]
+        for worker in workers:
+            self.assertEqual(worker.wait(timeout=60), 0)
+        with open(counter_path) as file:
+            self.assertEqual(int(file.read()), 400)
+
+    def test_reentrant_in_one_thread(self):
+        lock = FileLock(os.path.join(self.directory.name, "nested", "history.lock"))
+        with lock:
+            with lock:
+                self.assertEqual(lock.depth, 2)
+            self.assertIsNotNone(lock.file)
+        self.assertIsNone(lock.file)
+
+
+class AtomicWriteJsonTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.path = os.path.join(self.directory.name, "data.json")
+
+    def test_threads_writing_one_path_never_leave_a_partial_file(self):
+        errors = []
+
+        def write(thread_index):
+            try:
+                for index in range(50):
+                    atomic_write_json(self.path, {"thread": thread_index, "items": list(range(index * 20))})
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=write, args=(index,)) for index in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        with open(self.path) as file:
+            self.assertIn("thread", json.load(file))
+        self.assertEqual(os.listdir(self.directory.name), ["data.json"])
+
+    @unittest.skipIf(os.name == "nt", "POSIX permissions")
+    def test_keeps_the_mode_of_the_replaced_file(self):
+        atomic_write_json(self.path, [])
+        os.chmod(self.path, 0o640)
+        atomic_write_json(self.path, [1])
+        self.assertEqual(os.stat(self.path).st_mode & 0o777, 0o640)
+
+    @unittest.skipIf(os.name == "nt", "POSIX permissions")
+    def test_mode_applies_before_the_data_is_written(self):
+        atomic_write_json(self.path, [])
+        os.chmod(self.path, 0o644)
+        modes = []
+        real_dump = json.dump
+
+        def dump(data, file, **kwargs):
+            modes.append(os.fstat(file.fileno()).st_mode & 0o777)
+            real_dump(data, file, **kwargs)
+
+        with mock.patch("src.utils.file_io.json.dump", dump):
+            atomic_write_json(self.path, {"cookies": ["secret"]}, mode=0o600)
+        self.assertEqual(modes, [0o600])
+        self.assertEqual(os.stat(self.path).st_mode & 0o777, 0o600)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,147 @@
+import gzip
+import json
+import time
+import threading
+import unittest
+from urllib.parse import urlsplit
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+from src.utils.job_probe import JobProbe, parse_job_detail
+
+RESPONSE_DELAY = 0.3
+
+
+def job_page(job_id, easy_apply, applied=False):
+    # Recommended jobs come first and carry the opposite flags
+    data = {"props": {
+        "recommended": [{"id": "other-job", "isEasyApply": not easy_apply, "isApplied": not applied}],
+        "job": {"id": job_id, "isEasyApply": easy_apply, "isApplied": applied},
+    }}
+    return (
+        '<html><head><meta property="og:publish_date" content="2026-10-01T00:00:00Z">'
+        f'<script id="__NEXT_DATA__" type="application/json">{json.dumps(data)}</script>'
+        "</head><body></body></html>"
+    )
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def redirect(self, location):
+        self.send_response(302)
+        self.send_header("Location", location)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_GET(self):
+        self.server.cookies.append(self.headers.get("Cookie"))
+        if self.path.startswith("/old/"):
+            return self.redirect("/job-detail/" + self.path.split("/")[-1])
+        if self.path == "/job-detail/expired":
+            return self.redirect("/login?next=/job-detail/expired")
+        if self.path == "/job-detail/external":
+            return self.redirect("http://jobs.example.invalid/apply")
+        if not self.path.startswith("/job-detail/"):
+            self.send_response(200)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        time.sleep(RESPONSE_DELAY)
+        job_id = self.path.split("/")[-1]
+        body = job_page(job_id, easy_apply=job_id.startswith("easy")).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        if "gzip" in (self.headers.get("Accept-Encoding") or ""):
+            body = gzip.compress(body)
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class FakeDriver:
+    def get_cookies(self):
+        return [{"domain": ".127.0.0.1", "name": "session", "value": "abc"}]
+
+    def execute_script(self, script):
+        return "probe-test-agent"
+
+
+class JobProbeTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+        cls.server.cookies = []
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_address[1]}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.probe = JobProbe(settings={"workers": 4, "timeout": 5}, is_job_url=lambda url: "/job-detail/" in urlsplit(url).path)
+
+    def tearDown(self):
+        self.probe.close()
+
+    def test_probe_many_runs_concurrently_and_decodes_gzip(self):
+        urls = [f"{self.base_url}/job-detail/easy-{index}" for index in range(8)]
+        started = time.monotonic()
+        results = self.probe.probe_many(urls)
+        elapsed = time.monotonic() - started
+
+        self.assertLess(elapsed, len(urls) * RESPONSE_DELAY / 2)
+        for index, url in enumerate(urls):
+            result = results[url]
+            self.assertIsNone(result["error"])
+            self.assertTrue(result["is_dice"])
+            self.assertEqual(result["job_id"], f"easy-{index}")
+            self.assertEqual(result["publish_date"], "2026-10-01T00:00:00Z")
+            self.assertTrue(result["easy_apply"])
+            self.assertFalse(result["applied"])
+        self.assertLessEqual(sum(len(connections) for connections in self.probe.pool.idle.values()), 4)
+
+    def test_follows_same_host_redirect_to_job_detail(self):
+        result = self.probe.probe(f"{self.base_url}/old/plain-1")
+        self.assertEqual(result["final_url"], f"{self.base_url}/job-detail/plain-1")
+        self.assertIsNone(result["error"])
+        self.assertFalse(result["easy_apply"])
+
+    def test_same_host_redirect_elsewhere_is_an_error(self):
+        result = self.probe.probe(f"{self.base_url}/job-detail/expired")
+        self.assertIsNotNone(result["error"])
+        self.assertIsNone(result["easy_apply"])
+
+    def test_redirect_to_other_host_is_not_followed(self):
+        result = self.probe.probe(f"{self.base_url}/job-detail/external")
+        self.assertFalse(result["is_dice"])
+        self.assertIsNone(result["error"])
+        self.assertEqual(result["final_url"], "http://jobs.example.invalid/apply")
+
+    def test_browser_session_cookies_are_sent(self):
+        self.probe.use_browser_session(FakeDriver())
+        self.probe.probe(f"{self.base_url}/job-detail/easy-cookie")
+        self.assertIn("session=abc", self.server.cookies[-1])
+        self.assertEqual(self.probe.headers["User-Agent"], "probe-test-agent")
+
+
+class ParseJobDetailTest(unittest.TestCase):
+    def test_flags_are_read_from_this_jobs_data_only(self):
+        parsed = parse_job_detail(job_page("job-1", easy_apply=False, applied=True), "job-1")
+        self.assertFalse(parsed["easy_apply"])
+        self.assertTrue(parsed["applied"])
+
+    def test_flags_are_unknown_without_this_jobs_data(self):
+        parsed = parse_job_detail(job_page("job-1", easy_apply=True), "job-2")
+        self.assertIsNone(parsed["easy_apply"])
+        self.assertIsNone(parsed["applied"])
+
+
+if __name__ == "__main__":
+    unittest.main()
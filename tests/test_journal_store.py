@@ -0,0 +1,95 @@
+import os
+import json
+import tempfile
+import unittest
+from unittest import mock
+
+from src.store.journal_store import JournalJobStore
+
+
+def job(job_id, **fields):
+    return dict({"job_id": job_id, "card_title": "Developer", "apply_status": True}, **fields)
+
+
+class JournalJobStoreTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.history_path = os.path.join(self.directory.name, "processed_job_summary_list.json")
+
+    def open_store(self, **kwargs):
+        store = JournalJobStore(self.history_path, **kwargs)
+        self.addCleanup(store.close)
+        return store
+
+    def test_replays_journal_on_open(self):
+        store = self.open_store()
+        store.upsert(job("a"))
+        store.upsert(job("b"))
+        store.upsert(job("a", apply_status=False))
+        store.close()
+
+        reopened = self.open_store()
+        self.assertEqual(reopened.all(), [job("a", apply_status=False), job("b")])
+        self.assertEqual(reopened.find({"job_id": "b"}), job("b"))
+
+    def test_starts_from_legacy_json_history(self):
+        with open(self.history_path, "w") as file:
+            json.dump([job("legacy")], file)
+        store = self.open_store()
+        store.upsert(job("new"))
+        self.assertEqual([stored["job_id"] for stored in store.all()], ["legacy", "new"])
+
+    def test_torn_last_line_is_ignored_and_cut_before_the_next_append(self):
+        store = self.open_store()
+        store.upsert(job("a"))
+        store.close()
+        with open(store.journal_path, "ab") as file:
+            file.write(b'{"op": "upsert", "job": {"job_id": "to')
+
+        reopened = self.open_store()
+        self.assertEqual(reopened.all(), [job("a")])
+        reopened.upsert(job("b"))
+        reopened.close()
+
+        self.assertEqual(self.open_store().all(), [job("a"), job("b")])
+
+    def test_compaction_folds_the_journal_into_a_snapshot(self):
+        store = self.open_store(compact_bytes=2048)
+        for index in range(100):
+            store.upsert(job(f"job-{index}"))
+        store.compaction_thread.join()
+
+        self.assertTrue(os.path.exists(store.snapshot_path))
+        self.assertFalse(os.path.exists(store.compacting_path))
+        # Later upserts may start a new journal, but the compacted ones are gone from it
+        self.assertLess(len(list(store.read_journal(store.journal_path))), 100)
+        store.close()
+        self.assertEqual(len(self.open_store().all()), 100)
+
+    def test_failed_rotation_keeps_appending_and_retries_later(self):
+        store = self.open_store(compact_bytes=2048)
+        with mock.patch("src.store.journal_store.os.replace", side_effect=PermissionError):
+            for index in range(40):
+                store.upsert(job(f"job-{index}"))
+        self.assertIsNone(store.compaction_thread)
+        self.assertGreater(store.compact_at, store.compact_bytes)
+
+        for index in range(40, 100):
+            store.upsert(job(f"job-{index}"))
+        store.compaction_thread.join()
+        self.assertTrue(os.path.exists(store.snapshot_path))
+        self.assertEqual(len(store.all()), 100)
+
+    def test_reads_do_not_take_the_file_lock(self):
+        store = self.open_store()
+        store.upsert(job("a"))
+        other = self.open_store()
+        with other.file_lock:
+            with open(store.journal_path, "ab") as file:
+                file.write((json.dumps({"op": "upsert", "job": job("b")}) + "\n").encode())
+            self.assertEqual(store.all(), [job("a"), job("b")])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+import os
+import json
+import sqlite3
+import tempfile
+import unittest
+
+from src.store.sqlite_store import SQLiteJobStore
+
+JOB_URL = "https://www.dice.com/job-detail/{}?searchlink=search"
+
+
+def job(job_id=None, title="Developer", **fields):
+    summary = {
+        "card_title": title, "company_name": "Acme", "location": "Remote",
+        "employment_type": "Full-time", "card_summary": "Python", "apply_status": True,
+    }
+    if job_id:
+        summary["job_id"] = job_id
+    summary.update(fields)
+    return summary
+
+
+class SQLiteJobStoreTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.json_path = os.path.join(self.directory.name, "processed_job_summary_list.json")
+        self.db_path = os.path.join(self.directory.name, "processed_job_summary_list.db")
+
+    def open_store(self, legacy=True):
+        store = SQLiteJobStore(self.db_path, legacy_json_path=self.json_path if legacy else None)
+        self.addCleanup(store.close)
+        return store
+
+    def row_count(self):
+        with sqlite3.connect(self.db_path) as conn:
+            return conn.execute("SELECT COUNT(*) FROM processed_jobs").fetchone()[0]
+
+    def test_migrates_legacy_json_once_and_leaves_it_untouched(self):
+        legacy_jobs = [job("a"), job(title="Text only", job_url=JOB_URL.format("b")), job(title="No id at all")]
+        with open(self.json_path, "w") as file:
+            json.dump(legacy_jobs, file)
+        with open(self.json_path) as file:
+            legacy_text = file.read()
+
+        store = self.open_store()
+        self.assertEqual(store.all(), legacy_jobs)
+        store.close()
+        with open(self.json_path) as file:
+            self.assertEqual(file.read(), legacy_text)
+
+        # Jobs added to the JSON file later are not imported again
+        with open(self.json_path, "w") as file:
+            json.dump(legacy_jobs + [job("c")], file)
+        self.assertEqual(self.open_store().all(), legacy_jobs)
+        self.assertEqual(self.row_count(), 3)
+
+    def test_without_legacy_file_starts_empty(self):
+        self.assertEqual(self.open_store().all(), [])
+
+    def test_upsert_overwrites_the_same_job(self):
+        store = self.open_store(legacy=False)
+        self.assertFalse(store.upsert(job("a", apply_status=False)))
+        self.assertTrue(store.upsert(job("a", apply_status=True, applied_date="2026-10-02T00:00:00Z")))
+
+        self.assertEqual(self.row_count(), 1)
+        self.assertEqual(store.all(), [job("a", apply_status=True, applied_date="2026-10-02T00:00:00Z")])
+        with sqlite3.connect(self.db_path) as conn:
+            self.assertEqual(
+                conn.execute("SELECT apply_status, applied_date FROM processed_jobs").fetchone(),
+                (1, "2026-10-02T00:00:00Z")
+            )
+
+    def test_upsert_attaches_an_id_to_a_text_only_record(self):
+        store = self.open_store(legacy=False)
+        store.upsert(job())
+        self.assertTrue(store.upsert(job("a")))
+        self.assertEqual(self.row_count(), 1)
+        self.assertEqual(store.find({"job_id": "a"}), job("a"))
+
+    def test_jobs_with_the_same_text_but_different_ids_stay_apart(self):
+        store = self.open_store(legacy=False)
+        store.upsert(job("a"))
+        self.assertFalse(store.upsert(job("b")))
+        self.assertEqual(self.row_count(), 2)
+
+    def test_find(self):
+        store = self.open_store(legacy=False)
+        store.upsert(job("a"))
+        store.upsert(job(title="Legacy"))
+
+        self.assertEqual(store.find({"job_id": "a"}), job("a"))
+        # The ID may only be known from the card URL
+        self.assertEqual(store.find({"job_url": JOB_URL.format("a")}), job("a"))
+        # Records without an ID are matched by their card text
+        self.assertEqual(store.find(job(title="Legacy")), job(title="Legacy"))
+        self.assertIsNone(store.find({"job_id": "missing"}))
+        self.assertTrue(store.contains({"job_id": "a"}))
+
+    def test_mark_applied(self):
+        store = self.open_store(legacy=False)
+        store.upsert(job("a", apply_status=False))
+        self.assertTrue(store.mark_applied({"job_id": "a"}))
+        self.assertTrue(store.find({"job_id": "a"})["apply_status"])
+        self.assertFalse(store.mark_applied({"job_id": "missing"}))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+import os
+import sys
+import tempfile
+import threading
+import subprocess
+import unittest
+
+from src.store.json_store import JsonJobStore
+from src.store.journal_store import JournalJobStore
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+UPSERT_SCRIPT = """
+import sys
+sys.path.insert(0, sys.argv[1])
+from src.store.json_store import JsonJobStore
+from src.store.journal_store import JournalJobStore
+backend, history_path, worker, count = sys.argv[2], sys.argv[3], sys.argv[4], int(sys.argv[5])
+store = JsonJobStore(history_path) if backend == "json" else JournalJobStore(history_path, compact_bytes=4096)
+for index in range(count):
+    store.upsert({"job_id": f"{worker}-{index}", "card_title": "Developer", "apply_status": True})
+store.close()
+"""
+
+STORES = {
+    "json": JsonJobStore,
+    "journal": lambda path: JournalJobStore(path, compact_bytes=4096),
+}
+
+
+def job_ids(jobs):
+    return {job["job_id"] for job in jobs}
+
+
+class ConcurrentUpsertTest(unittest.TestCase):
+    """Writers sharing one history must not lose each other's jobs."""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.history_path = os.path.join(self.directory.name, "processed_job_summary_list.json")
+
+    def run_processes(self, backend, workers, count):
+        processes = [
+            subprocess.Popen([sys.executable, "-c", UPSERT_SCRIPT, REPO_ROOT, backend, self.history_path, f"p{worker}", str(count)])
+            for worker in range(workers)
+        ]
+        for process in processes:
+            self.assertEqual(process.wait(timeout=120), 0)
+
+    def run_threads(self, store, workers, count):
+        def upsert(worker):
+            for index in range(count):
+                store.upsert({"job_id": f"t{worker}-{index}", "card_title": "Developer", "apply_status": True})
+
+        threads = [threading.Thread(target=upsert, args=(worker,)) for worker in range(workers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    def expected(self, prefix, workers, count):
+        return {f"{prefix}{worker}-{index}" for worker in range(workers) for index in range(count)}
+
+    def test_processes(self):
+        for backend, open_store in STORES.items():
+            with self.subTest(backend=backend):
+                self.history_path = os.path.join(self.directory.name, backend, "history.json")
+                os.makedirs(os.path.dirname(self.history_path))
+                self.run_processes(backend, workers=4, count=50)
+                store = open_store(self.history_path)
+                self.assertEqual(job_ids(store.all()), self.expected("p", 4, 50))
+                store.close()
+
+    def test_threads(self):
+        for backend, open_store in STORES.items():
+            with self.subTest(backend=backend):
+                store = open_store(os.path.join(self.directory.name, backend + "-threads.json"))
+                self.run_threads(store, workers=4, count=50)
+                self.assertEqual(job_ids(store.all()), self.expected("t", 4, 50))
+                store.close()
+
+    def test_open_store_sees_other_process_writes(self):
+        for backend, open_store in STORES.items():
+            with self.subTest(backend=backend):
+                self.history_path = os.path.join(self.directory.name, backend + "-shared.json")
+                store = open_store(self.history_path)
+                store.upsert({"job_id": "local", "card_title": "Developer"})
+                self.run_processes(backend, workers=2, count=20)
+                self.assertEqual(job_ids(store.all()), self.expected("p", 2, 20) | {"local"})
+                store.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
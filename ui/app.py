@@ -1,4 +1,4 @@
-from flask import Flask, render_template, request, jsonify
+from flask import Flask, render_template, request, jsonify, Response, stream_with_context
 import socket
 from threading import Thread
 from waitress import serve
@@ -12,8 +12,10 @@ from datetime import datetime
 parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.append(parent_dir)
 
-from src.automation import DiceAutomation
-from src.utils.webdriver_setup import setup_driver
+from src.session_manager import SessionManager, SessionLimitError
+from src.store import open_store, JobQuery, InvalidQueryError, EXPORT_FORMATS
+from src.utils.resume_manager import resume_digest
+from config import UI_SETTINGS, SESSION_SETTINGS
 
 # Determine the base directory dynamically
 if getattr(sys, 'frozen', False):  # Running as a PyInstaller bundle
@@ -42,15 +44,18 @@ app.config['MAX_CONTENT_LENGTH'] = MAX_CONTENT_LENGTH
 os.makedirs(UPLOAD_FOLDER, exist_ok=True)
 os.makedirs(os.path.join(static_dir, 'js'), exist_ok=True)
 
-# Store current automation status and resume path
-automation_status = {
+# Status reported before any session was started
+IDLE_STATUS = {
     "status": "idle",
     "message": "",
     "jobs_processed": 0,
     "applications_submitted": 0
 }
+# Last uploaded resume, used by sessions started without a resume_path
 current_resume_path = None
+# Each account's history file is derived from this path (see history_file_path)
 processed_jobs_file_path = "logs/processed_job_summary_list.json"
+session_manager = SessionManager()
 
 # ... after other globals
 latest_automation_config = {
@@ -80,12 +85,33 @@ def allowed_file(filename):
     """Check if uploaded file has allowed extension."""
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
 
-def status_callback(status):
-    """Callback function to update automation status."""
-    global automation_status
-    automation_status.update(status)
-    # Print status in a clean, readable format
-    log(f"[{status.get('status', '').upper()}] {status.get('message', '')}")
+def history_file_path(username):
+    """Return the processed job history path of an account."""
+    return processed_jobs_file_path.split('.json')[0] + get_gmail_name(username) + '.json'
+
+class SessionNotFound(Exception):
+    """Raised when a request names a session_id that is unknown or has expired."""
+
+@app.errorhandler(SessionNotFound)
+def session_not_found(e):
+    return jsonify({"error": "Session not found"}), 404
+
+def request_history_path():
+    """Return the history path for a dashboard request.
+
+    Uses the session given as `session_id` (query string or JSON body),
+    otherwise the latest session, otherwise the default history file. An
+    unknown `session_id` raises SessionNotFound (a 404) rather than showing
+    another session's history.
+    """
+    session_id = request.args.get('session_id') or (request.get_json(silent=True) or {}).get('session_id')
+    if session_id:
+        session = session_manager.get(session_id)
+        if session is None:
+            raise SessionNotFound(session_id)
+    else:
+        session = session_manager.latest()
+    return session.processed_jobs_file_path if session else processed_jobs_file_path
 
 @app.route('/')
 def index():
@@ -107,45 +133,37 @@ def update_job_processed_info():
 def update_processed_job(job_summary=None):
     if job_summary is None:
         return False
-    
-    processed_job_summary_list = get_job_processed_info()
-    found_index = find_job_summary_in_list(job_summary, processed_job_summary_list)
-
-    if found_index == -1:
-        return False
-    else:
-        processed_job_summary_list[found_index]['apply_status'] = True
-
-    with open(processed_jobs_file_path, "w") as file:
-        json.dump(processed_job_summary_list, file, indent=4)
-
-    return True
-
-def find_job_summary_in_list(job_summary, job_list):
-    for index, job in enumerate(job_list):
-        if (
-            job.get("card_title") == job_summary.get("card_title") and
-            job.get("company_name") == job_summary.get("company_name") and
-            job.get("location") == job_summary.get("location") and
-            job.get("employment_type") == job_summary.get("employment_type") and
-            job.get("card_summary") == job_summary.get("card_summary")
-        ):
-            return index
-    return -1
+    return open_store(request_history_path()).mark_applied(job_summary)
     
 @app.route('/api/getJobProcessedInfo', methods=['POST'])
 def get_job_processed_info():
-    os.makedirs(os.path.dirname(processed_jobs_file_path), exist_ok=True)
+    return open_store(request_history_path()).all()
 
-    if os.path.exists(processed_jobs_file_path):
-        with open(processed_jobs_file_path, "r") as file:
-            try:
-                processed_job_summary_list = json.load(file)
-            except json.JSONDecodeError:
-                processed_job_summary_list = []
-    else:
-        processed_job_summary_list = []
-    return processed_job_summary_list
+@app.route('/api/queryJobProcessedInfo', methods=['POST'])
+def query_job_processed_info():
+    """Return one filtered, sorted page of the processed job history."""
+    try:
+        job_query = JobQuery.from_params(request.get_json(silent=True) or {})
+    except InvalidQueryError as e:
+        return jsonify({"error": str(e)}), 400
+    return jsonify(open_store(request_history_path()).query(job_query))
+
+@app.route('/api/exportJobProcessedInfo')
+def export_job_processed_info():
+    """Stream the processed job history as CSV or NDJSON, with the dashboard filters."""
+    export_format = request.args.get('format', 'csv')
+    if export_format not in EXPORT_FORMATS:
+        return jsonify({"error": f"Unsupported export format: {export_format}"}), 400
+
+    iter_chunks, mimetype = EXPORT_FORMATS[export_format]
+    job_query = JobQuery.from_params(request.args, paginate=False)
+    jobs = open_store(request_history_path()).iter_jobs(job_query)
+    filename = f"processed_jobs_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{export_format}"
+    return Response(
+        stream_with_context(iter_chunks(jobs)),
+        mimetype=mimetype,
+        headers={"Content-Disposition": f"attachment; filename={filename}"}
+    )
 
 profile_list_file_path = 'uploads/profile_list.json'
 @app.route('/api/getProfileList', methods=['GET'])
@@ -187,13 +205,16 @@ def upload_file():
             # Save the file
             file.save(filepath)
             current_resume_path = filepath
+            # Sessions compare this hash with the resume their profile already holds
+            digest = resume_digest(filepath)
             
-            log(f"Resume saved at: {current_resume_path}")  # Debug print
+            log(f"Resume saved at: {current_resume_path} (sha256 {digest[:12]})")  # Debug print
             
             return jsonify({
                 "message": "File uploaded successfully",
                 "filename": filename,
-                "path": filepath
+                "path": filepath,
+                "sha256": digest
             })
         except Exception as e:
             log(f"Error saving file: {str(e)}", "ERROR", "❌")  # Debug print
@@ -201,129 +222,213 @@ def upload_file():
     
     return jsonify({"error": "Invalid file type"}), 400
 
-@app.route('/api/start', methods=['POST'])
-def start_automation():
-    """Start the automation process."""
-    global current_resume_path, processed_jobs_file_path, latest_automation_config
-    data = request.json
-    log(f"Received data: {data}")  # Debug print
+def start_session(data):
+    """Validate a start request and start an automation session.
 
+    Returns (session, None, 200) on success or (session or None, error, status code).
+    """
     # Validate input
     required_fields = ['username', 'password', 'keyword', 'location', 'max_applications']
-    if not all(field in data for field in required_fields):
-        return jsonify({"error": "Missing required fields"}), 400
+    if not data or not all(field in data for field in required_fields):
+        return None, "Missing required fields", 400
+
+    # Extract filters from request data
+    filters = {
+        'posted_date': data.get('filters', {}).get('posted_date', 'NO_PREFERENCE'),
+        'third_party': data.get('filters', {}).get('third_party', False),
+        'replace_resume': data.get('filters', {}).get('replace_resume', False),
+        'remote': True
+    }
+    log(f"Extracted filters: {filters}")  # Debug print
+
+    # Each session keeps the resume it was started with
+    resume_path = data.get('resume_path') or current_resume_path
+    if not resume_path or not os.path.exists(resume_path):
+        return None, "Please upload a resume first", 400
+    if os.path.commonpath([os.path.abspath(resume_path), os.path.abspath(UPLOAD_FOLDER)]) != os.path.abspath(UPLOAD_FOLDER):
+        return None, "Resume must be uploaded through /api/upload", 400
+    log(f"Session resume path: {resume_path}")  # Debug print
+
+    proxy_url = data.get('proxy', '')
+    # Initialize proxy and proxy_auth
+    proxy = None
+    proxy_auth = None
+
+    if proxy_url:
+        import re
+
+        # Regular expression to parse proxy URL
+        proxy_regex = r'^(?:([\w.-]+):([\w.-]+)@)?([\w.-]+|\d{1,3}(?:\.\d{1,3}){3}):(\d{1,5})$'
+
+        match = re.match(proxy_regex, proxy_url)
+
+        if match:
+            username, password, ip, port = match.groups()
+            proxy = f"{ip}:{port}"
+            if username and password:
+                proxy_auth = (username, password)
+        else:
+            return None, f"Invalid proxy URL format: {proxy_url}", 400
 
     try:
-        # Extract filters from request data
-        filters = {
-            'posted_date': data.get('filters', {}).get('posted_date', 'NO_PREFERENCE'),
-            'third_party': data.get('filters', {}).get('third_party', False),
-            'replace_resume': data.get('filters', {}).get('replace_resume', False),
-            'remote': True
-        }
-        
-        log(f"Current resume path: {current_resume_path}")  # Debug print
-        log(f"Extracted filters: {filters}")  # Debug print
-
-        if not current_resume_path or not os.path.exists(current_resume_path):
-            return jsonify({"error": "Please upload a resume first"}), 400
-        
-        proxy_url = data.get('proxy', '')
-        # Initialize proxy and proxy_auth
-        proxy = None
-        proxy_auth = None
-
-        if proxy_url:
-            import re
-
-            # Regular expression to parse proxy URL
-            proxy_regex = r'^(?:([\w.-]+):([\w.-]+)@)?([\w.-]+|\d{1,3}(?:\.\d{1,3}){3}):(\d{1,5})$'
-
-            match = re.match(proxy_regex, proxy_url)
-
-            if match:
-                username, password, ip, port = match.groups()
-                proxy = f"{ip}:{port}"
-                if username and password:
-                    proxy_auth = (username, password)
-            else:
-                raise ValueError(f"Invalid proxy URL format: {proxy_url}")
-        
-        # Setup WebDriver
-        driver, wait = setup_driver(proxy, proxy_auth)
-
-        # Create a DiceAutomation instance with filters
-        new_processed_jobs_file_path = processed_jobs_file_path.split('.json')[0] + get_gmail_name(data['username']) + '.json'
-
-        processed_jobs_file_path = new_processed_jobs_file_path
-    
-        automation = DiceAutomation(
-            driver=driver,
-            wait=wait,
-            username=data['username'],
-            password=data['password'],
-            keyword=data['keyword'],
-            location=data['location'],
-            max_applications=int(data['max_applications']),
-            filters=filters,
-            status_callback=status_callback,
-            processed_jobs_file_path=new_processed_jobs_file_path
+        session = session_manager.reserve(
+            data['username'],
+            resume_path,
+            history_file_path(data['username']),
+            settings={
+                "keyword": data['keyword'],
+                "location": data['location'],
+                "max_applications": int(data['max_applications']),
+                "proxy": proxy,
+                "filters": filters
+            }
         )
+    except SessionLimitError as e:
+        return None, str(e), 429
+
+    error = session_manager.start(
+        session,
+        username=data['username'],
+        password=data['password'],
+        keyword=data['keyword'],
+        location=data['location'],
+        max_applications=int(data['max_applications']),
+        filters=filters,
+        proxy=proxy,
+        proxy_auth=proxy_auth,
+        start_page=int(data.get('start_page') or 1),
+        harvest=not data.get('queue_only', False)
+    )
+    if error:
+        log(f"Error starting session {session.session_id}: {error}", "ERROR", "❌")  # Debug print
+        return session, error, 401 if "credentials" in error else 500
+
+    latest_automation_config["user"] = data.get("username")
+    latest_automation_config["keyword"] = data.get("keyword")
+    latest_automation_config["location"] = data.get("location")
+    latest_automation_config["proxy"] = data.get("proxy")
+    latest_automation_config["max_applications"] = data.get("max_applications")
+    latest_automation_config["filters"] = filters
+    return session, None, 200
 
-        # Update config with current resume path
-        from config import RESUME_SETTINGS
-        RESUME_SETTINGS['path'] = current_resume_path
-        log(f"Updated resume path in config: {RESUME_SETTINGS['path']}")  # Debug print
-        # Validate login
-        if not automation.login():
-            driver.quit()
-            return jsonify({"error": "Invalid credentials. Please check your username and password."}), 401
-
-        # Start the automation in a separate thread
-        def run_automation():
-            try:
-                log("Starting automation with filters:", filters)
-                log("Using resume path:", current_resume_path)
-                result = automation.run()
-                # Debug print
-                log("=" * 30)
-                log("Automation Result:")
-                log("=" * 30)
-                log(json.dumps(result, indent=4))
-                log("=" * 30)
-            except Exception as e:
-                log(f"Error in automation thread: {e}")  # Debug print
-            finally:
-                driver.quit()
-
-        automation_thread = threading.Thread(target=run_automation)
-        automation_thread.daemon = True
-        automation_thread.start()
-
-        # ... in /api/start, after extracting data and filters
-        latest_automation_config["user"] = data.get("username")
-        latest_automation_config["keyword"] = data.get("keyword")
-        latest_automation_config["location"] = data.get("location")
-        latest_automation_config["proxy"] = data.get("proxy")
-        latest_automation_config["max_applications"] = data.get("max_applications")
-        latest_automation_config["filters"] = filters
-
-        return jsonify({
-            "message": "Login successful. Automation started!",
-            "filters_applied": filters,
-            "resume_path": current_resume_path
-        }), 200
-
-    except Exception as e:
-        if 'driver' in locals():
-            driver.quit()
-        log(f"Error starting automation: {e}")  # Debug print
-        return jsonify({"error": str(e)}), 500
+@app.route('/api/start', methods=['POST'])
+def start_automation():
+    """Start the automation process."""
+    data = request.get_json(silent=True)
+    session, error, status_code = start_session(data)
+    if error:
+        return jsonify({"error": error}), status_code
+    return jsonify({
+        "message": "Login successful. Automation started!",
+        "session_id": session.session_id,
+        "filters_applied": session.settings["filters"],
+        "resume_path": session.resume_path
+    }), 200
+
+@app.route('/api/sessions', methods=['POST'])
+def create_session():
+    """Start a new automation session next to the ones already running."""
+    session, error, status_code = start_session(request.get_json(silent=True))
+    if error:
+        body = {"error": error}
+        if session:
+            body["session"] = session.summary()
+        return jsonify(body), status_code
+    return jsonify(session.summary()), 201
+
+@app.route('/api/sessions', methods=['GET'])
+def list_sessions():
+    """List all sessions of this server, running and finished."""
+    return jsonify({
+        "sessions": session_manager.list(),
+        "max_concurrent": session_manager.max_concurrent,
+        "network_by_proxy": session_manager.network_by_proxy()
+    })
+
+@app.route('/api/sessions/<session_id>', methods=['GET'])
+def get_session(session_id):
+    session = session_manager.get(session_id)
+    if session is None:
+        return jsonify({"error": "Session not found"}), 404
+    return jsonify(session.summary())
+
+@app.route('/api/sessions/<session_id>/stop', methods=['POST'])
+def stop_session(session_id):
+    if session_manager.get(session_id) is None:
+        return jsonify({"error": "Session not found"}), 404
+    if not session_manager.stop(session_id):
+        return jsonify({"error": "Session is not running"}), 409
+    return jsonify(session_manager.get(session_id).summary())
 
 @app.route('/api/status')
 def get_status():
-    """Return the current automation status."""
-    return jsonify(automation_status)
+    """Return the status of a session (?session_id=...), by default the latest one."""
+    session_id = request.args.get('session_id')
+    session = session_manager.get(session_id) if session_id else session_manager.latest()
+    if session is None:
+        return jsonify(IDLE_STATUS)
+    return jsonify(session.status)
+
+# Open status streams. Each holds a server thread, so they are capped below
+# UI_SETTINGS["threads"] to keep threads free for the other endpoints.
+STREAM_THREAD_HEADROOM = 4
+max_streams = max(1, min(SESSION_SETTINGS.get("max_streams", 8), UI_SETTINGS.get("threads", 16) - STREAM_THREAD_HEADROOM))
+open_streams = 0
+open_streams_lock = threading.Lock()
+
+def release_stream():
+    global open_streams
+    with open_streams_lock:
+        open_streams -= 1
+
+@app.route('/api/status/stream')
+def stream_status():
+    """Server-sent events with every status update of a session (?session_id=...), by default the latest one.
+
+    Each event carries the full status and its version as event ID. A client
+    that reconnects with Last-Event-ID (or ?last_event_id=) gets the updates
+    it missed. The stream ends with an "end" event once the session finishes.
+    Above `max_streams` open streams the request gets a 503.
+    """
+    session_id = request.args.get('session_id')
+    session = session_manager.get(session_id) if session_id else session_manager.latest()
+    try:
+        last_id = int(request.headers.get('Last-Event-ID') or request.args.get('last_event_id') or 0)
+    except ValueError:
+        last_id = 0
+    keepalive = SESSION_SETTINGS.get("stream_keepalive", 15)
+
+    global open_streams
+    with open_streams_lock:
+        if open_streams >= max_streams:
+            # Too many watchers: the page falls back to polling /api/status
+            return Response("retry: 10000\n\n", status=503, mimetype='text/event-stream', headers={'Retry-After': '10'})
+        open_streams += 1
+
+    def generate():
+        yield "retry: 2000\n\n"
+        if session is None:
+            # No session yet: send the idle status and let the client reconnect
+            yield f"event: status\ndata: {json.dumps(IDLE_STATUS)}\n\n"
+            return
+        stream = session.stream
+        current_id = last_id
+        while True:
+            for event_id, data in stream.events_since(current_id):
+                yield f"id: {event_id}\nevent: status\ndata: {data}\n\n"
+                current_id = event_id
+            if stream.closed and current_id >= stream.version:
+                yield "event: end\ndata: {}\n\n"
+                return
+            if not stream.wait(current_id, keepalive):
+                yield ": keep-alive\n\n"
+
+    response = Response(stream_with_context(generate()), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'
+    })
+    response.call_on_close(release_stream)
+    return response
 
 def is_port_in_use(port):
     """Check if a port is in use on any local interface."""
@@ -338,7 +443,7 @@ def is_port_in_use(port):
 
 def start_server(app, host, port):
     """Start the server in a separate thread."""
-    server_thread = Thread(target=serve, args=(app,), kwargs={'host': host, 'port': port})
+    server_thread = Thread(target=serve, args=(app,), kwargs={'host': host, 'port': port, 'threads': UI_SETTINGS.get('threads', 16)})
     server_thread.daemon = True  # Allow the thread to exit when the main program exits
     server_thread.start()
     return server_thread
@@ -377,6 +482,8 @@ def start_app():
 
         try:
             log(f"Attempting to start server on port {port}...")
+            # Launch a browser in the background so the first session starts quickly
+            session_manager.driver_pool.warm()
             server_thread = start_server(app, host='0.0.0.0', port=port)
             url = f"http://127.0.0.1:{port}"
             # Print pretty startup info
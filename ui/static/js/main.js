@@ -58,7 +58,7 @@ document.getElementById('automationForm').addEventListener('submit', async funct
         if (response.ok) {
             const result = await response.json();
             alert(result.message || "Automation started successfully!");
-            window.location.href = "/status";  // Redirect to status page upon success
+            window.location.href = "/status?session_id=" + encodeURIComponent(result.session_id);  // Redirect to this session's status page
         } else {
             const errorResult = await response.json();
             alert(errorResult.error || "Failed to start automation. Please check your input.");
@@ -3,13 +3,20 @@ document.addEventListener('DOMContentLoaded', function() {
     const jobsFoundElement = document.getElementById('jobs-found');
     const jobsProcessedElement = document.getElementById('jobs-processed');
     const applicationsSubmittedElement = document.getElementById('applications-submitted');
+    // The session started from the form; without it the latest session is shown
+    const sessionId = new URLSearchParams(window.location.search).get('session_id');
+    const query = sessionId ? `?session_id=${encodeURIComponent(sessionId)}` : '';
+    const statusUrl = `/api/status${query}`;
+    const streamUrl = `/api/status/stream${query}`;
 
     const statusColors = {
         'initializing': 'text-blue-600',
         'running': 'text-blue-600',
         'completed': 'text-green-600',
         'error': 'text-red-600',
-        'skipped': 'text-yellow-600'
+        'skipped': 'text-yellow-600',
+        'stopping': 'text-yellow-600',
+        'stopped': 'text-yellow-600'
     };
 
     function updateUI(data) {
@@ -30,13 +37,15 @@ document.addEventListener('DOMContentLoaded', function() {
             'running': 'Applying to jobs...',
             'completed': 'All applications completed!',
             'error': 'An error occurred',
-            'skipped': 'Skipped - Already applied'
+            'skipped': 'Skipped - Already applied',
+            'stopping': 'Stopping...',
+            'stopped': 'Automation stopped'
         };
         return messages[status] || status;
     }
 
     function pollStatus() {
-        fetch('/api/status')
+        fetch(statusUrl)
             .then(response => response.json())
             .then(data => {
                 updateUI(data);
@@ -48,5 +57,22 @@ document.addEventListener('DOMContentLoaded', function() {
             });
     }
 
-    pollStatus();
+    // Pushed updates; the browser reconnects with Last-Event-ID and gets what it missed
+    function watchStatus() {
+        const source = new EventSource(streamUrl);
+        source.addEventListener('status', event => updateUI(JSON.parse(event.data)));
+        source.addEventListener('end', () => source.close());
+        source.onerror = () => {
+            // Closed for good (e.g. 503 when too many streams are open): poll instead
+            if (source.readyState === EventSource.CLOSED) {
+                pollStatus();
+            }
+        };
+    }
+
+    if (window.EventSource) {
+        watchStatus();
+    } else {
+        pollStatus();
+    }
 });
\ No newline at end of file